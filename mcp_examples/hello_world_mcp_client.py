@@ -1,54 +1,536 @@
 import asyncio
+import collections
+import json
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AsyncExitStack
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import anyio
 import boto3
-from mcp import ClientSession, StdioServerParameters
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+
+# Upper bound on model <-> tool round trips for a single query
+MAX_TOOL_ITERATIONS = 10
+
+# Threads that run the blocking boto3 calls off the event loop
+BEDROCK_WORKERS = 4
+
+# Subprocesses per MCP server script: started up front, and at most in total
+POOL_PREWARM = int(os.getenv("MCP_POOL_PREWARM", "1"))
+POOL_SIZE = int(os.getenv("MCP_POOL_SIZE", str(min(4, os.cpu_count() or 1))))
+
+# Results of pure tools kept per server, least recently used evicted first
+TOOL_CACHE_SIZE = 256
+
+# Extra tools to treat as pure, for servers that don't annotate them
+# (comma-separated tool names, e.g. MCP_PURE_TOOLS=add,greet)
+PURE_TOOLS = {
+    name.strip() for name in os.getenv("MCP_PURE_TOOLS", "").split(",") if name.strip()
+}
+
+
+def is_pure_tool(tool: types.Tool) -> bool:
+    """Pure tools are configured so or annotated read-only, idempotent and closed-world"""
+    annotations = tool.annotations
+    return tool.name in PURE_TOOLS or bool(
+        annotations
+        and annotations.readOnlyHint
+        and annotations.idempotentHint
+        and annotations.openWorldHint is False
+    )
+
+
+class ToolCatalog:
+    """Bedrock toolConfig for an MCP server's tools, built once and reused
+
+    The catalog is fetched lazily and rebuilt only after the server sends a
+    tools/list_changed notification, so queries neither repeat the toolSpec
+    conversion nor use a stale tool list.
+    """
+
+    def __init__(self, server: "MCPServer"):
+        self.server = server
+        self.tools: List[types.Tool] = []
+        self.tool_config: Optional[Dict[str, Any]] = None
+        self.pure_tools: Set[str] = set()
+        self.lock = asyncio.Lock()
+        self.generation = 0
+
+    def invalidate(self):
+        self.generation += 1
+        self.tool_config = None
+
+    async def get_tool_config(self) -> Dict[str, Any]:
+        if self.tool_config is not None:
+            return self.tool_config
+
+        async with self.lock:
+            if self.tool_config is not None:
+                return self.tool_config
+
+            generation = self.generation
+            response = await self.server.list_tools()
+            tool_config = {
+                "tools": [
+                    {
+                        "toolSpec": {
+                            "name": tool.name,
+                            "description": tool.description or tool.name,
+                            "inputSchema": {"json": tool.inputSchema},
+                        }
+                    }
+                    for tool in response.tools
+                ]
+            }
+            self.tools = response.tools
+            self.pure_tools = {tool.name for tool in self.tools if is_pure_tool(tool)}
+            print("Tool catalog loaded:", [tool.name for tool in self.tools])
+
+            # Don't cache a list that changed again while it was being fetched
+            if generation == self.generation:
+                self.tool_config = tool_config
+            return tool_config
+
+
+class ToolResultCache:
+    """Bounded LRU of pure tool results that also coalesces identical calls
+
+    A call whose tool and arguments match one still in flight waits for that
+    call instead of sending another request. Failed calls are not cached.
+    """
+
+    def __init__(self, max_entries: int = TOOL_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.results: collections.OrderedDict = collections.OrderedDict()
+        self.in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.hits = collections.Counter()
+        self.coalesced = collections.Counter()
+        self.misses = collections.Counter()
+
+    async def call(self, tool_name: str, arguments: Dict[str, Any], call_tool):
+        key = (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+        if key in self.results:
+            self.results.move_to_end(key)
+            self.hits[tool_name] += 1
+            return self.results[key]
+
+        call = self.in_flight.get(key)
+        if call:
+            self.coalesced[tool_name] += 1
+        else:
+            self.misses[tool_name] += 1
+            call = asyncio.ensure_future(call_tool(tool_name, arguments))
+            self.in_flight[key] = call
+            call.add_done_callback(lambda done: self.store(key, done))
+
+        # A cancelled caller must not cancel the call others are waiting on
+        return await asyncio.shield(call)
+
+    def store(self, key: Tuple[str, str], call: asyncio.Future):
+        self.in_flight.pop(key, None)
+        if call.cancelled() or call.exception():
+            return
+        result = call.result()
+        if getattr(result, "isError", False):
+            return
+        self.results[key] = result
+        if len(self.results) > self.max_entries:
+            self.results.popitem(last=False)
+
+    def clear(self):
+        self.results.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool hits, coalesced calls, misses and hit rate"""
+        stats = {}
+        for tool_name in sorted(set(self.hits) | set(self.coalesced) | set(self.misses)):
+            saved = self.hits[tool_name] + self.coalesced[tool_name]
+            stats[tool_name] = {
+                "hits": self.hits[tool_name],
+                "coalesced": self.coalesced[tool_name],
+                "misses": self.misses[tool_name],
+                "hit_rate": saved / (saved + self.misses[tool_name]),
+            }
+        return stats
 
 
-class HelloWorldBedrockAgent:
+class MCPWorker:
+    """One stdio subprocess of an MCP server and its ClientSession
+
+    The connection lives in its own task: stdio_client and ClientSession are
+    entered and exited there, which lets workers start concurrently.
+    """
+
+    def __init__(self, server: "MCPServer", index: int):
+        self.server = server
+        self.index = index
+        self.session: Optional[ClientSession] = None
+        self.task: Optional[asyncio.Task] = None
+        self.closing = asyncio.Event()
+        self.started = False
+        self.healthy = False
+        self.in_flight = 0
+
+    async def run(self, ready: asyncio.Future):
+        """Connect, report readiness, then hold the connection until closed"""
+        server_params = StdioServerParameters(
+            command="python3", args=[self.server.script_path], env=os.environ.copy()
+        )
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(
+                    read, write, message_handler=self.server.handle_message
+                ) as session:
+                    await session.initialize()
+                    self.session = session
+                    self.started = self.healthy = True
+                    ready.set_result(self)
+                    await self.closing.wait()
+        except Exception as e:
+            # Report the underlying error rather than the task group wrapper
+            while isinstance(e, ExceptionGroup) and e.exceptions:
+                e = e.exceptions[0]
+            self.server.last_error = str(e)
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                print(f"MCP server {self.server.name} worker {self.index} died: {e}")
+        finally:
+            self.healthy = False
+            self.closing.set()
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
+        self.in_flight += 1
+        call = asyncio.ensure_future(self.session.call_tool(tool_name, arguments))
+        closed = asyncio.ensure_future(self.closing.wait())
+        try:
+            # A request written just as the subprocess died never gets an
+            # answer, so stop waiting once the connection is torn down
+            await asyncio.wait({call, closed}, return_when=asyncio.FIRST_COMPLETED)
+            if not call.done():
+                raise ConnectionError(f"Worker {self.index} of {self.server.name} closed")
+            return call.result()
+        except McpError as e:
+            if e.error.code == types.CONNECTION_CLOSED:
+                self.retire()
+            raise
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError, OSError):
+            self.retire()
+            raise
+        finally:
+            call.cancel()
+            closed.cancel()
+            self.in_flight -= 1
+
+    def retire(self):
+        """The subprocess went away: stop routing to it so the pool replaces it"""
+        self.healthy = False
+        self.closing.set()
+
+
+class MCPServer:
+    """A pool of stdio subprocesses for one MCP server script
+
+    POOL_PREWARM workers are started up front. Another is spawned, up to
+    POOL_SIZE, whenever every live worker is busy, and a worker that dies
+    after starting is replaced. Each call goes to the live worker with the
+    fewest calls in flight, so CPU-bound tools run on several cores.
+    """
+
+    def __init__(self, name: str, script_path: str, pool_size: int = POOL_SIZE):
+        self.name = name
+        self.script_path = script_path
+        self.pool_size = max(1, pool_size)
+        self.workers: List[MCPWorker] = []
+        self.spawned = 0
+        self.restarts = 0
+        self.closed = False
+        self.tool_catalog = ToolCatalog(self)
+        self.last_error: Optional[str] = None
+        self.calls = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.result_cache = ToolResultCache()
+
+    @property
+    def healthy(self) -> bool:
+        return any(worker.healthy for worker in self.workers)
+
+    async def start(self, prewarm: int = POOL_PREWARM) -> "MCPServer":
+        """Start the pre-warmed workers and load the tool catalog"""
+        ready = [self.spawn() for _ in range(min(max(1, prewarm), self.pool_size))]
+        results = await asyncio.gather(*ready, return_exceptions=True)
+        if not self.healthy:
+            raise next(
+                (result for result in results if isinstance(result, Exception)),
+                RuntimeError(f"MCP server {self.name} is not connected"),
+            )
+        await self.tool_catalog.get_tool_config()
+        return self
+
+    def spawn(self) -> asyncio.Future:
+        """Start one more worker; the future resolves once it is connected"""
+        worker = MCPWorker(self, self.spawned)
+        self.spawned += 1
+        ready = asyncio.get_running_loop().create_future()
+        worker.task = asyncio.create_task(worker.run(ready))
+        worker.task.add_done_callback(lambda _: self.worker_exited(worker))
+        self.workers.append(worker)
+        return ready
+
+    def spawn_in_background(self):
+        def report(ready: asyncio.Future):
+            if ready.exception():
+                print(f"Could not start a worker for {self.name}: {ready.exception()}")
+
+        self.spawn().add_done_callback(report)
+
+    def worker_exited(self, worker: MCPWorker):
+        self.workers.remove(worker)
+        # Workers that never started are not retried, to avoid a crash loop
+        if not self.closed and worker.started:
+            self.restarts += 1
+            print(f"Restarting worker for {self.name}")
+            self.spawn_in_background()
+
+    def pick_worker(self) -> MCPWorker:
+        """The live worker with the fewest calls in flight"""
+        live = [worker for worker in self.workers if worker.healthy]
+        if not live:
+            raise RuntimeError(f"MCP server {self.name} is not connected")
+
+        worker = min(live, key=lambda worker: worker.in_flight)
+        # Everyone is busy: grow the pool for the calls that come next
+        if worker.in_flight and len(self.workers) < self.pool_size:
+            self.spawn_in_background()
+        return worker
+
+    async def list_tools(self):
+        return await self.pick_worker().session.list_tools()
+
+    async def handle_message(self, message):
+        """Handle server notifications sent outside of a request"""
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            print(f"Tools changed on {self.name}; refreshing on next query")
+            self.tool_catalog.invalidate()
+            self.result_cache.clear()
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
+        """Call a tool, answering pure tools from the result cache when possible"""
+        if tool_name in self.tool_catalog.pure_tools:
+            return await self.result_cache.call(tool_name, arguments, self.send_call)
+        return await self.send_call(tool_name, arguments)
+
+    async def dispatch(self, tool_name: str, arguments: Dict[str, Any]):
+        """Send a call to a live worker, retrying once if that worker is dead"""
+        worker = self.pick_worker()
+        try:
+            return await worker.call_tool(tool_name, arguments)
+        except Exception:
+            # A worker that died while idle is only noticed when a call fails
+            # on it; retire() has marked it, so try another live worker
+            if worker.healthy or not self.healthy:
+                raise
+        print(f"Worker {worker.index} of {self.name} died; retrying {tool_name}")
+        return await self.pick_worker().call_tool(tool_name, arguments)
+
+    async def send_call(self, tool_name: str, arguments: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            result = await self.dispatch(tool_name, arguments)
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            raise
+        finally:
+            latency = time.perf_counter() - start
+            self.calls += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+        if getattr(result, "isError", False):
+            self.errors += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "server": self.name,
+            "healthy": self.healthy,
+            "tools": len(self.tool_catalog.tools),
+            "workers": sum(worker.healthy for worker in self.workers),
+            "restarts": self.restarts,
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_latency_ms": round(1000 * self.total_latency / self.calls, 1)
+            if self.calls
+            else 0.0,
+            "max_latency_ms": round(1000 * self.max_latency, 1),
+            "last_error": self.last_error,
+        }
+
+    async def close(self):
+        self.closed = True
+        for worker in self.workers:
+            worker.closing.set()
+        await asyncio.gather(
+            *[worker.task for worker in self.workers], return_exceptions=True
+        )
+
+
+class MCPMultiplexer:
+    """Routes tool calls across several MCP servers
+
+    Servers are started concurrently, so start-up takes as long as the
+    slowest one. Tool names that appear on more than one server are exposed
+    as "<server>__<tool>"; unique names are exposed unchanged.
+    """
+
     def __init__(self):
-        # Initialize session and client objects
-        self.session = None
-        self.exit_stack = AsyncExitStack()
-        self.model_id = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
-        self.bedrock_runtime = None
+        self.servers: Dict[str, MCPServer] = {}
+        self.routes: Dict[str, Tuple[MCPServer, str]] = {}
+        self.tool_config: Optional[Dict[str, Any]] = None
+        self.sources: Tuple = ()
+
+    async def connect(self, script_paths: List[str]) -> List[MCPServer]:
+        """Start every server at once and keep the ones that come up"""
+        if not all(script_path.endswith(".py") for script_path in script_paths):
+            raise ValueError("Server scripts must be Python files with .py extension")
+
+        starting = []
+        for script_path in script_paths:
+            name = re.sub(
+                r"[^a-zA-Z0-9_-]", "_", os.path.splitext(os.path.basename(script_path))[0]
+            )
+            if name in self.servers:
+                name = f"{name}_{len(self.servers)}"
 
-    async def connect_to_server(self, server_script_path: str):
-        """Connect to an MCP server"""
-        if not server_script_path.endswith(".py"):
-            raise ValueError("Server script must be a Python file with .py extension")
+            print(f"Starting the MCP server: {script_path}...")
+            server = MCPServer(name, script_path)
+            self.servers[name] = server
+            starting.append(server)
 
-        print(f"Starting the MCP server: {server_script_path}...")
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[server.start() for server in starting], return_exceptions=True
+        )
+        connected = []
+        for server, result in zip(starting, results):
+            if isinstance(result, Exception):
+                print(f"Could not connect to {server.name}: {result}")
+            else:
+                connected.append(server)
+        print(
+            f"Connected to {len(connected)}/{len(results)} MCP servers "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        if not connected:
+            raise RuntimeError("No MCP server could be started")
+        return connected
 
-        # Use environment variables for server process
-        env = os.environ.copy()
+    async def get_tool_config(self) -> Dict[str, Any]:
+        """Combined Bedrock toolConfig, rebuilt when any server's catalog changes"""
+        healthy = [server for server in self.servers.values() if server.healthy]
 
-        # Start the server as a subprocess
-        server_params = StdioServerParameters(
-            command="python3", args=[server_script_path], env=env
+        # A catalog's generation moves on whenever its tools change
+        sources = tuple((server.name, server.tool_catalog.generation) for server in healthy)
+        if self.tool_config is not None and sources == self.sources:
+            return self.tool_config
+
+        configs = await asyncio.gather(
+            *[server.tool_catalog.get_tool_config() for server in healthy]
         )
 
-        stdio_transport = await self.exit_stack.enter_async_context(
-            stdio_client(server_params)
+        owners = collections.Counter(
+            spec["toolSpec"]["name"] for config in configs for spec in config["tools"]
         )
-        self.stdio, self.write = stdio_transport
-        self.session = await self.exit_stack.enter_async_context(
-            ClientSession(self.stdio, self.write)
+        routes = {}
+        tools = []
+        for server, config in zip(healthy, configs):
+            for spec in config["tools"]:
+                tool_name = spec["toolSpec"]["name"]
+                routed_name = (
+                    f"{server.name}__{tool_name}" if owners[tool_name] > 1 else tool_name
+                )
+                routes[routed_name] = (server, tool_name)
+                tools.append({"toolSpec": {**spec["toolSpec"], "name": routed_name}})
+
+        self.routes = routes
+        tool_config = {"tools": tools}
+        # Don't cache tools that changed again while they were being fetched
+        if sources == tuple(
+            (server.name, server.tool_catalog.generation) for server in healthy
+        ):
+            self.tool_config = tool_config
+            self.sources = sources
+        print("Tool routes:", {name: s.name for name, (s, _) in routes.items()})
+        return tool_config
+
+    def route(self, routed_name: str) -> Tuple[MCPServer, str]:
+        if routed_name not in self.routes:
+            raise ValueError(f"Unknown tool: {routed_name}")
+        return self.routes[routed_name]
+
+    async def call_tool(self, routed_name: str, arguments: Dict[str, Any]):
+        server, tool_name = self.route(routed_name)
+        return await server.call_tool(tool_name, arguments)
+
+    def print_stats(self):
+        print("\nMCP server stats:")
+        for server in self.servers.values():
+            stats = server.stats()
+            print(
+                f"  {stats['server']:30} "
+                f"{'up' if stats['healthy'] else 'DOWN':4} "
+                f"workers={stats['workers']}/{server.pool_size} "
+                f"restarts={stats['restarts']} "
+                f"tools={stats['tools']:<3} calls={stats['calls']:<5} "
+                f"errors={stats['errors']:<4} avg={stats['avg_latency_ms']}ms "
+                f"max={stats['max_latency_ms']}ms"
+                + (f" last_error={stats['last_error']}" if stats["last_error"] else "")
+            )
+            for tool_name, cache in server.result_cache.stats().items():
+                print(
+                    f"    cache {tool_name:24} hit_rate={cache['hit_rate']:.0%} "
+                    f"hits={cache['hits']} coalesced={cache['coalesced']} "
+                    f"misses={cache['misses']}"
+                )
+
+    async def close(self):
+        await asyncio.gather(
+            *[server.close() for server in self.servers.values()],
+            return_exceptions=True,
         )
 
-        # Initialize the session
-        await self.session.initialize()
 
-        # List available tools
-        response = await self.session.list_tools()
-        print(
-            "\nConnected to server with tools:", [tool.name for tool in response.tools]
+class HelloWorldBedrockAgent:
+    def __init__(self):
+        # Initialize session and client objects
+        self.multiplexer = MCPMultiplexer()
+        self.exit_stack = AsyncExitStack()
+        self.model_id = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+        self.bedrock_runtime = None
+        self.bedrock_executor = ThreadPoolExecutor(
+            max_workers=BEDROCK_WORKERS, thread_name_prefix="bedrock"
         )
-        return response.tools
+
+    async def connect_to_servers(self, server_script_paths: List[str]):
+        """Connect to every MCP server concurrently and load their tools"""
+        await self.multiplexer.connect(server_script_paths)
+        self.exit_stack.push_async_callback(self.multiplexer.close)
+
+        # Build the routing table and the combined tool catalog
+        await self.multiplexer.get_tool_config()
+        print("\nConnected to servers with tools:", list(self.multiplexer.routes))
+        return list(self.multiplexer.routes)
 
     async def initialize_bedrock(self):
         """Initialize the Amazon Bedrock client"""
@@ -66,6 +548,78 @@ class HelloWorldBedrockAgent:
             )
             return False
 
+    async def converse(self, **request):
+        """Stream a Bedrock converse call without blocking the event loop
+
+        converse_stream is read on the Bedrock thread pool and its events are
+        handed to the event loop, so the MCP session keeps handling messages
+        while the model runs. Text deltas are printed as they arrive.
+
+        Returns the assistant message, the stop reason and the seconds until
+        the first token.
+        """
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def read_stream():
+            try:
+                response = self.bedrock_runtime.converse_stream(**request)
+                for event in response["stream"]:
+                    loop.call_soon_threadsafe(events.put_nowait, event)
+            except Exception as e:
+                loop.call_soon_threadsafe(events.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(events.put_nowait, None)
+
+        start = time.perf_counter()
+        reader = loop.run_in_executor(self.bedrock_executor, read_stream)
+
+        content = []
+        block = None
+        stop_reason = None
+        first_token = None
+        printed = False
+
+        while (event := await events.get()) is not None:
+            if isinstance(event, Exception):
+                await reader
+                raise event
+
+            if "contentBlockStart" in event:
+                tool_use = event["contentBlockStart"]["start"].get("toolUse")
+                if tool_use:
+                    block = {"toolUse": {**tool_use, "input": ""}}
+
+            elif "contentBlockDelta" in event:
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                delta = event["contentBlockDelta"]["delta"]
+                if "text" in delta:
+                    block = block or {"text": ""}
+                    block["text"] += delta["text"]
+                    print(delta["text"], end="", flush=True)
+                    printed = True
+                elif "toolUse" in delta and block:
+                    block["toolUse"]["input"] += delta["toolUse"].get("input", "")
+
+            elif "contentBlockStop" in event and block:
+                # Tool input arrives as JSON text fragments
+                if "toolUse" in block:
+                    block["toolUse"]["input"] = json.loads(
+                        block["toolUse"]["input"] or "{}"
+                    )
+                content.append(block)
+                block = None
+
+            elif "messageStop" in event:
+                stop_reason = event["messageStop"]["stopReason"]
+
+        await reader
+        if printed:
+            print()
+
+        return {"role": "assistant", "content": content}, stop_reason, first_token
+
     def extract_tool_result(self, tool_result):
         """Extract content from a CallToolResult object or other result types"""
         try:
@@ -99,23 +653,43 @@ class HelloWorldBedrockAgent:
             print(f"Error extracting tool result: {e}")
             return str(tool_result)
 
-    async def process_query(self, query: str, available_tools: List[Any]):
+    async def run_tool(self, tool_use, tool_results):
+        """Call one tool through MCP and return its Bedrock toolResult block"""
+        tool_name = tool_use["name"]
+        try:
+            # Dispatch the call to the server that owns the tool
+            server, tool_name = self.multiplexer.route(tool_use["name"])
+            raw_tool_result = await server.call_tool(tool_name, tool_use["input"])
+        except Exception as e:
+            print(f"Tool {tool_name} failed: {e}")
+            return {
+                "toolResult": {
+                    "toolUseId": tool_use["toolUseId"],
+                    "content": [{"text": f"Error: {e}"}],
+                    "status": "error",
+                }
+            }
+
+        # Extract the actual content from the tool result
+        extracted_result = self.extract_tool_result(raw_tool_result)
+        print(f"Extracted result from {tool_name}: {extracted_result}")
+
+        # Save the result for later display
+        tool_results.append((tool_name, extracted_result))
+
+        tool_result = {
+            "toolUseId": tool_use["toolUseId"],
+            "content": [{"json": {"result": extracted_result}}],
+        }
+        if getattr(raw_tool_result, "isError", False):
+            tool_result["status"] = "error"
+        return {"toolResult": tool_result}
+
+    async def process_query(self, query: str):
         """Process a user query using Bedrock and the MCP tools"""
         if not self.bedrock_runtime:
             return "Bedrock client not initialized"
 
-        # Format tools for Bedrock
-        tool_list = [
-            {
-                "toolSpec": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": {"json": tool.inputSchema},
-                }
-            }
-            for tool in available_tools
-        ]
-
         # Create the system message
         system_prompt = """You are a helpful assistant with access to calculator and greeting tools. 
 When asked about calculations, use the calculator tools like add, subtract, multiply, and divide.
@@ -128,88 +702,71 @@ Respond in a friendly and helpful manner. Keep your answers brief but informativ
         messages = [{"role": "user", "content": [{"text": query}]}]
 
         try:
-            # Call Amazon Bedrock with the user query - exactly like in nova_act_mcp_client.py
-            print("Sending query to Bedrock...")
-            response = self.bedrock_runtime.converse(
-                modelId=self.model_id,
-                messages=messages,
-                inferenceConfig={"temperature": 0.7},
-                toolConfig={"tools": tool_list},
-                system=[{"text": system_prompt}],
-            )
-
-            # Extract the assistant's response - exactly like in nova_act_mcp_client.py
-            response_message = response["output"]["message"]
             final_responses = []
-            tool_results = {}
-
-            # Process each content block in the response - exactly like in nova_act_mcp_client.py
-            for content_block in response_message["content"]:
-                if "text" in content_block:
-                    # Add text responses to our final output
-                    final_responses.append(content_block["text"])
-
-                elif "toolUse" in content_block:
-                    # Handle tool usage
-                    tool_use = content_block["toolUse"]
-                    tool_name = tool_use["name"]
-                    tool_input = tool_use["input"]
-                    tool_use_id = tool_use["toolUseId"]
-
-                    print(f"Calling tool: {tool_name} with input: {tool_input}")
-                    final_responses.append(f"[Calling tool {tool_name}]")
-
-                    # Call the tool through MCP session
-                    raw_tool_result = await self.session.call_tool(
-                        tool_name, tool_input
-                    )
-
-                    # Extract the actual content from the tool result
-                    extracted_result = self.extract_tool_result(raw_tool_result)
-                    print(f"Raw tool result type: {type(raw_tool_result)}")
-                    print(f"Extracted result: {extracted_result}")
-
-                    # Save the result for later display
-                    tool_results[tool_name] = extracted_result
-
-                    # Create follow-up message with tool result
-                    tool_result_message = {
-                        "role": "user",
-                        "content": [
-                            {
-                                "toolResult": {
-                                    "toolUseId": tool_use_id,
-                                    "content": [{"json": {"result": extracted_result}}],
-                                }
-                            }
-                        ],
-                    }
+            tool_results = []
+            query_start = time.perf_counter()
+            first_token = None
+
+            # Keep going until the model stops asking for tools
+            for iteration in range(MAX_TOOL_ITERATIONS):
+                print(
+                    "Sending query to Bedrock..."
+                    if iteration == 0
+                    else f"Sending tool results to Bedrock (round {iteration + 1})..."
+                )
+                response_message, stop_reason, call_first_token = await self.converse(
+                    modelId=self.model_id,
+                    messages=messages,
+                    inferenceConfig={"temperature": 0.7},
+                    # Cached toolSpecs; refreshed if a server's tools change
+                    toolConfig=await self.multiplexer.get_tool_config(),
+                    system=[{"text": system_prompt}],
+                )
+                if first_token is None:
+                    first_token = call_first_token
+                messages.append(response_message)
+                tool_uses = []
+
+                # Process each content block in the response - exactly like in nova_act_mcp_client.py
+                for content_block in response_message["content"]:
+                    if "text" in content_block:
+                        # Add text responses to our final output
+                        final_responses.append(content_block["text"])
+
+                    elif "toolUse" in content_block:
+                        tool_use = content_block["toolUse"]
+                        print(
+                            f"Calling tool: {tool_use['name']} with input: {tool_use['input']}"
+                        )
+                        final_responses.append(f"[Calling tool {tool_use['name']}]")
+                        tool_uses.append(tool_use)
+
+                if stop_reason != "tool_use" or not tool_uses:
+                    break
 
-                    # Add the AI message and tool result to messages
-                    messages.append(response_message)
-                    messages.append(tool_result_message)
-
-                    # Make another call to get the final response
-                    follow_up_response = self.bedrock_runtime.converse(
-                        modelId=self.model_id,
-                        messages=messages,
-                        inferenceConfig={"temperature": 0.7},
-                        toolConfig={"tools": tool_list},
-                        system=[{"text": system_prompt}],
-                    )
+                # Run every tool call from this turn concurrently and send all
+                # results back in one message
+                tool_result_blocks = await asyncio.gather(
+                    *[self.run_tool(tool_use, tool_results) for tool_use in tool_uses]
+                )
+                messages.append({"role": "user", "content": tool_result_blocks})
+            else:
+                final_responses.append(
+                    f"[Stopped after {MAX_TOOL_ITERATIONS} rounds of tool calls]"
+                )
 
-                    # Add the follow-up response to our final output
-                    follow_up_text = follow_up_response["output"]["message"]["content"][
-                        0
-                    ]["text"]
-                    final_responses.append(follow_up_text)
+            print(
+                f"Latency: first token {first_token or 0:.2f}s, "
+                f"total {time.perf_counter() - query_start:.2f}s "
+                f"({iteration + 1} model calls)"
+            )
 
             # Compose the final response with explicit tool results
             final_text = "\n".join(final_responses)
 
             # If we have tool results but they're not obviously included in the response,
             # add them explicitly
-            for tool_name, result in tool_results.items():
+            for tool_name, result in tool_results:
                 if tool_name == "tell_joke" and result not in final_text:
                     final_text += f"\n\nJoke: {result}"
                 elif tool_name == "greet" and result not in final_text:
@@ -229,9 +786,12 @@ Respond in a friendly and helpful manner. Keep your answers brief but informativ
             traceback.print_exc()
             return f"Error: {str(e)}"
 
-    async def chat_loop(self, available_tools: List[Any]):
+    async def chat_loop(self):
         """Run an interactive chat loop"""
-        print("\nYou can now chat with the agent. Type 'exit' to quit.")
+        print(
+            "\nYou can now chat with the agent. "
+            "Type 'stats' for MCP server stats or 'exit' to quit."
+        )
 
         while True:
             try:
@@ -239,9 +799,12 @@ Respond in a friendly and helpful manner. Keep your answers brief but informativ
                 user_query = input("\nYou: ")
                 if user_query.lower() in ["exit", "quit"]:
                     break
+                if user_query.lower() == "stats":
+                    self.multiplexer.print_stats()
+                    continue
 
                 # Process the query
-                response = await self.process_query(user_query, available_tools)
+                response = await self.process_query(user_query)
                 print("\nAssistant:", response)
 
             except Exception as e:
@@ -249,27 +812,32 @@ Respond in a friendly and helpful manner. Keep your answers brief but informativ
 
     async def cleanup(self):
         """Clean up resources"""
+        self.multiplexer.print_stats()
         await self.exit_stack.aclose()
+        self.bedrock_executor.shutdown(wait=False)
         print("\nShutting down and cleaning up resources...")
 
 
 async def main():
     if len(sys.argv) < 2:
-        print("Usage: python hello_world_mcp_client.py <path_to_server_script>")
+        print(
+            "Usage: python hello_world_mcp_client.py <path_to_server_script> "
+            "[<path_to_server_script> ...]"
+        )
         print("Example: python hello_world_mcp_client.py hello_world_mcp_server.py")
         sys.exit(1)
 
-    server_script_path = sys.argv[1]
+    server_script_paths = sys.argv[1:]
     agent = HelloWorldBedrockAgent()
 
     try:
-        # Connect to the MCP server and get available tools
-        available_tools = await agent.connect_to_server(server_script_path)
+        # Connect to the MCP servers and load their tool catalogs
+        await agent.connect_to_servers(server_script_paths)
 
         # Initialize the Bedrock client
         if await agent.initialize_bedrock():
             # Run the chat loop
-            await agent.chat_loop(available_tools)
+            await agent.chat_loop()
     except Exception as e:
         print(f"Error: {str(e)}")
     finally:
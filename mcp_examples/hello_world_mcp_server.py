@@ -1,11 +1,15 @@
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 
 # Initialize FastMCP server
 mcp = FastMCP("hello-world-server")
 
+# Tools whose result depends only on their arguments; clients may cache them
+PURE = ToolAnnotations(readOnlyHint=True, idempotentHint=True, openWorldHint=False)
+
 
 # Define tools
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 async def greet(name: str) -> str:
     """Greet a person with their name.
 
@@ -18,7 +22,7 @@ async def greet(name: str) -> str:
     return f"Hello, {name}! Welcome to MCP."
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 async def add(a: float, b: float) -> float:
     """Add two numbers together.
 
@@ -32,7 +36,7 @@ async def add(a: float, b: float) -> float:
     return a + b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 async def subtract(a: float, b: float) -> float:
     """Subtract the second number from the first.
 
@@ -46,7 +50,7 @@ async def subtract(a: float, b: float) -> float:
     return a - b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 async def multiply(a: float, b: float) -> float:
     """Multiply two numbers together.
 
@@ -60,7 +64,7 @@ async def multiply(a: float, b: float) -> float:
     return a * b
 
 
-@mcp.tool()
+@mcp.tool(annotations=PURE)
 async def divide(a: float, b: float) -> float:
     """Divide the first number by the second.
 
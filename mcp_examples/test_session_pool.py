@@ -0,0 +1,67 @@
+"""Tests for the MCP session pool in hello_world_mcp_client.py
+
+Starts hello_world_mcp_server.py as a pool of two stdio workers and kills
+one of the subprocesses while calls keep coming.
+
+Run with: python -m pytest test_session_pool.py
+"""
+
+import asyncio
+import os
+import signal
+
+import psutil
+
+import hello_world_mcp_client as client
+
+SERVER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "hello_world_mcp_server.py"
+)
+CALLS_PER_ROUND = 8
+ROUNDS = 5
+ROUND_TIMEOUT = 30
+
+
+async def call_round(server: client.MCPServer) -> int:
+    """Run one round of concurrent calls and return how many failed"""
+    # tell_joke isn't pure, so every call reaches a worker
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *[server.call_tool("tell_joke", {}) for _ in range(CALLS_PER_ROUND)],
+            return_exceptions=True,
+        ),
+        ROUND_TIMEOUT,
+    )
+    return sum(
+        isinstance(result, BaseException) or getattr(result, "isError", False)
+        for result in results
+    )
+
+
+def kill_one_worker():
+    workers = psutil.Process().children(recursive=True)
+    assert len(workers) >= 2, f"expected two worker processes, found {len(workers)}"
+    os.kill(workers[0].pid, signal.SIGKILL)
+    workers[0].wait(timeout=5)
+
+
+async def kill_worker_between_rounds():
+    server = client.MCPServer("hello_world", SERVER_SCRIPT, pool_size=2)
+    await server.start(prewarm=2)
+    try:
+        assert await call_round(server) == 0, "calls failed before any worker died"
+
+        # Calls that land on the dead worker are retried on the live one
+        kill_one_worker()
+        for _ in range(ROUNDS):
+            assert await call_round(server) == 0
+            await asyncio.sleep(0.5)
+
+        assert server.restarts >= 1, "the killed worker was never replaced"
+        assert server.stats()["workers"] == 2
+    finally:
+        await server.close()
+
+
+def test_killed_worker_is_retried_and_replaced():
+    asyncio.run(kill_worker_between_rounds())
@@ -12,6 +12,7 @@ import time
 
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.server import FastMCP
+from mcp.types import ToolAnnotations
 from strands import Agent
 from strands.models import BedrockModel
 from strands.tools.mcp.mcp_client import MCPClient
@@ -28,8 +29,11 @@ def start_calculator_server():
     # Create an MCP server with a descriptive name
     mcp = FastMCP("Calculator Server")
 
+    # The calculator tools are pure, so clients may cache their results
+    pure = ToolAnnotations(readOnlyHint=True, idempotentHint=True, openWorldHint=False)
+
     # Define a simple addition tool
-    @mcp.tool(description="Add two numbers together")
+    @mcp.tool(description="Add two numbers together", annotations=pure)
     def add(x: int, y: int) -> int:
         """Add two numbers and return the result.
 
@@ -43,7 +47,7 @@ def start_calculator_server():
         return x + y
 
     # Define a subtraction tool
-    @mcp.tool(description="Subtract one number from another")
+    @mcp.tool(description="Subtract one number from another", annotations=pure)
     def subtract(x: int, y: int) -> int:
         """Subtract y from x and return the result.
 
@@ -57,7 +61,7 @@ def start_calculator_server():
         return x - y
 
     # Define a multiplication tool
-    @mcp.tool(description="Multiply two numbers together")
+    @mcp.tool(description="Multiply two numbers together", annotations=pure)
     def multiply(x: int, y: int) -> int:
         """Multiply two numbers and return the result.
 
@@ -71,7 +75,7 @@ def start_calculator_server():
         return x * y
 
     # Define a division tool
-    @mcp.tool(description="Divide one number by another")
+    @mcp.tool(description="Divide one number by another", annotations=pure)
     def divide(x: float, y: float) -> float:
         """Divide x by y and return the result.
 
@@ -0,0 +1,291 @@
+"""
+Throughput benchmark for the Nova Act MCP server
+
+Starts nova_act_mcp_server.py over MCP stdio with the fake NovaAct backend
+(fake_nova_act.py) and drives browser_session, browser_action and
+execute_parallel_browser_tasks at increasing concurrency. For each
+configuration it reports tasks/sec, p95 latency and the peak RSS of the
+server process tree.
+
+Usage:
+    python benchmark_nova_act_mcp.py --concurrency 1,2,4,8 --latency 0.2
+
+Compare peak RSS of isolated and lean parallel execution at 10 tasks:
+    python benchmark_nova_act_mcp.py --concurrency 10 --memory-mb 150 \
+        --scenarios execute_parallel_browser_tasks,execute_parallel_browser_tasks_lean
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+import psutil
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "nova_act_mcp_server.py"
+)
+FAKE_SITE = "https://shop.example.com"
+LEAN_WORKERS = 2
+ACTIONS = [
+    "Search for backpack",
+    "Click on the first result",
+    "Return the list of product names and prices",
+]
+
+
+class RssSampler:
+    """Samples the summed RSS of this process's children in a background thread"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self.running = False
+        self.thread = None
+
+    def sample(self) -> int:
+        total = 0
+        for child in psutil.Process().children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    def run(self):
+        while self.running:
+            self.peak = max(self.peak, self.sample())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.peak = self.sample()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.running = False
+        self.thread.join()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def tool_payload(result) -> Any:
+    """Decode the JSON payload of a CallToolResult"""
+    structured = getattr(result, "structuredContent", None)
+    if structured is not None:
+        return structured.get("result", structured)
+    items = [json.loads(c.text) for c in result.content if hasattr(c, "text")]
+    return items[0] if len(items) == 1 else items
+
+
+async def timed_call(session: ClientSession, name: str, args: Dict[str, Any]):
+    start = time.perf_counter()
+    result = await session.call_tool(name, args)
+    return time.perf_counter() - start, result
+
+
+async def bench_browser_session(session, concurrency, args):
+    """Concurrent browser_session calls; one task = one session"""
+    latencies, errors = [], 0
+    call_args = {"starting_page": FAKE_SITE, "actions": ACTIONS, "headless": True}
+    for _ in range(args.rounds):
+        calls = await asyncio.gather(
+            *[
+                timed_call(session, "browser_session", call_args)
+                for _ in range(concurrency)
+            ]
+        )
+        for latency, result in calls:
+            latencies.append(latency)
+            if result.isError or "error" in tool_payload(result):
+                errors += 1
+    return latencies, errors
+
+
+async def bench_browser_action(session, concurrency, args):
+    """Concurrent browser_action calls against one live session"""
+    # browser_action needs an open browser, so keep a long session running
+    keeper_actions = ["Scroll down"] * (concurrency * args.rounds + 20)
+    keeper = asyncio.ensure_future(
+        session.call_tool(
+            "browser_session",
+            {"starting_page": FAKE_SITE, "actions": keeper_actions, "headless": True},
+        )
+    )
+    try:
+        while True:
+            _, probe = await timed_call(session, "browser_action", {"action": "Scroll"})
+            if not probe.isError:
+                break
+            await asyncio.sleep(0.05)
+
+        latencies, errors = [], 0
+        for _ in range(args.rounds):
+            calls = await asyncio.gather(
+                *[
+                    timed_call(
+                        session,
+                        "browser_action",
+                        {"action": "Return the list of product names and prices"},
+                    )
+                    for _ in range(concurrency)
+                ]
+            )
+            for latency, result in calls:
+                latencies.append(latency)
+                errors += 1 if result.isError else 0
+        return latencies, errors
+    finally:
+        await session.call_tool("close_browser", {})
+        await keeper
+
+
+async def bench_parallel_tasks(session, concurrency, args, mode="isolated"):
+    """One execute_parallel_browser_tasks call with `concurrency` tasks per round"""
+    latencies, errors = [], 0
+    tasks = [
+        {
+            "starting_page": f"https://shop{i}.example.com",
+            "actions": ACTIONS,
+            "headless": True,
+        }
+        for i in range(concurrency)
+    ]
+    for _ in range(args.rounds):
+        _, result = await timed_call(
+            session,
+            "execute_parallel_browser_tasks",
+            {
+                "browser_tasks": tasks,
+                "max_concurrency": concurrency,
+                "execution_mode": mode,
+                "lean_workers": args.lean_workers,
+            },
+        )
+        payload = tool_payload(result)
+        if not isinstance(payload, list):
+            payload = [payload]
+        for task_result in payload:
+            scheduling = task_result.get("scheduling", {})
+            latencies.append(scheduling.get("total_seconds", 0.0))
+            errors += 1 if "error" in task_result else 0
+    return latencies, errors
+
+
+async def bench_parallel_tasks_lean(session, concurrency, args):
+    """Same as bench_parallel_tasks, using the lean shared-browser workers"""
+    return await bench_parallel_tasks(session, concurrency, args, mode="lean")
+
+
+SCENARIOS = {
+    "browser_session": bench_browser_session,
+    "browser_action": bench_browser_action,
+    "execute_parallel_browser_tasks": bench_parallel_tasks,
+    "execute_parallel_browser_tasks_lean": bench_parallel_tasks_lean,
+}
+
+
+async def run_benchmark(args) -> List[Dict[str, Any]]:
+    env = os.environ.copy()
+    env.update(
+        {
+            "NOVA_ACT_BACKEND": "fake",
+            "FAKE_NOVA_ACT_LATENCY": str(args.latency),
+            "FAKE_NOVA_ACT_FAILURE_RATE": str(args.failure_rate),
+            "FAKE_NOVA_ACT_MEMORY_MB": str(args.memory_mb),
+        }
+    )
+    server_params = StdioServerParameters(
+        command=sys.executable, args=[SERVER_SCRIPT], env=env
+    )
+
+    # Keep the server's per-request logging out of the report unless asked for
+    errlog = sys.stderr if args.server_logs else open(os.devnull, "w")
+
+    rows = []
+    async with stdio_client(server_params, errlog=errlog) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+
+            for scenario in args.scenarios:
+                for concurrency in args.concurrency:
+                    with RssSampler() as sampler:
+                        start = time.perf_counter()
+                        latencies, errors = await SCENARIOS[scenario](
+                            session, concurrency, args
+                        )
+                        elapsed = time.perf_counter() - start
+
+                    row = {
+                        "scenario": scenario,
+                        "concurrency": concurrency,
+                        "tasks": len(latencies),
+                        "errors": errors,
+                        "tasks_per_sec": round(len(latencies) / elapsed, 2),
+                        "p50_latency_s": round(percentile(latencies, 50), 3),
+                        "p95_latency_s": round(percentile(latencies, 95), 3),
+                        "peak_rss_mb": round(sampler.peak / (1024 * 1024), 1),
+                    }
+                    rows.append(row)
+                    print(
+                        f"{scenario:36} c={concurrency:<3} "
+                        f"{row['tasks_per_sec']:>8.2f} tasks/s  "
+                        f"p95={row['p95_latency_s']:>7.3f}s  "
+                        f"rss={row['peak_rss_mb']:>8.1f}MB  errors={errors}"
+                    )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--concurrency",
+        type=lambda v: [int(x) for x in v.split(",")],
+        default=[1, 2, 4, 8],
+        help="Comma-separated concurrency levels (default: 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda v: v.split(","),
+        default=list(SCENARIOS),
+        help="Comma-separated subset of: " + ", ".join(SCENARIOS),
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--memory-mb", type=int, default=0)
+    parser.add_argument("--lean-workers", type=int, default=LEAN_WORKERS)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument(
+        "--server-logs", action="store_true", help="Show the server's stderr output"
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    rows = asyncio.run(run_benchmark(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
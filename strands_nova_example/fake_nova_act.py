@@ -0,0 +1,347 @@
+"""
+Fake NovaAct backend for load testing
+
+A drop-in stand-in for nova_act.NovaAct that never talks to the Nova Act
+service. Pages are served from the local fixture site in fake_site/ over
+http.server, and act() simulates model latency, schema responses and failures.
+
+Select it in the MCP server with:
+    NOVA_ACT_BACKEND=fake python nova_act_mcp_server.py
+
+Tuning (environment variables):
+- FAKE_NOVA_ACT_LATENCY: mean seconds per act() call (default: 0.5)
+- FAKE_NOVA_ACT_FAILURE_RATE: probability that act() raises ActError (default: 0)
+- FAKE_NOVA_ACT_MEMORY_MB: memory held per open browser to mimic RSS (default: 0)
+- FAKE_NOVA_ACT_SITE_DIR: directory served as the fixture site
+"""
+
+import functools
+import os
+import random
+import re
+import struct
+import threading
+import time
+import urllib.request
+import zlib
+from datetime import datetime
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+SITE_DIR = os.getenv(
+    "FAKE_NOVA_ACT_SITE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_site"),
+)
+
+fixture_server = None
+fixture_server_lock = threading.Lock()
+
+
+class ActError(Exception):
+    """Raised when a simulated act() call fails"""
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Serve fixture files without logging every request to stderr"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def ensure_fixture_server() -> str:
+    """Start the fixture site server once per process and return its base URL"""
+    global fixture_server
+
+    with fixture_server_lock:
+        if fixture_server is None:
+            handler = functools.partial(QuietHandler, directory=SITE_DIR)
+            fixture_server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            threading.Thread(target=fixture_server.serve_forever, daemon=True).start()
+        host, port = fixture_server.server_address
+        return f"http://{host}:{port}"
+
+
+def env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def blank_png(width: int, height: int) -> bytes:
+    """Build a plain grey PNG without needing Pillow"""
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\x00" + b"\xcc" * (width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    def screenshot(self, **kwargs) -> bytes:
+        return blank_png(320, 120)
+
+
+class FakeCdpSession:
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> dict:
+        return {}
+
+    def detach(self) -> None:
+        pass
+
+
+class FakeFrame:
+    def __init__(self, url: str):
+        self.url = url
+
+
+class FakeContext:
+    """Browser context stand-in that only keeps cookies in memory"""
+
+    def __init__(self):
+        self.cookies = []
+        self.init_scripts = []
+        self.pages = []
+
+    def clear_cookies(self) -> None:
+        self.cookies = []
+
+    def add_cookies(self, cookies) -> None:
+        self.cookies.extend(cookies)
+
+    def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
+
+    def storage_state(self, **kwargs) -> Dict[str, Any]:
+        return {"cookies": list(self.cookies), "origins": []}
+
+    def new_cdp_session(self, page) -> FakeCdpSession:
+        return FakeCdpSession()
+
+    def route(self, pattern, handler) -> None:
+        pass
+
+    def unroute(self, pattern, handler=None) -> None:
+        pass
+
+    def on(self, event, handler) -> None:
+        pass
+
+    def remove_listener(self, event, handler) -> None:
+        pass
+
+
+class FakePage:
+    """The subset of the Playwright page API the MCP server uses"""
+
+    def __init__(self, url: str, fixture_url: str):
+        self.url = url
+        self.fixture_url = fixture_url
+        self.context = FakeContext()
+        self.context.pages.append(self)
+        self.html = ""
+        self.bytes_loaded = 0
+        self.listeners = {}
+
+    @property
+    def frames(self) -> List[FakeFrame]:
+        return [FakeFrame(self.url)]
+
+    def load(self, path: str = "index.html") -> None:
+        with urllib.request.urlopen(f"{self.fixture_url}/{path}") as response:
+            body = response.read()
+        self.bytes_loaded += len(body)
+        self.html = body.decode("utf-8")
+
+    def goto(self, url: str, **kwargs) -> None:
+        self.url = url
+        self.load()
+        for handler in self.listeners.get("framenavigated", []):
+            handler(FakeFrame(url))
+
+    def on(self, event, handler) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    def close(self) -> None:
+        self.context.pages.remove(self)
+
+    def reload(self, **kwargs) -> None:
+        self.load()
+
+    def content(self) -> str:
+        return self.html
+
+    def evaluate(self, expression: str, arg=None) -> Any:
+        return None
+
+    def screenshot(self, full_page: bool = False, **kwargs) -> bytes:
+        return blank_png(1280, 2400 if full_page else 720)
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self)
+
+    def route(self, pattern, handler) -> None:
+        pass
+
+    def unroute(self, pattern, handler=None) -> None:
+        pass
+
+
+class FakeMetadata:
+    def __init__(self, prompt: str, num_steps: int, start_time: float, end_time: float):
+        self.prompt = prompt
+        self.num_steps_executed = num_steps
+        self.start_time = datetime.fromtimestamp(start_time)
+        self.end_time = datetime.fromtimestamp(end_time)
+
+
+class FakeActResult:
+    def __init__(self, response, parsed_response, valid_json, matches_schema, metadata):
+        self.response = response
+        self.parsed_response = parsed_response
+        self.valid_json = valid_json
+        self.matches_schema = matches_schema
+        self.metadata = metadata
+
+
+class NovaAct:
+    """Simulated NovaAct session backed by the local fixture site"""
+
+    def __init__(
+        self,
+        starting_page: str,
+        headless: bool = False,
+        user_data_dir: Optional[str] = None,
+        **kwargs,
+    ):
+        self.starting_page = starting_page
+        self.headless = headless
+        self.user_data_dir = user_data_dir
+        self.latency = env_float("FAKE_NOVA_ACT_LATENCY", 0.5)
+        self.failure_rate = env_float("FAKE_NOVA_ACT_FAILURE_RATE", 0.0)
+        self.memory_mb = int(env_float("FAKE_NOVA_ACT_MEMORY_MB", 0))
+        self.page = None
+        self.ballast = None
+        self.started = False
+
+    def start(self) -> None:
+        # Touch every page of the ballast so it really counts towards RSS
+        if self.memory_mb:
+            self.ballast = bytearray(b"\x01" * (self.memory_mb * 1024 * 1024))
+        self.page = FakePage(self.starting_page, ensure_fixture_server())
+        self.page.load()
+        self.started = True
+
+    def stop(self) -> None:
+        self.ballast = None
+        self.started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def act(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        max_steps: Optional[int] = None,
+        **kwargs,
+    ) -> FakeActResult:
+        if not self.started:
+            raise ActError("NovaAct session has not been started")
+
+        start_time = time.time()
+        num_steps = random.randint(1, max_steps or 5)
+        time.sleep(random.uniform(0.5, 1.5) * self.latency)
+
+        if random.random() < self.failure_rate:
+            raise ActError(f"Simulated failure for: {prompt}")
+
+        # Login prompts leave a session cookie behind, like a real sign-in
+        if re.search(r"log ?in|sign ?in", prompt, re.IGNORECASE):
+            self.page.context.add_cookies(
+                [{"name": "session", "value": "fake-session", "url": self.page.url}]
+            )
+
+        # Listing and extraction prompts "navigate" to the product page
+        if re.search(r"search|product|list|price|result", prompt, re.IGNORECASE):
+            self.page.load("products.html")
+
+        if schema:
+            parsed = fake_value(schema, schema, parse_products(self.page.html), 0, "")
+            response = str(parsed)
+        else:
+            parsed = None
+            response = f"Done: {prompt}"
+
+        return FakeActResult(
+            response=response,
+            parsed_response=parsed,
+            valid_json=schema is not None,
+            matches_schema=schema is not None,
+            metadata=FakeMetadata(prompt, num_steps, start_time, time.time()),
+        )
+
+
+def parse_products(html: str) -> list:
+    """Extract (name, price, rating) rows from the fixture product page"""
+    return re.findall(
+        r'class="name">([^<]+)</span>\s*<span class="price">\$([\d.]+)</span>'
+        r'\s*<span class="rating">([\d.]+)</span>',
+        html,
+    )
+
+
+def fake_value(schema: Dict[str, Any], root: Dict[str, Any], products, index, key):
+    """Generate a value matching a JSON schema from fixture product data"""
+    if "$ref" in schema:
+        name = schema["$ref"].split("/")[-1]
+        schema = root.get("$defs", root.get("definitions", {})).get(name, {})
+    if "anyOf" in schema:
+        options = [s for s in schema["anyOf"] if s.get("type") != "null"]
+        schema = options[0] if options else {"type": "null"}
+
+    product = products[index % len(products)] if products else ("Item", "9.99", "4.0")
+    kind = schema.get("type", "string")
+    key = key.lower()
+
+    if kind == "array":
+        count = min(len(products) or 1, 3)
+        return [
+            fake_value(schema.get("items", {}), root, products, i, key)
+            for i in range(count)
+        ]
+    if kind == "object":
+        return {
+            name: fake_value(prop, root, products, index, name)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind in ("number", "integer"):
+        value = float(product[2] if "rating" in key else product[1])
+        return int(value) if kind == "integer" else value
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    if "price" in key:
+        return f"${product[1]}"
+    if "url" in key:
+        return f"https://example.com/products/{index}"
+    if "date" in key:
+        return "2024-01-01"
+    return product[0]
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
 from mcp import StdioServerParameters, stdio_client
 from strands import Agent
 from strands.models import BedrockModel
@@ -29,7 +32,25 @@ SYSTEM_PROMPT = """
 You are an expert AWS Certified Solutions Architect. Your role is to help customers understand best practices on building on AWS. You can querying the AWS Documentation and generate diagrams. Make sure to tell the customer the full file path of the diagram.
 """
 
-with aws_diag_client, aws_docs_client:
+
+def start_clients(stack: ExitStack, *clients: MCPClient):
+    """Start MCP clients concurrently so start-up waits only for the slowest server"""
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        futures = [executor.submit(client.__enter__) for client in clients]
+
+    # Register every client that started before surfacing any failure
+    errors = []
+    for client, future in zip(clients, futures):
+        if future.exception():
+            errors.append(future.exception())
+        else:
+            stack.push(client.__exit__)
+    if errors:
+        raise errors[0]
+
+
+with ExitStack() as stack:
+    start_clients(stack, aws_diag_client, aws_docs_client)
     all_tools = aws_diag_client.list_tools_sync() + aws_docs_client.list_tools_sync()
     agent = Agent(tools=all_tools, model=bedrock_model, system_prompt=SYSTEM_PROMPT)
 
@@ -1,15 +1,33 @@
 #!/usr/bin/env python
 
 import asyncio
+import bisect
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import heapq
+import io
 import json
 import multiprocessing
 import os
+import re
+import shutil
+import sys
 import tempfile
 import threading
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
 
 from mcp.server.fastmcp import FastMCP
-from nova_act import ActError, NovaAct
+
+# NOVA_ACT_BACKEND=fake swaps in a local stand-in for load testing (see fake_nova_act.py)
+if os.getenv("NOVA_ACT_BACKEND", "nova_act") == "fake":
+    from fake_nova_act import ActError, NovaAct
+else:
+    from nova_act import ActError, NovaAct
 
 # Initialize FastMCP server
 mcp = FastMCP("nova-act-server")
@@ -20,6 +38,136 @@ results_store = {}
 session_lock = threading.Lock()
 results_lock = threading.Lock()
 
+# Append-only index of stored results: parallel lists of sequence numbers,
+# store timestamps and result IDs, so exports can filter without scanning
+results_seq = []
+results_times = []
+results_order = []
+
+# Incremental export cursors and locks, keyed by absolute file path
+export_cursors = {}
+export_locks = {}
+export_locks_guard = threading.Lock()
+
+EXPORT_FORMATS = ("json", "ndjson", "parquet")
+EXPORT_BATCH_SIZE = 500
+
+# Screenshot encoding runs in a small worker pool so it never blocks the event loop
+screenshot_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="screenshot"
+)
+last_screenshot = {"hash": None, "path": None, "encoding": None}
+screenshot_lock = threading.Lock()
+
+# Opt-in cache of read-only browser_session results
+action_cache = {}
+action_cache_lock = threading.Lock()
+ACTION_CACHE_MAX_ENTRIES = 256
+
+# An action is cacheable only if it matches an allow pattern and no deny pattern
+ACTION_CACHE_ALLOW_PATTERNS = [
+    r"^(return|extract|list|get|find|read|show|tell|what|which|how many)\b",
+    r"\b(search for|look up|scroll|navigate to|go to|open|click on|view)\b",
+    r"\b(type|enter)\b.*\bsearch (box|bar|field)\b",
+]
+ACTION_CACHE_DENY_PATTERNS = [
+    r"\b(buy|purchase|checkout|check out|pay|order|book|reserve|subscribe)\b",
+    r"\b(add to (cart|basket|list|wishlist)|remove|delete|cancel|unsubscribe)\b",
+    r"\b(submit|send|post|comment|reply|upload|save|update|edit)\b",
+    r"\b(log ?in|log ?out|sign ?in|sign ?up|sign ?out|register|password)\b",
+    r"^(?!.*\bsearch\b).*\b(type|enter|fill|select|check the box|toggle|accept|confirm)\b",
+]
+
+# Server metrics for the server_stats tool
+METRICS_WINDOW = 1000
+server_started_at = time.time()
+tool_metrics = {}
+act_steps = collections.deque(maxlen=METRICS_WINDOW)
+act_totals = {"calls": 0, "steps": 0}
+active_schedulers = []
+metrics_lock = threading.Lock()
+
+# Lean execution mode: a few long-lived worker processes, each hosting one browser
+lean_pool = None
+lean_pool_size = 0
+lean_pool_lock = threading.Lock()
+LEAN_WORKERS = 2
+LEAN_TASKS_PER_BROWSER = 20
+
+# Per-process state of a lean worker
+lean_browser = None
+lean_browser_uses = 0
+lean_browser_headless = None
+lean_origin_tracker = None
+
+# Resource blocking policies applied through Playwright route interception
+RESOURCE_TYPES = {
+    "stylesheet", "image", "media", "font", "script", "texttrack", "xhr",
+    "fetch", "eventsource", "websocket", "manifest", "other",
+}
+TRACKER_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "adservice.google.com", "amazon-adsystem.com",
+    "facebook.net", "connect.facebook.net", "hotjar.com", "segment.io",
+    "scorecardresearch.com", "quantserve.com", "criteo.com", "taboola.com",
+    "outbrain.com", "bat.bing.com", "nr-data.net", "fullstory.com",
+]
+RESOURCE_PRESETS = {
+    # Keep stylesheets: Nova Act reads the rendered page, so layout must survive
+    "extraction": {
+        "block_resource_types": ["image", "media", "font"],
+        "block_domains": TRACKER_DOMAINS,
+    },
+    "trackers": {"block_resource_types": [], "block_domains": TRACKER_DOMAINS},
+}
+# Typical transfer sizes, used to estimate bytes saved by blocked requests
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 40_000, "media": 500_000, "font": 30_000, "stylesheet": 20_000,
+    "script": 25_000, "xhr": 5_000, "fetch": 5_000, "other": 5_000,
+}
+session_blocker = None
+
+# Named browser storage state (cookies/localStorage) snapshots, shared with
+# task processes through files
+STORAGE_STATE_DIR = os.getenv(
+    "NOVA_ACT_STORAGE_STATE_DIR",
+    os.path.join(os.path.expanduser("~"), ".nova_act_mcp", "storage_states"),
+)
+STORAGE_STATE_TTL = 24 * 60 * 60
+STORAGE_STATE_NAME_PATTERN = re.compile(r"[A-Za-z0-9_.\-]+")
+
+# Templates in task graph nodes, e.g. "Visit {{search.final_page}}"
+GRAPH_TEMPLATE_PATTERN = re.compile(r"\{\{\s*([\w\-]+(?:\.[\w\-]+)*)\s*\}\}")
+
+# Parallel task scheduling defaults
+PARALLEL_MAX_CONCURRENCY = 5
+PARALLEL_MAX_PER_HOST = 2
+# Seconds between task starts on one host; 0 leaves pacing to max_per_host
+HOST_MIN_START_INTERVAL = 0.0
+HOST_BACKOFF_BASE = 5.0
+HOST_BACKOFF_MAX = 120.0
+TASK_PRIORITIES = {"high": 2, "normal": 1, "low": 0}
+
+# Adaptive (AIMD) concurrency: start low, add one slot per healthy window and
+# halve on failures or when latency exceeds this multiple of the baseline
+ADAPTIVE_INITIAL_CONCURRENCY = 2
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+
+# Signs that a site is throttling or blocking the browser
+BLOCKED_PATTERNS = [
+    r"captcha",
+    r"\b429\b",
+    r"too many requests",
+    r"access denied",
+    r"\b403\b",
+    r"unusual traffic",
+    r"are you a (robot|human)",
+    r"rate limit",
+    r"temporarily blocked",
+]
+
+SCREENSHOT_FORMATS = {"png": "PNG", "jpeg": "JPEG", "jpg": "JPEG", "webp": "WEBP"}
+
 
 # Helper functions
 def generate_id(prefix: str) -> str:
@@ -29,37 +177,669 @@ def generate_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex[:8]}"
 
 
-def save_results_to_file(
-    file_path: str, result_ids: Optional[List[str]] = None
-) -> bool:
-    """Save selected results to a JSON file"""
+def is_cacheable_action(action: str) -> bool:
+    """Check an action against the cache allow and deny lists"""
+    text = action.strip().lower()
+    if any(re.search(pattern, text) for pattern in ACTION_CACHE_DENY_PATTERNS):
+        return False
+    return any(re.search(pattern, text) for pattern in ACTION_CACHE_ALLOW_PATTERNS)
+
+
+def action_cache_key(
+    starting_page: str,
+    actions: List[str],
+    schema: Optional[Dict[str, Any]],
+    headless: bool,
+) -> str:
+    """Build a cache key from (starting_page, actions, schema hash, headless)"""
+    schema_hash = hashlib.sha256(
+        json.dumps(schema, sort_keys=True).encode()
+    ).hexdigest()
+    payload = json.dumps(
+        [starting_page, actions, schema_hash, headless], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cached_session(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached browser_session response if it has not expired"""
+    with action_cache_lock:
+        entry = action_cache.get(key)
+        if not entry:
+            return None
+        if entry["expires_at"] <= time.time():
+            del action_cache[key]
+            return None
+        return entry
+
+
+def put_cached_session(key: str, response: Dict[str, Any], ttl: float) -> None:
+    """Store a browser_session response, evicting the oldest entry when full"""
+    now = time.time()
+    with action_cache_lock:
+        if key not in action_cache and len(action_cache) >= ACTION_CACHE_MAX_ENTRIES:
+            oldest = min(action_cache, key=lambda k: action_cache[k]["cached_at"])
+            del action_cache[oldest]
+        action_cache[key] = {
+            "response": response,
+            "cached_at": now,
+            "expires_at": now + ttl,
+        }
+
+
+def store_result(result_id: str, result_data: Dict[str, Any]) -> None:
+    """Add a result to the results store and its export index"""
     with results_lock:
-        if result_ids:
-            data = {
-                rid: results_store[rid] for rid in result_ids if rid in results_store
-            }
-        else:
-            data = dict(results_store)
+        if result_id not in results_store:
+            next_seq = results_seq[-1] + 1 if results_seq else 1
+            # Keep store times non-decreasing so they can be bisected
+            stored_at = max(time.time(), results_times[-1] if results_times else 0)
+            results_seq.append(next_seq)
+            results_times.append(stored_at)
+            results_order.append(result_id)
+        results_store[result_id] = result_data
+
+
+def parse_export_time(value: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to epoch seconds"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value).timestamp()
+
+
+def snapshot_results(
+    result_ids: Optional[List[str]] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    after_seq: int = 0,
+    after_time: Optional[float] = None,
+) -> List[tuple]:
+    """Return (seq, stored_at, result_id, data) tuples matching the filters.
+
+    An empty or missing result_ids selects every result. after_time excludes
+    results stored at or before it. Only references are collected while holding results_lock; stored result
+    dicts are never mutated, so they can be serialized after the lock is released.
+    """
+    with results_lock:
+        start = bisect.bisect_right(results_seq, after_seq)
+        # Store times increase with the sequence number, so narrow by bisecting
+        if since is not None:
+            start = max(start, bisect.bisect_left(results_times, since))
+        if after_time is not None:
+            start = max(start, bisect.bisect_right(results_times, after_time))
+        end = len(results_order)
+        if until is not None:
+            end = bisect.bisect_right(results_times, until)
+
+        wanted = set(result_ids) if result_ids else None
+        rows = []
+        for i in range(start, end):
+            result_id = results_order[i]
+            if wanted is None or result_id in wanted:
+                rows.append(
+                    (results_seq[i], results_times[i], result_id, results_store[result_id])
+                )
+        return rows
+
+
+def write_results_json(file_path: str, rows: List[tuple]) -> None:
+    """Write results as one JSON object keyed by result ID, one entry at a time"""
+    with open(file_path, "w") as f:
+        f.write("{")
+        for i, (_, _, result_id, data) in enumerate(rows):
+            f.write(",\n" if i else "\n")
+            f.write(f"  {json.dumps(result_id)}: ")
+            f.write(json.dumps(data, default=str))
+        f.write("\n}" if rows else "}")
+
+
+def write_results_ndjson(file_path: str, rows: List[tuple], append: bool) -> None:
+    """Write results as newline-delimited JSON, one result per line"""
+    with open(file_path, "a" if append else "w") as f:
+        for seq, stored_at, result_id, data in rows:
+            record = dict(data)
+            record["result_id"] = result_id
+            record["seq"] = seq
+            record["stored_at"] = datetime.fromtimestamp(stored_at).isoformat()
+            f.write(json.dumps(record, default=str))
+            f.write("\n")
+
+
+def write_results_parquet(file_path: str, rows: List[tuple], append: bool) -> None:
+    """Write results to Parquet in row-group batches.
+
+    Nested fields (parsed_response, metadata) are stored as JSON strings. With
+    append=True, file_path is a dataset directory and each export adds a part file.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError(
+            "pyarrow is required for Parquet export. Install it with: pip install pyarrow"
+        )
 
+    schema = pa.schema(
+        [
+            ("seq", pa.int64()),
+            ("stored_at", pa.timestamp("us")),
+            ("result_id", pa.string()),
+            ("action", pa.string()),
+            ("starting_page", pa.string()),
+            ("final_page", pa.string()),
+            ("response", pa.string()),
+            ("parsed_response", pa.string()),
+            ("valid_json", pa.bool_()),
+            ("matches_schema", pa.bool_()),
+            ("metadata", pa.string()),
+            ("error", pa.string()),
+        ]
+    )
+
+    def to_text(value):
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value, default=str)
+
+    if append:
+        os.makedirs(file_path, exist_ok=True)
+        # Sequence numbers restart with the server, so name parts by store time
+        first_seq, first_stored_at = (rows[0][0], rows[0][1]) if rows else (0, time.time())
+        stamp = datetime.fromtimestamp(first_stored_at).strftime("%Y%m%dT%H%M%S%f")
+        target = os.path.join(file_path, f"part-{stamp}-{first_seq:010d}.parquet")
+    else:
+        target = file_path
+
+    with pq.ParquetWriter(target, schema) as writer:
+        for offset in range(0, len(rows), EXPORT_BATCH_SIZE):
+            batch = rows[offset : offset + EXPORT_BATCH_SIZE]
+            columns = {
+                "seq": [seq for seq, _, _, _ in batch],
+                "stored_at": [
+                    datetime.fromtimestamp(stored_at) for _, stored_at, _, _ in batch
+                ],
+                "result_id": [rid for _, _, rid, _ in batch],
+            }
+            for field in ("action", "starting_page", "final_page", "response",
+                          "parsed_response", "metadata", "error"):
+                columns[field] = [to_text(data.get(field)) for _, _, _, data in batch]
+            for field in ("valid_json", "matches_schema"):
+                columns[field] = [
+                    data.get(field) if isinstance(data.get(field), bool) else None
+                    for _, _, _, data in batch
+                ]
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+
+def last_exported_row(file_path: str, export_format: str) -> Optional[tuple]:
+    """(result_id, stored_at) of the newest result in an existing export.
+
+    Lets incremental exports resume when this process has no cursor for the
+    file, e.g. after a full export or a server restart. result_id is None
+    for NDJSON lines written before it was included.
+    """
     try:
-        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        if export_format == "ndjson":
+            with open(file_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                # Read backwards until the last complete line is in the buffer
+                tail = b""
+                while end > 0 and tail.rstrip(b"\n").count(b"\n") < 1:
+                    start = max(0, end - 65536)
+                    f.seek(start)
+                    tail = f.read(end - start) + tail
+                    end = start
+            lines = tail.rstrip(b"\n").split(b"\n")
+            if not lines[-1]:
+                return None
+            record = json.loads(lines[-1])
+            stored_at = datetime.fromisoformat(record["stored_at"]).timestamp()
+            return record.get("result_id"), stored_at
+
+        if export_format == "parquet":
+            import pyarrow.parquet as pq
+
+            parts = sorted(
+                name for name in os.listdir(file_path) if name.endswith(".parquet")
+            )
+            if not parts:
+                return None
+            table = pq.read_table(
+                os.path.join(file_path, parts[-1]), columns=["result_id", "stored_at"]
+            )
+            if not len(table):
+                return None
+            # Rows are written in sequence order, so the last one is the newest
+            return (
+                table.column("result_id")[-1].as_py(),
+                table.column("stored_at")[-1].as_py().timestamp(),
+            )
+    except (OSError, ValueError, KeyError, ImportError):
+        return None
+    return None
+
+
+def result_seq(result_id: Optional[str]) -> Optional[int]:
+    """Sequence number of a stored result, or None if it isn't in the store"""
+    with results_lock:
+        try:
+            return results_seq[results_order.index(result_id)]
+        except ValueError:
+            return None
+
+
+def save_results_to_file(
+    file_path: str,
+    result_ids: Optional[List[str]] = None,
+    export_format: str = "json",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    incremental: bool = False,
+) -> bool:
+    """Save selected results to a JSON, NDJSON or Parquet file"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    if incremental and export_format == "json":
+        raise ValueError("Incremental export is only supported for ndjson and parquet")
+
+    cursor_key = os.path.abspath(file_path)
+    with export_locks_guard:
+        export_lock = export_locks.setdefault(cursor_key, threading.Lock())
+
+    # Serialize one export per file at a time so cursors stay consistent
+    with export_lock:
+        after_seq, after_time = 0, None
+        if incremental:
+            if cursor_key in export_cursors:
+                after_seq = export_cursors[cursor_key]
+            else:
+                # First incremental export to this file by this process: resume
+                # after its newest row, by result ID while that is still stored
+                last_row = last_exported_row(file_path, export_format)
+                if last_row:
+                    last_id, last_time = last_row
+                    seq = result_seq(last_id)
+                    if seq is not None:
+                        after_seq = seq
+                    else:
+                        # Exported times are truncated to microseconds
+                        after_time = last_time + 1e-6
+        rows = snapshot_results(
+            result_ids=result_ids,
+            since=parse_export_time(since),
+            until=parse_export_time(until),
+            after_seq=after_seq,
+            after_time=after_time,
+        )
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            if export_format == "ndjson":
+                write_results_ndjson(file_path, rows, append=incremental)
+            elif export_format == "parquet":
+                if incremental and not rows:
+                    return True
+                write_results_parquet(file_path, rows, append=incremental)
+            else:
+                write_results_json(file_path, rows)
+        except ValueError:
+            raise
+        except Exception as e:
+            return False
+
+        if incremental and rows:
+            export_cursors[cursor_key] = rows[-1][0]
         return True
-    except Exception as e:
-        return False
 
 
-def execute_nova_act_task(task_args, result_file=None):
-    """
-    Execute a single Nova Act task in an isolated process.
-    This function runs in a separate process for each task.
+def perceptual_hash(image) -> int:
+    """Compute a 64-bit difference hash (dHash) of a PIL image"""
+    small = image.convert("L").resize((9, 8))
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def link_or_copy(source: str, target: str) -> str:
+    """Make target a hard link to source, or a copy across filesystems"""
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
+
+def encode_and_save_screenshot(
+    screenshot_bytes: bytes,
+    save_path: Optional[str],
+    image_format: str,
+    quality: int,
+    scale: float,
+    skip_if_unchanged: bool,
+    hash_threshold: int,
+) -> str:
+    """Re-encode raw PNG screenshot bytes and write them to disk"""
+    encoding = (SCREENSHOT_FORMATS.get(image_format), quality, scale)
+    needs_pillow = image_format != "png" or scale != 1.0 or skip_if_unchanged
+
+    if needs_pillow:
+        try:
+            from PIL import Image
+        except ImportError:
+            raise ValueError(
+                "Pillow is required for screenshot format, scale and dedup options. "
+                "Install it with: pip install pillow"
+            )
+
+        image = Image.open(io.BytesIO(screenshot_bytes))
+        image.load()
+
+        if skip_if_unchanged:
+            frame_hash = perceptual_hash(image)
+            with screenshot_lock:
+                previous_hash = last_screenshot["hash"]
+                previous_path = last_screenshot["path"]
+                previous_encoding = last_screenshot["encoding"]
+            # Only reuse a file encoded the way this call asks for
+            if (
+                previous_hash is not None
+                and previous_path
+                and previous_encoding == encoding
+                and os.path.exists(previous_path)
+                and bin(frame_hash ^ previous_hash).count("1") <= hash_threshold
+            ):
+                if not save_path or os.path.abspath(save_path) == os.path.abspath(
+                    previous_path
+                ):
+                    return previous_path
+                return link_or_copy(previous_path, save_path)
+        else:
+            frame_hash = None
+
+        if scale != 1.0:
+            width = max(1, int(image.width * scale))
+            height = max(1, int(image.height * scale))
+            image = image.resize((width, height), Image.LANCZOS)
+
+        pil_format = SCREENSHOT_FORMATS[image_format]
+        save_kwargs = {}
+        if pil_format == "JPEG":
+            # JPEG has no alpha channel
+            image = image.convert("RGB")
+            save_kwargs = {"quality": quality, "optimize": True}
+        elif pil_format == "WEBP":
+            save_kwargs = {"quality": quality, "method": 4}
+        else:
+            save_kwargs = {"optimize": True}
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=pil_format, **save_kwargs)
+        output_bytes = buffer.getvalue()
+    else:
+        frame_hash = None
+        output_bytes = screenshot_bytes
+
+    suffix = ".jpg" if image_format in ("jpeg", "jpg") else f".{image_format}"
+    if save_path:
+        os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
+        with open(save_path, "wb") as f:
+            f.write(output_bytes)
+        output_path = save_path
+    else:
+        temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        temp_file.write(output_bytes)
+        temp_file.close()
+        output_path = temp_file.name
+
+    if frame_hash is not None:
+        with screenshot_lock:
+            last_screenshot["hash"] = frame_hash
+            last_screenshot["path"] = output_path
+            last_screenshot["encoding"] = encoding
+
+    return output_path
+
+
+class ResourceBlocker:
+    """Blocks requests by resource type or domain and counts what it saw"""
+
+    def __init__(self, policy: Dict[str, Any]):
+        policy = dict(policy or {})
+        preset = policy.pop("preset", None)
+        if preset:
+            if preset not in RESOURCE_PRESETS:
+                raise ValueError(
+                    f"Unknown resource preset '{preset}'. "
+                    f"Use one of: {', '.join(RESOURCE_PRESETS)}"
+                )
+            for key, values in RESOURCE_PRESETS[preset].items():
+                policy[key] = list(values) + list(policy.get(key, []))
+
+        self.block_types = set(policy.get("block_resource_types", []))
+        unknown = self.block_types - RESOURCE_TYPES
+        if unknown:
+            raise ValueError(
+                f"Cannot block resource types: {', '.join(sorted(unknown))}"
+            )
+        self.block_domains = [d.lower().lstrip(".") for d in policy.get("block_domains", [])]
+        self.lock = threading.Lock()
+        self.context = None
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        self.allowed = 0
+        self.blocked = {}
+        self.bytes_loaded = 0
+
+    def is_blocked(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.block_types:
+            return True
+        host = urlparse(url).netloc.lower().split(":")[0]
+        return any(host == d or host.endswith("." + d) for d in self.block_domains)
+
+    def handle_route(self, route) -> None:
+        request = route.request
+        if self.is_blocked(request.resource_type, request.url):
+            with self.lock:
+                self.blocked[request.resource_type] = (
+                    self.blocked.get(request.resource_type, 0) + 1
+                )
+            route.abort("blockedbyclient")
+        else:
+            with self.lock:
+                self.allowed += 1
+            route.continue_()
+
+    def handle_response(self, response) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            with self.lock:
+                self.bytes_loaded += int(length)
+
+    def install(self, page) -> None:
+        """Intercept every request in the page's browser context"""
+        self.context = page.context
+        self.context.route("**/*", self.handle_route)
+        self.context.on("response", self.handle_response)
+
+    def uninstall(self) -> None:
+        if self.context is not None:
+            self.context.unroute("**/*", self.handle_route)
+            self.context.remove_listener("response", self.handle_response)
+            self.context = None
+
+    def take_stats(self, page) -> Dict[str, Any]:
+        """Return counters since the last call, plus the current page load time"""
+        with self.lock:
+            blocked = dict(self.blocked)
+            stats = {
+                "requests_allowed": self.allowed,
+                "requests_blocked": sum(blocked.values()),
+                "blocked_by_type": blocked,
+                "bytes_loaded": self.bytes_loaded,
+                "estimated_bytes_saved": sum(
+                    ESTIMATED_RESOURCE_BYTES.get(kind, 5_000) * count
+                    for kind, count in blocked.items()
+                ),
+            }
+            self.reset_counters()
+        stats["page_load_ms"] = page_load_time(page)
+        return stats
+
+
+class OriginTracker:
+    """Records the origin of every page and frame a browser context navigates to.
+
+    Covers redirects, popups and third-party iframes, so a reset can clear
+    storage for origins that never show up in the task's final pages.
     """
-    starting_page = task_args.get("starting_page")
-    actions_input = task_args.get("actions", [])
-    headless = task_args.get("headless", False)
 
-    # Convert action strings to action objects if needed
+    def __init__(self):
+        self.origins = set()
+
+    def install(self, context) -> None:
+        context.on("page", self.watch_page)
+        for page in context.pages:
+            self.watch_page(page)
+
+    def watch_page(self, page) -> None:
+        page.on("framenavigated", self.record_frame)
+        for frame in page.frames:
+            self.record_frame(frame)
+
+    def record_frame(self, frame) -> None:
+        self.add(frame.url)
+
+    def add(self, url: Optional[str]) -> None:
+        parsed = urlparse(url or "")
+        if parsed.scheme in ("http", "https") and parsed.netloc:
+            self.origins.add(f"{parsed.scheme}://{parsed.netloc}")
+
+
+def page_load_time(page) -> Optional[float]:
+    """Load time of the current document from the Navigation Timing API"""
+    try:
+        value = page.evaluate(
+            "() => { const nav = performance.getEntriesByType('navigation')[0];"
+            " return nav ? nav.loadEventEnd - nav.startTime : null; }"
+        )
+        return round(value, 1) if value else None
+    except Exception:
+        return None
+
+
+def storage_state_path(name: str) -> str:
+    """Path of the file holding a named storage state snapshot"""
+    if not STORAGE_STATE_NAME_PATTERN.fullmatch(name or ""):
+        raise ValueError(
+            "Storage state names may only contain letters, digits, '.', '_' and '-'"
+        )
+    return os.path.join(STORAGE_STATE_DIR, f"{name}.json")
+
+
+def save_storage_state_to_file(nova_act, name: str, ttl: float) -> Dict[str, Any]:
+    """Capture cookies and localStorage of a session under a name"""
+    path = storage_state_path(name)
+    state = nova_act.page.context.storage_state()
+    now = time.time()
+    snapshot = {
+        "name": name,
+        "saved_at": now,
+        "expires_at": now + ttl,
+        "state": state,
+    }
+
+    # Snapshots hold login cookies, so keep them private and write atomically
+    os.makedirs(STORAGE_STATE_DIR, mode=0o700, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(temp_path, path)
+
+    return {
+        "name": name,
+        "cookies": len(state.get("cookies", [])),
+        "origins": len(state.get("origins", [])),
+        "expires_at": datetime.fromtimestamp(snapshot["expires_at"]).isoformat(),
+    }
+
+
+def load_storage_state(name: str) -> Dict[str, Any]:
+    """Read a named storage state snapshot, deleting it if it has expired"""
+    path = storage_state_path(name)
+    try:
+        with open(path, "r") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"Storage state '{name}' not found")
+
+    if snapshot.get("expires_at", 0) <= time.time():
+        os.remove(path)
+        raise ValueError(f"Storage state '{name}' has expired")
+    return snapshot["state"]
+
+
+def inject_storage_state(nova_act, state: Dict[str, Any]) -> None:
+    """Add saved cookies and localStorage to a running session's context"""
+    context = nova_act.page.context
+    if state.get("cookies"):
+        context.add_cookies(state["cookies"])
+
+    origins = state.get("origins", [])
+    if origins:
+        # localStorage can only be written from a page of the same origin,
+        # so restore it once per tab on the first matching navigation
+        context.add_init_script(
+            "(() => {"
+            f" const origins = {json.dumps(origins)};"
+            " const saved = origins.find(o => o.origin === location.origin);"
+            " if (!saved || sessionStorage.getItem('__nova_act_state_loaded')) return;"
+            " for (const item of saved.localStorage || [])"
+            " localStorage.setItem(item.name, item.value);"
+            " sessionStorage.setItem('__nova_act_state_loaded', '1');"
+            "})();"
+        )
+
+
+def prepare_session(nova_act, policy=None, storage_state=None, reload: bool = True):
+    """Apply a resource policy and saved storage state to a started session.
+
+    The starting page has already loaded by the time NovaAct returns from
+    start(), so it is reloaded once under the new settings unless reload is
+    False. Returns the ResourceBlocker, if a policy was given.
+    """
+    blocker = None
+    if policy:
+        blocker = ResourceBlocker(policy)
+        blocker.install(nova_act.page)
+    if storage_state:
+        inject_storage_state(nova_act, load_storage_state(storage_state))
+    if reload and (blocker or storage_state):
+        nova_act.page.reload()
+    if blocker:
+        blocker.reset_counters()
+    return blocker
+
+
+def task_succeeded(task_results: List[Dict[str, Any]]) -> bool:
+    """A flow succeeded if every action ran without error"""
+    return bool(task_results) and not any("error" in r for r in task_results)
+
+
+def normalize_actions(actions_input: List[Any]) -> List[Dict[str, Any]]:
+    """Convert action strings to action objects if needed"""
     actions = []
     for action in actions_input:
         if isinstance(action, str):
@@ -68,6 +848,75 @@ def execute_nova_act_task(task_args, result_file=None):
         else:
             # Already an action object
             actions.append(action)
+    return actions
+
+
+def run_task_actions(
+    nova_act, starting_page, actions, task_results, blocker=None
+) -> None:
+    """Execute each action of a task in sequence, appending to task_results"""
+    for action_params in actions:
+        action_text = action_params.get("action")
+        schema = action_params.get("schema")
+        max_steps = action_params.get("max_steps")
+
+        kwargs = {}
+        if schema:
+            kwargs["schema"] = schema
+        if max_steps:
+            kwargs["max_steps"] = max_steps
+
+        try:
+            result = nova_act.act(action_text, **kwargs)
+
+            # Create a result object
+            result_id = generate_id("result")
+            result_data = {
+                "result_id": result_id,
+                "action": action_text,
+                "starting_page": starting_page,
+                "final_page": nova_act.page.url,
+                "response": result.response,
+                "parsed_response": (
+                    result.parsed_response
+                    if hasattr(result, "parsed_response")
+                    else None
+                ),
+                "valid_json": (
+                    result.valid_json if hasattr(result, "valid_json") else None
+                ),
+                "matches_schema": (
+                    result.matches_schema
+                    if hasattr(result, "matches_schema")
+                    else None
+                ),
+                "metadata": (
+                    {
+                        "num_steps_executed": result.metadata.num_steps_executed,
+                        "start_time": str(result.metadata.start_time),
+                        "end_time": str(result.metadata.end_time),
+                        "prompt": str(result.metadata.prompt),
+                    }
+                    if hasattr(result, "metadata")
+                    else {}
+                ),
+            }
+            if blocker:
+                result_data["network"] = blocker.take_stats(nova_act.page)
+
+            task_results.append(result_data)
+        except Exception as e:
+            task_results.append({"action": action_text, "error": str(e)})
+
+
+def execute_nova_act_task(task_args, result_file=None):
+    """
+    Execute a single Nova Act task in an isolated process.
+    This function runs in a separate process for each task.
+    """
+    starting_page = task_args.get("starting_page")
+    headless = task_args.get("headless", False)
+    actions = normalize_actions(task_args.get("actions", []))
 
     task_results = []
 
@@ -77,64 +926,31 @@ def execute_nova_act_task(task_args, result_file=None):
             starting_page=starting_page,
             headless=headless,
         ) as nova_act:
-            # Execute each action in sequence
-            for action_params in actions:
-                action_text = action_params.get("action")
-                schema = action_params.get("schema")
-                max_steps = action_params.get("max_steps")
-
-                kwargs = {}
-                if schema:
-                    kwargs["schema"] = schema
-                if max_steps:
-                    kwargs["max_steps"] = max_steps
+            blocker = prepare_session(
+                nova_act,
+                policy=task_args.get("resource_policy"),
+                storage_state=task_args.get("storage_state"),
+            )
+            run_task_actions(nova_act, starting_page, actions, task_results, blocker)
 
-                try:
-                    result = nova_act.act(action_text, **kwargs)
-
-                    # Create a result object
-                    result_id = generate_id("result")
-                    result_data = {
-                        "result_id": result_id,
-                        "action": action_text,
-                        "starting_page": starting_page,
-                        "final_page": nova_act.page.url,
-                        "response": result.response,
-                        "parsed_response": (
-                            result.parsed_response
-                            if hasattr(result, "parsed_response")
-                            else None
-                        ),
-                        "valid_json": (
-                            result.valid_json if hasattr(result, "valid_json") else None
-                        ),
-                        "matches_schema": (
-                            result.matches_schema
-                            if hasattr(result, "matches_schema")
-                            else None
-                        ),
-                        "metadata": (
-                            {
-                                "num_steps_executed": result.metadata.num_steps_executed,
-                                "start_time": str(result.metadata.start_time),
-                                "end_time": str(result.metadata.end_time),
-                                "prompt": str(result.metadata.prompt),
-                            }
-                            if hasattr(result, "metadata")
-                            else {}
-                        ),
-                    }
+            saved_state = None
+            if task_args.get("save_storage_state") and task_succeeded(task_results):
+                saved_state = save_storage_state_to_file(
+                    nova_act,
+                    task_args["save_storage_state"],
+                    task_args.get("storage_state_ttl", STORAGE_STATE_TTL),
+                )
 
-                    task_results.append(result_data)
-                except Exception as e:
-                    task_results.append({"action": action_text, "error": str(e)})
+        task_result = {"starting_page": starting_page, "results": task_results}
+        if saved_state:
+            task_result["saved_storage_state"] = saved_state
 
         # Write results to file if specified
         if result_file:
             with open(result_file, "w") as f:
-                json.dump({"starting_page": starting_page, "results": task_results}, f)
+                json.dump(task_result, f)
 
-        return {"starting_page": starting_page, "results": task_results}
+        return task_result
     except Exception as e:
         result = {
             "starting_page": starting_page,
@@ -147,12 +963,963 @@ def execute_nova_act_task(task_args, result_file=None):
         return result
 
 
+def reset_browser_state(nova_act, origins: List[str]) -> None:
+    """Clear all cookies and the storage of every visited origin for the next task"""
+    page = nova_act.page
+    context = page.context
+    context.clear_cookies()
+
+    # Popups and other tabs keep their own sessionStorage
+    for other in list(context.pages):
+        if other is not page:
+            other.close()
+
+    cdp = context.new_cdp_session(page)
+    try:
+        cdp.send("DOMStorage.enable")
+        for origin in origins:
+            # localStorage, IndexedDB, Cache Storage, service workers, ...
+            cdp.send(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"},
+            )
+            # sessionStorage belongs to the tab rather than the origin
+            cdp.send(
+                "DOMStorage.clear",
+                {"storageId": {"securityOrigin": origin, "isLocalStorage": False}},
+            )
+    finally:
+        cdp.detach()
+
+
+def stop_lean_browser() -> None:
+    """Stop the browser hosted by this lean worker process"""
+    global lean_browser, lean_origin_tracker
+
+    if lean_browser is not None:
+        try:
+            lean_browser.stop()
+        except Exception:
+            pass
+    lean_browser = None
+    lean_origin_tracker = None
+
+
+def execute_lean_task(task_args) -> Dict[str, Any]:
+    """
+    Execute a Nova Act task on this worker's long-lived browser.
+    Runs inside a lean worker process; the browser is started on first use,
+    reset between tasks, and recycled after LEAN_TASKS_PER_BROWSER tasks or
+    whenever a task or reset fails.
+    """
+    global lean_browser, lean_browser_uses, lean_browser_headless, lean_origin_tracker
+
+    starting_page = task_args.get("starting_page")
+    headless = task_args.get("headless", False)
+    actions = normalize_actions(task_args.get("actions", []))
+    task_results = []
+
+    try:
+        if lean_browser is not None and (
+            lean_browser_uses >= LEAN_TASKS_PER_BROWSER
+            or lean_browser_headless != headless
+        ):
+            stop_lean_browser()
+
+        policy = task_args.get("resource_policy")
+        storage_state = task_args.get("storage_state")
+        if lean_browser is None:
+            lean_browser = NovaAct(starting_page=starting_page, headless=headless)
+            lean_browser.start()
+            lean_browser_uses = 0
+            lean_browser_headless = headless
+            lean_origin_tracker = OriginTracker()
+            lean_origin_tracker.install(lean_browser.page.context)
+            blocker = prepare_session(lean_browser, policy, storage_state)
+        else:
+            blocker = prepare_session(lean_browser, policy, storage_state, reload=False)
+            lean_browser.page.goto(starting_page)
+            if blocker:
+                blocker.reset_counters()
+
+        lean_browser_uses += 1
+        saved_state = None
+        try:
+            run_task_actions(lean_browser, starting_page, actions, task_results, blocker)
+            if task_args.get("save_storage_state") and task_succeeded(task_results):
+                saved_state = save_storage_state_to_file(
+                    lean_browser,
+                    task_args["save_storage_state"],
+                    task_args.get("storage_state_ttl", STORAGE_STATE_TTL),
+                )
+        finally:
+            # The browser outlives the task, so the policy must not
+            if blocker:
+                blocker.uninstall()
+
+        # Leave the browser clean for the next task
+        for url in [starting_page, lean_browser.page.url] + [
+            r.get("final_page") for r in task_results
+        ]:
+            lean_origin_tracker.add(url)
+        try:
+            reset_browser_state(lean_browser, sorted(lean_origin_tracker.origins))
+            lean_origin_tracker.origins.clear()
+        except Exception:
+            stop_lean_browser()
+
+        # Injected storage state lives in an init script that cannot be removed
+        if storage_state:
+            stop_lean_browser()
+
+        task_result = {"starting_page": starting_page, "results": task_results}
+        if saved_state:
+            task_result["saved_storage_state"] = saved_state
+        return task_result
+    except Exception as e:
+        stop_lean_browser()
+        return {"starting_page": starting_page, "error": str(e), "results": task_results}
+
+
+def init_lean_worker() -> None:
+    """Make sure a lean worker stops its browser when the process exits"""
+    import atexit
+
+    atexit.register(stop_lean_browser)
+
+
+def get_lean_pool(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """Return the lean worker pool, recreating it if the worker count changed"""
+    global lean_pool, lean_pool_size
+
+    with lean_pool_lock:
+        if lean_pool is None or lean_pool_size != workers:
+            if lean_pool is not None:
+                lean_pool.shutdown(wait=False)
+            lean_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_lean_worker,
+            )
+            lean_pool_size = workers
+        return lean_pool
+
+
+def make_lean_runner(workers: int):
+    """Build a scheduler run_task that executes tasks on the lean worker pool"""
+    pool = get_lean_pool(workers)
+
+    async def run_task_lean(task: Dict[str, Any], result_file: str) -> Dict[str, Any]:
+        global lean_pool
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(pool, execute_lean_task, task)
+        except concurrent.futures.process.BrokenProcessPool as e:
+            # A worker died (e.g. the browser crashed); start a fresh pool next time
+            with lean_pool_lock:
+                if lean_pool is pool:
+                    lean_pool = None
+            return {"starting_page": task.get("starting_page"), "error": str(e)}
+
+    return run_task_lean
+
+
+def task_host(task: Dict[str, Any]) -> str:
+    """Return the host a browser task starts on"""
+    return urlparse(task.get("starting_page") or "").netloc.lower() or "unknown"
+
+
+def task_priority(task: Dict[str, Any]) -> int:
+    """Return a numeric priority for a browser task (higher runs first)"""
+    priority = task.get("priority", "normal")
+    if isinstance(priority, str):
+        if priority.lower() not in TASK_PRIORITIES:
+            raise ValueError(
+                f"Unknown priority '{priority}'. Use high, normal, low or an integer"
+            )
+        return TASK_PRIORITIES[priority.lower()]
+    return int(priority)
+
+
+def looks_blocked(task_result: Dict[str, Any]) -> bool:
+    """Check whether a task result suggests the site throttled or blocked us"""
+    texts = [task_result.get("error")]
+    for result in task_result.get("results", []):
+        texts.append(result.get("error"))
+        texts.append(result.get("response"))
+    text = " ".join(str(t) for t in texts if t).lower()
+    return any(re.search(pattern, text) for pattern in BLOCKED_PATTERNS)
+
+
+class HostRateLimiter:
+    """Optionally spaces out task starts per host and backs off exponentially on blocks"""
+
+    def __init__(
+        self,
+        min_interval: float = HOST_MIN_START_INTERVAL,
+        backoff_base: float = HOST_BACKOFF_BASE,
+        backoff_max: float = HOST_BACKOFF_MAX,
+    ):
+        self.min_interval = min_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.next_allowed = {}
+        self.failures = {}
+
+    def delay(self, host: str) -> float:
+        """Seconds to wait before another task may start on host"""
+        return max(0.0, self.next_allowed.get(host, 0.0) - time.monotonic())
+
+    def record_start(self, host: str) -> None:
+        self.next_allowed[host] = max(
+            self.next_allowed.get(host, 0.0), time.monotonic() + self.min_interval
+        )
+
+    def record_outcome(self, host: str, blocked: bool) -> None:
+        if not blocked:
+            self.failures[host] = 0
+            return
+        self.failures[host] = self.failures.get(host, 0) + 1
+        backoff = min(
+            self.backoff_max, self.backoff_base * 2 ** (self.failures[host] - 1)
+        )
+        self.next_allowed[host] = max(
+            self.next_allowed.get(host, 0.0), time.monotonic() + backoff
+        )
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit driven by task latency and failures.
+
+    The limit grows by one after a full window of healthy completions and is
+    halved when a task fails or runs much slower than the baseline latency.
+    Tasks started before the last decrease can't trigger another one, so a
+    burst of failures backs off only once.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        initial: int = ADAPTIVE_INITIAL_CONCURRENCY,
+        minimum: int = 1,
+        latency_tolerance: float = ADAPTIVE_LATENCY_TOLERANCE,
+        name: str = "tasks",
+    ):
+        self.maximum = max(minimum, maximum)
+        self.minimum = minimum
+        self.limit = float(max(minimum, min(initial, self.maximum)))
+        self.latency_tolerance = latency_tolerance
+        self.name = name
+        self.baseline = None
+        self.healthy = 0
+        self.last_decrease = float("-inf")
+        self.started = time.monotonic()
+        self.history = []
+        self.log_change("start")
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def log_change(self, reason: str) -> None:
+        elapsed = round(time.monotonic() - self.started, 2)
+        self.history.append(
+            {"elapsed_seconds": elapsed, "concurrency": self.current, "reason": reason}
+        )
+        print(
+            f"[adaptive] {self.name}: concurrency {self.current} ({reason}) at {elapsed}s",
+            file=sys.stderr,
+        )
+
+    def record(self, started_at: float, latency: float, failed: bool) -> None:
+        """Feed back one finished task (started_at from time.monotonic())"""
+        slow = (
+            self.baseline is not None
+            and latency > self.baseline * self.latency_tolerance
+        )
+
+        if failed or slow:
+            if started_at >= self.last_decrease:
+                self.limit = max(self.minimum, self.limit / 2)
+                self.healthy = 0
+                self.last_decrease = time.monotonic()
+                self.log_change("failure" if failed else "slow")
+            return
+
+        # Baseline tracks healthy latency so gradual drift is accepted
+        self.baseline = (
+            latency if self.baseline is None else 0.8 * self.baseline + 0.2 * latency
+        )
+        self.healthy += 1
+        if self.healthy >= self.current and self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1)
+            self.healthy = 0
+            self.log_change("healthy")
+
+
+def read_task_result(result_file: str) -> Dict[str, Any]:
+    """Load a task result file written by execute_nova_act_task"""
+    if not os.path.exists(result_file):
+        return {"error": "Result file not found"}
+    with open(result_file, "r") as f:
+        return json.load(f)
+
+
+async def run_task_process(task: Dict[str, Any], result_file: str) -> Dict[str, Any]:
+    """Run one browser task in its own process without blocking the event loop"""
+    process = multiprocessing.Process(
+        target=execute_nova_act_task, args=(task, result_file)
+    )
+    process.start()
+    await asyncio.to_thread(process.join)
+    try:
+        return read_task_result(result_file)
+    except Exception as e:
+        return {"starting_page": task.get("starting_page"), "error": str(e)}
+
+
+class BrowserTaskScheduler:
+    """Runs browser tasks by priority under global and per-host concurrency caps.
+
+    Tasks can be submitted at any time while the scheduler is open, so both
+    batches (schedule_browser_tasks) and task graphs share the same caps,
+    host backoff, retries and server_stats accounting. Use it as an async
+    context manager; submit() returns a future for the task's result.
+
+    Tasks that look blocked are retried after the host's backoff delay, up to
+    max_retries times. With a controller, the global cap follows its adaptive
+    limit (never above max_concurrency). host_min_interval spaces out starts
+    on the same host (off by default).
+    """
+
+    def __init__(
+        self,
+        result_dir: str,
+        max_concurrency: int = PARALLEL_MAX_CONCURRENCY,
+        max_per_host: int = PARALLEL_MAX_PER_HOST,
+        max_retries: int = 1,
+        run_task=run_task_process,
+        controller: Optional[AdaptiveConcurrency] = None,
+        host_min_interval: float = HOST_MIN_START_INTERVAL,
+    ):
+        self.result_dir = result_dir
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        self.run_task = run_task
+        self.controller = controller
+        self.limiter = HostRateLimiter(min_interval=host_min_interval)
+        self.tasks = []
+        self.stats = []
+        self.results = []
+        self.pending = []
+        self.running = {}
+        self.started = {}
+        self.host_active = {}
+        self.wakeup = asyncio.Event()
+        self.loop_task = None
+
+        # Expose queue and slot usage to server_stats
+        self.state = {"running": 0, "queued": 0, "capacity": max_concurrency}
+
+    async def __aenter__(self):
+        with metrics_lock:
+            active_schedulers.append(self.state)
+        self.loop_task = asyncio.ensure_future(self.dispatch())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Unregister even if the tool call is cancelled or a task raises
+        try:
+            self.loop_task.cancel()
+            for future in self.running:
+                future.cancel()
+            await asyncio.gather(
+                self.loop_task, *self.running.keys(), return_exceptions=True
+            )
+        finally:
+            with metrics_lock:
+                active_schedulers.remove(self.state)
+
+    def submit(self, task: Dict[str, Any]) -> asyncio.Future:
+        """Queue a task and return a future for its result"""
+        index = len(self.tasks)
+        self.tasks.append(task)
+        self.stats.append(
+            {"host": task_host(task), "attempts": 0, "queued_at": time.monotonic()}
+        )
+        self.results.append(asyncio.get_running_loop().create_future())
+        heapq.heappush(self.pending, (-task_priority(task), index))
+        self.wakeup.set()
+        return self.results[index]
+
+    def update_state(self, limit: int) -> None:
+        with metrics_lock:
+            self.state["running"] = len(self.running)
+            self.state["queued"] = len(self.pending)
+            self.state["capacity"] = limit
+
+    def start_ready(self, limit: int) -> None:
+        """Start every queued task that fits, in priority order"""
+        deferred = []
+        while self.pending and len(self.running) < limit:
+            item = heapq.heappop(self.pending)
+            index = item[1]
+            stats = self.stats[index]
+            host = stats["host"]
+            if (
+                self.host_active.get(host, 0) >= self.max_per_host
+                or self.limiter.delay(host) > 0
+            ):
+                deferred.append(item)
+                continue
+
+            stats["attempts"] += 1
+            stats.setdefault("started_at", time.monotonic())
+            stats["concurrency"] = limit
+            self.host_active[host] = self.host_active.get(host, 0) + 1
+            self.limiter.record_start(host)
+            result_file = os.path.join(
+                self.result_dir, f"task_{index}_attempt_{stats['attempts']}.json"
+            )
+            future = asyncio.ensure_future(self.run_task(self.tasks[index], result_file))
+            self.running[future] = item
+            self.started[future] = time.monotonic()
+        for item in deferred:
+            heapq.heappush(self.pending, item)
+
+    def finish(self, future: asyncio.Future) -> None:
+        """Record a finished attempt and either requeue it or resolve its result"""
+        item = self.running.pop(future)
+        index = item[1]
+        stats = self.stats[index]
+        host = stats["host"]
+        self.host_active[host] -= 1
+
+        try:
+            task_result = future.result()
+        except Exception as e:
+            task_result = {
+                "starting_page": self.tasks[index].get("starting_page"),
+                "error": str(e),
+            }
+
+        blocked = looks_blocked(task_result)
+        self.limiter.record_outcome(host, blocked)
+        started_at = self.started.pop(future)
+        if self.controller:
+            self.controller.record(
+                started_at,
+                time.monotonic() - started_at,
+                failed=blocked or "error" in task_result,
+            )
+        if blocked and stats["attempts"] <= self.max_retries:
+            heapq.heappush(self.pending, item)
+            return
+
+        stats["finished_at"] = time.monotonic()
+        task_result["scheduling"] = {
+            "host": host,
+            "priority": -item[0],
+            "attempts": stats["attempts"],
+            "blocked": blocked,
+            "concurrency": stats["concurrency"],
+            "queued_seconds": round(stats["started_at"] - stats["queued_at"], 2),
+            "total_seconds": round(stats["finished_at"] - stats["queued_at"], 2),
+        }
+        if not self.results[index].done():
+            self.results[index].set_result(task_result)
+
+    async def dispatch(self) -> None:
+        """Start and collect tasks until the scheduler is closed"""
+        while True:
+            self.wakeup.clear()
+            limit = self.max_concurrency
+            if self.controller:
+                limit = min(self.max_concurrency, self.controller.current)
+            self.start_ready(limit)
+            self.update_state(limit)
+
+            # Tasks held back by a full slot start when a running task finishes;
+            # only host delays (spacing or backoff) need a timer
+            delays = [self.limiter.delay(self.stats[i]["host"]) for _, i in self.pending]
+            delays = [delay for delay in delays if delay > 0]
+            timeout = min(delays) if delays else None
+
+            # Wake up for finished tasks, new submissions or an expired delay
+            wakeup = asyncio.ensure_future(self.wakeup.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    {wakeup, *self.running.keys()},
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                wakeup.cancel()
+
+            for future in done:
+                if future is not wakeup:
+                    self.finish(future)
+
+
+async def schedule_browser_tasks(
+    browser_tasks: List[Dict[str, Any]],
+    result_dir: str,
+    max_concurrency: int = PARALLEL_MAX_CONCURRENCY,
+    max_per_host: int = PARALLEL_MAX_PER_HOST,
+    max_retries: int = 1,
+    run_task=run_task_process,
+    controller: Optional[AdaptiveConcurrency] = None,
+    host_min_interval: float = HOST_MIN_START_INTERVAL,
+) -> List[Dict[str, Any]]:
+    """Run a batch of browser tasks through a BrowserTaskScheduler.
+
+    Results are returned in the order of browser_tasks.
+    """
+    async with BrowserTaskScheduler(
+        result_dir,
+        max_concurrency=max_concurrency,
+        max_per_host=max_per_host,
+        max_retries=max_retries,
+        run_task=run_task,
+        controller=controller,
+        host_min_interval=host_min_interval,
+    ) as scheduler:
+        return list(
+            await asyncio.gather(*[scheduler.submit(task) for task in browser_tasks])
+        )
+
+
+def select_task_runner(execution_mode: str, lean_workers: int, max_concurrency: int):
+    """Return the run_task for an execution mode and the concurrency it allows"""
+    if execution_mode == "lean":
+        workers = max(1, lean_workers)
+        return make_lean_runner(workers), max(1, min(max_concurrency, workers))
+    if execution_mode == "isolated":
+        return run_task_process, max(1, max_concurrency)
+    raise ValueError("execution_mode must be 'isolated' or 'lean'")
+
+
+def finalize_task_result(task_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add final_result and collected_data to a task result and store its results"""
+    # Process the task result to add final_result and collected_data
+    if "results" in task_result and task_result["results"]:
+        # Get the last result (final action)
+        final_result = task_result["results"][-1]
+
+        # Add final_result to the task_result
+        task_result["final_result"] = final_result
+
+        # Add collected_data extracted from the final_result
+        if "parsed_response" in final_result:
+            task_result["collected_data"] = final_result["parsed_response"]
+        elif "response" in final_result:
+            task_result["collected_data"] = final_result["response"]
+
+    # Store results in the results_store
+    if "results" in task_result:
+        for result in task_result["results"]:
+            if "result_id" in result:
+                store_result(result["result_id"], result)
+            record_act_steps(result.get("metadata", {}).get("num_steps_executed"))
+
+    return task_result
+
+
+def task_failed(task_result: Dict[str, Any]) -> bool:
+    """A task failed if it errored or its final action errored"""
+    if "error" in task_result:
+        return True
+    results = task_result.get("results") or []
+    return not results or "error" in results[-1]
+
+
+def validate_graph(nodes: List[Dict[str, Any]]) -> List[str]:
+    """Check node IDs and dependencies and return a topological order"""
+    ids = [node.get("id") for node in nodes]
+    if any(not isinstance(node_id, str) or not node_id for node_id in ids):
+        raise ValueError("Every node needs a non-empty string 'id'")
+    if len(set(ids)) != len(ids):
+        raise ValueError("Node IDs must be unique")
+
+    dependents = {node_id: [] for node_id in ids}
+    remaining = {}
+    for node in nodes:
+        parents = node.get("depends_on", [])
+        for parent in parents:
+            if parent not in dependents:
+                raise ValueError(f"Node '{node['id']}' depends on unknown node '{parent}'")
+            dependents[parent].append(node["id"])
+        remaining[node["id"]] = len(set(parents))
+
+    # Kahn's algorithm; anything left over is part of a cycle
+    order = [node_id for node_id in ids if remaining[node_id] == 0]
+    for node_id in order:
+        for child in dependents[node_id]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                order.append(child)
+    if len(order) != len(ids):
+        cyclic = sorted(set(ids) - set(order))
+        raise ValueError(f"Task graph has a cycle involving: {', '.join(cyclic)}")
+    return order
+
+
+def lookup_template_path(outputs: Dict[str, Any], path: str) -> Any:
+    """Resolve a dotted path like 'search.collected_data.0.url' in node outputs"""
+    value = outputs
+    for depth, part in enumerate(path.split(".")):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif depth == 1 and isinstance(value, dict) and part in value.get(
+            "final_result", {}
+        ):
+            # Fields of the final action (final_page, response) are shortcuts
+            value = value["final_result"][part]
+        elif isinstance(value, list) and part.lstrip("-").isdigit():
+            value = value[int(part)]
+        else:
+            raise ValueError(f"Template path '{path}' not found in parent outputs")
+    return value
+
+
+def render_template(value: Any, outputs: Dict[str, Any]) -> Any:
+    """Substitute {{node.field}} templates in strings, lists and dicts"""
+    if isinstance(value, dict):
+        return {k: render_template(v, outputs) for k, v in value.items()}
+    if isinstance(value, list):
+        return [render_template(v, outputs) for v in value]
+    if not isinstance(value, str):
+        return value
+
+    # A string that is exactly one template keeps the referenced value's type
+    whole = GRAPH_TEMPLATE_PATTERN.fullmatch(value.strip())
+    if whole:
+        return lookup_template_path(outputs, whole.group(1))
+
+    def replace(match):
+        found = lookup_template_path(outputs, match.group(1))
+        return found if isinstance(found, str) else json.dumps(found, default=str)
+
+    return GRAPH_TEMPLATE_PATTERN.sub(replace, value)
+
+
+async def run_task_graph(
+    nodes: List[Dict[str, Any]],
+    result_dir: str,
+    run_task,
+    max_concurrency: int,
+    max_per_host: int,
+    max_retries: int = 1,
+) -> Dict[str, Any]:
+    """Run a task DAG, submitting each node to the scheduler once all its parents succeed"""
+    validate_graph(nodes)
+    by_id = {node["id"]: node for node in nodes}
+    waiting = {node["id"]: set(node.get("depends_on", [])) for node in nodes}
+    outputs = {}
+    timings = {}
+    completion_order = []
+    running = {}
+    graph_start = time.monotonic()
+
+    def skip_descendants(node_id, reason):
+        for child_id, parents in list(waiting.items()):
+            if node_id in parents:
+                del waiting[child_id]
+                outputs[child_id] = {"error": reason, "skipped": True}
+                timings[child_id] = {"start": None, "end": None}
+                completion_order.append(child_id)
+                skip_descendants(child_id, reason)
+
+    async with BrowserTaskScheduler(
+        result_dir,
+        max_concurrency=max_concurrency,
+        max_per_host=max_per_host,
+        max_retries=max_retries,
+        run_task=run_task,
+    ) as scheduler:
+        while waiting or running:
+            # Hand ready nodes to the scheduler, which applies priority and caps
+            ready = [node_id for node_id, parents in waiting.items() if not parents]
+            for node_id in ready:
+                del waiting[node_id]
+                node = by_id[node_id]
+                try:
+                    task = render_template(
+                        {k: v for k, v in node.items() if k not in ("id", "depends_on")},
+                        outputs,
+                    )
+                except ValueError as e:
+                    outputs[node_id] = {"error": str(e)}
+                    timings[node_id] = {"start": None, "end": None}
+                    completion_order.append(node_id)
+                    skip_descendants(node_id, f"Skipped: dependency '{node_id}' failed")
+                    continue
+
+                timings[node_id] = {"queued": time.monotonic()}
+                running[scheduler.submit(task)] = node_id
+
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                node_id = running.pop(future)
+                task_result = future.result()
+                timing = timings[node_id]
+                timing["end"] = time.monotonic()
+                timing["start"] = min(
+                    timing["end"],
+                    timing["queued"] + task_result["scheduling"]["queued_seconds"],
+                )
+                try:
+                    task_result = finalize_task_result(task_result)
+                except Exception as e:
+                    task_result = {"error": str(e)}
+
+                outputs[node_id] = task_result
+                completion_order.append(node_id)
+
+                if task_failed(task_result):
+                    skip_descendants(node_id, f"Skipped: dependency '{node_id}' failed")
+                else:
+                    for parents in waiting.values():
+                        parents.discard(node_id)
+
+    # Critical path: longest chain of node run times through the DAG
+    finish = {}
+    for node_id in validate_graph(nodes):
+        timing = timings.get(node_id, {})
+        duration = (
+            timing["end"] - timing["start"]
+            if timing.get("start") is not None and timing.get("end") is not None
+            else 0.0
+        )
+        parents = by_id[node_id].get("depends_on", [])
+        finish[node_id] = duration + max((finish[p] for p in parents), default=0.0)
+
+    for node_id, timing in timings.items():
+        if timing.get("start") is not None:
+            outputs[node_id]["timing"] = {
+                "started_seconds": round(timing["start"] - graph_start, 2),
+                "duration_seconds": round(timing["end"] - timing["start"], 2),
+            }
+
+    return {
+        "nodes": outputs,
+        "completion_order": completion_order,
+        "failed_nodes": [
+            node_id for node_id in completion_order if task_failed(outputs[node_id])
+        ],
+        "critical_path_seconds": round(max(finish.values(), default=0.0), 2),
+        "total_seconds": round(time.monotonic() - graph_start, 2),
+    }
+
+
+def track_tool(func):
+    """Record call counts, errors and latency for an async MCP tool"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = False
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with metrics_lock:
+                metrics = tool_metrics.setdefault(
+                    func.__name__,
+                    {
+                        "calls": 0,
+                        "errors": 0,
+                        "latencies": collections.deque(maxlen=METRICS_WINDOW),
+                    },
+                )
+                metrics["calls"] += 1
+                metrics["errors"] += 1 if failed else 0
+                metrics["latencies"].append(elapsed)
+
+    return wrapper
+
+
+def record_act_steps(num_steps: Optional[int]) -> None:
+    """Record the number of steps an act() call executed"""
+    if num_steps is None:
+        return
+    with metrics_lock:
+        act_totals["calls"] += 1
+        act_totals["steps"] += num_steps
+        act_steps.append(num_steps)
+
+
+def percentiles(values, points=(50, 95, 99)) -> Dict[str, float]:
+    """Nearest-rank percentiles of a sequence of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return {f"p{point}": None for point in points}
+    return {
+        f"p{point}": ordered[
+            min(len(ordered) - 1, max(0, -(-point * len(ordered) // 100) - 1))
+        ]
+        for point in points
+    }
+
+
+def process_memory() -> Dict[str, Any]:
+    """RSS of the server process and each child process, in MB"""
+    try:
+        import psutil
+    except ImportError:
+        import resource
+
+        # Without psutil only the server's peak RSS is available (KB on Linux)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"server_peak_rss_mb": round(peak / 1024, 1), "children": []}
+
+    server = psutil.Process()
+    children = []
+    for child in server.children(recursive=True):
+        try:
+            children.append(
+                {
+                    "pid": child.pid,
+                    "name": child.name(),
+                    "rss_mb": round(child.memory_info().rss / (1024 * 1024), 1),
+                }
+            )
+        except psutil.Error:
+            pass
+    return {
+        "server_rss_mb": round(server.memory_info().rss / (1024 * 1024), 1),
+        "children": children,
+        "children_rss_mb": round(sum(c["rss_mb"] for c in children), 1),
+    }
+
+
+def collect_server_stats() -> Dict[str, Any]:
+    """Snapshot of sessions, scheduler occupancy, tool latency and memory"""
+    with session_lock:
+        active_sessions = 1 if nova_act_instance else 0
+
+    with metrics_lock:
+        tools = {
+            name: {
+                "calls": metrics["calls"],
+                "errors": metrics["errors"],
+                **{
+                    f"{key}_ms": round(value * 1000, 1) if value is not None else None
+                    for key, value in percentiles(metrics["latencies"]).items()
+                },
+            }
+            for name, metrics in tool_metrics.items()
+        }
+        steps = {
+            "calls": act_totals["calls"],
+            "total_steps": act_totals["steps"],
+            **percentiles(act_steps),
+        }
+        running = sum(state["running"] for state in active_schedulers)
+        queued = sum(state["queued"] for state in active_schedulers)
+        capacity = sum(state["capacity"] for state in active_schedulers)
+
+    with results_lock:
+        stored_results = len(results_store)
+    with action_cache_lock:
+        cached_sessions = len(action_cache)
+
+    return {
+        "uptime_seconds": round(time.time() - server_started_at, 1),
+        "active_sessions": active_sessions,
+        "parallel_pool": {
+            "running_tasks": running,
+            "queued_tasks": queued,
+            "capacity": capacity,
+            "occupancy": round(running / capacity, 2) if capacity else 0.0,
+        },
+        "tools": tools,
+        "act_steps": steps,
+        "stored_results": stored_results,
+        "cached_sessions": cached_sessions,
+        "memory": process_memory(),
+    }
+
+
+def format_prometheus(stats: Dict[str, Any]) -> str:
+    """Render server stats in the Prometheus text exposition format"""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP nova_act_{name} {help_text}")
+        lines.append(f"# TYPE nova_act_{name} {kind}")
+        for labels, value in samples:
+            if value is None:
+                continue
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"nova_act_{name}{label_text} {value}")
+
+    pool = stats["parallel_pool"]
+    memory = stats["memory"]
+    metric("uptime_seconds", "gauge", "Server uptime", [({}, stats["uptime_seconds"])])
+    metric("active_sessions", "gauge", "Open browser sessions",
+           [({}, stats["active_sessions"])])
+    metric("parallel_running_tasks", "gauge", "Parallel tasks running",
+           [({}, pool["running_tasks"])])
+    metric("parallel_queued_tasks", "gauge", "Parallel tasks waiting to start",
+           [({}, pool["queued_tasks"])])
+    metric("parallel_capacity", "gauge", "Parallel task slots",
+           [({}, pool["capacity"])])
+    metric("tool_calls_total", "counter", "MCP tool calls",
+           [({"tool": name}, t["calls"]) for name, t in stats["tools"].items()])
+    metric("tool_errors_total", "counter", "MCP tool calls that raised",
+           [({"tool": name}, t["errors"]) for name, t in stats["tools"].items()])
+    metric(
+        "tool_latency_ms",
+        "gauge",
+        "MCP tool latency percentiles over the recent window",
+        [
+            # Prometheus quantile labels are fractions: "0.5", "0.95", "0.99"
+            ({"tool": name, "quantile": quantile}, t[f"p{pct}_ms"])
+            for name, t in stats["tools"].items()
+            for quantile, pct in (("0.5", "50"), ("0.95", "95"), ("0.99", "99"))
+        ],
+    )
+    metric("act_calls_total", "counter", "act() calls with step metadata",
+           [({}, stats["act_steps"]["calls"])])
+    metric("act_steps_total", "counter", "Steps executed by act() calls",
+           [({}, stats["act_steps"]["total_steps"])])
+    metric("server_rss_mb", "gauge", "Server process RSS",
+           [({}, memory.get("server_rss_mb", memory.get("server_peak_rss_mb")))])
+    metric(
+        "child_rss_mb",
+        "gauge",
+        "RSS of each child process",
+        [({"pid": c["pid"], "name": c["name"]}, c["rss_mb"]) for c in memory["children"]],
+    )
+    return "\n".join(lines) + "\n"
+
+
 # MCP tools
 @mcp.tool()
+@track_tool
 async def browser_session(
     starting_page: str,
     actions: List[str],
     headless: bool = False,
+    schema: Optional[Dict[str, Any]] = None,
+    use_cache: bool = False,
+    cache_ttl: int = 300,
+    resource_policy: Optional[Dict[str, Any]] = None,
+    storage_state: Optional[str] = None,
+    save_storage_state: Optional[str] = None,
+    storage_state_ttl: int = STORAGE_STATE_TTL,
 ) -> Dict[str, Any]:
     """Start a browser and perform a sequence of actions in a single command.
 
@@ -191,12 +1958,51 @@ async def browser_session(
     - Nova Act cannot interact with browser windows/modals
     - Nova Act works best with short, specific instructions
 
+    Options:
+    - schema: JSON schema applied to the final (extraction) action
+    - use_cache: reuse the stored result of an identical read-only session run
+      within cache_ttl seconds instead of driving the browser again. Sessions with
+      mutating actions (buy, submit, log in, add to cart, ...) are never cached.
+    - resource_policy: block heavy or third-party requests for this session, e.g.
+      {"preset": "extraction"} (images, media, fonts and trackers), or
+      {"block_resource_types": ["image", "font"], "block_domains": ["ads.example.com"]}.
+      Each action then reports requests blocked, bytes loaded, estimated bytes
+      saved and page load time under "network".
+    - save_storage_state: after all actions succeed (e.g. a login flow), save the
+      browser's cookies and localStorage under this name for storage_state_ttl
+      seconds (default: 24 hours)
+    - storage_state: start the session with a previously saved storage state, so
+      logged-in flows can skip the login steps
+
         This function returns a structured response with:
         - starting_page: The URL where the browser started
         - collected_data: The parsed response data
+        - cache: Whether the result was served from the cache (when use_cache is set)
+        - saved_storage_state: Summary of the saved state (when save_storage_state is set)
     """
     global nova_act_instance
 
+    cache_key = None
+    cache_info = None
+    if use_cache:
+        if storage_state or save_storage_state:
+            # Logged-in results are per account and must not be shared
+            cache_info = {"hit": False, "reason": "sessions with storage state are not cached"}
+        elif actions and all(is_cacheable_action(action) for action in actions):
+            cache_key = action_cache_key(starting_page, actions, schema, headless)
+            entry = get_cached_session(cache_key)
+            if entry:
+                response = dict(entry["response"])
+                response["cache"] = {
+                    "hit": True,
+                    "cached_at": datetime.fromtimestamp(entry["cached_at"]).isoformat(),
+                    "age_seconds": round(time.time() - entry["cached_at"], 1),
+                }
+                return response
+            cache_info = {"hit": False}
+        else:
+            cache_info = {"hit": False, "reason": "actions are not cacheable"}
+
     # Close any existing browser session
     with session_lock:
         if nova_act_instance:
@@ -219,15 +2025,23 @@ async def browser_session(
                 starting_page=starting_page,
                 headless=headless,
             ) as nova_act:
+                blocker = prepare_session(nova_act, resource_policy, storage_state)
+
                 # Keep a reference to the nova_act instance
                 with session_lock:
-                    global nova_act_instance
+                    global nova_act_instance, session_blocker
                     nova_act_instance = nova_act
+                    session_blocker = blocker
 
                 # Execute each action in sequence
                 for i, action_text in enumerate(actions):
                     try:
-                        result = nova_act.act(action_text)
+                        kwargs = {}
+                        if schema and i == len(actions) - 1:
+                            kwargs["schema"] = schema
+                        result = nova_act.act(action_text, **kwargs)
+                        if hasattr(result, "metadata"):
+                            record_act_steps(result.metadata.num_steps_executed)
 
                         # Store the result
                         result_id = generate_id("result")
@@ -264,8 +2078,10 @@ async def browser_session(
                             ),
                         }
 
-                        with results_lock:
-                            results_store[result_id] = result_data
+                        if blocker:
+                            result_data["network"] = blocker.take_stats(nova_act.page)
+
+                        store_result(result_id, result_data)
 
                         # Store action result
                         result_item = {
@@ -290,6 +2106,8 @@ async def browser_session(
                                 else None
                             ),
                         }
+                        if blocker:
+                            result_item["network"] = result_data["network"]
 
                         results.append(result_item)
 
@@ -306,13 +2124,21 @@ async def browser_session(
                         if i == len(actions) - 1:
                             final_response = error_result
 
+                # Snapshot the logged-in state before the browser closes
+                saved_state = None
+                if save_storage_state and task_succeeded(results):
+                    saved_state = save_storage_state_to_file(
+                        nova_act, save_storage_state, storage_state_ttl
+                    )
+
             # Do not close the browser here - leave it open for further interaction
             # The context manager will have stopped the browser when exiting
             with session_lock:
                 nova_act_instance = None
+                session_blocker = None
 
             # Return a structured response with both complete results and the final response
-            return {
+            response = {
                 "starting_page": starting_page,
                 "all_results": results,
                 "final_result": final_response,
@@ -320,15 +2146,29 @@ async def browser_session(
                     "parsed_response", final_response.get("response", None)
                 ),
             }
+            if saved_state:
+                response["saved_storage_state"] = saved_state
+            return response
         except Exception as e:
             with session_lock:
                 nova_act_instance = None
+                session_blocker = None
             return {"error": str(e)}
 
-    return await asyncio.to_thread(run_browser_session)
+    response = await asyncio.to_thread(run_browser_session)
+
+    if cache_info is not None:
+        # Only cache complete, error-free runs
+        if cache_key and "error" not in response and not any(
+            "error" in item for item in response.get("all_results", [])
+        ):
+            put_cached_session(cache_key, response, cache_ttl)
+        response["cache"] = cache_info
+    return response
 
 
 @mcp.tool()
+@track_tool
 async def browser_action(
     action: str,
     schema: Optional[Dict[str, Any]] = None,
@@ -341,6 +2181,7 @@ async def browser_action(
         if not nova_act_instance:
             raise ValueError("Browser session not started. Use browser_session first.")
         act = nova_act_instance
+        blocker = session_blocker
 
     # Execute the action in a separate thread
     def execute_action():
@@ -352,6 +2193,8 @@ async def browser_action(
                 kwargs["max_steps"] = max_steps
 
             result = act.act(action, **kwargs)
+            if hasattr(result, "metadata"):
+                record_act_steps(result.metadata.num_steps_executed)
 
             # Store the result
             result_id = generate_id("result")
@@ -383,10 +2226,12 @@ async def browser_action(
                 ),
             }
 
-            with results_lock:
-                results_store[result_id] = result_data
+            if blocker:
+                result_data["network"] = blocker.take_stats(act.page)
+
+            store_result(result_id, result_data)
 
-            return {
+            response = {
                 "result_id": result_id,
                 "final_page": act.page.url,
                 "response": result.response,
@@ -402,6 +2247,9 @@ async def browser_action(
                     result.matches_schema if hasattr(result, "matches_schema") else None
                 ),
             }
+            if blocker:
+                response["network"] = result_data["network"]
+            return response
         except Exception as e:
             print(f"Error executing action: {e}")
             raise
@@ -410,8 +2258,16 @@ async def browser_action(
 
 
 @mcp.tool()
+@track_tool
 async def execute_parallel_browser_tasks(
     browser_tasks: List[Dict[str, Any]],
+    max_concurrency: int = PARALLEL_MAX_CONCURRENCY,
+    max_per_host: int = PARALLEL_MAX_PER_HOST,
+    max_retries: int = 1,
+    execution_mode: str = "isolated",
+    lean_workers: int = LEAN_WORKERS,
+    adaptive_concurrency: bool = False,
+    host_min_interval: float = HOST_MIN_START_INTERVAL,
 ) -> List[Dict[str, Any]]:
     """Execute multiple sequences of actions in parallel across different browser sessions.
 
@@ -446,85 +2302,82 @@ async def execute_parallel_browser_tasks(
 
     Browser configuration options:
     - headless: Run browsers without visible UI (default: False)
-    - user_data_dir: Path to browser profile (note: each session requires its own)
+    - user_data_dir: Path to browser profile (note: each session requires its own;
+      prefer storage_state for sharing a login)
     - quiet: Suppress logs (default: False)
+    - priority: "high", "normal" (default), "low" or an integer; higher runs first
+    - resource_policy: block heavy requests, e.g. {"preset": "extraction"}
+      (see browser_session); each action then reports "network" stats
+    - storage_state: name of a saved storage state (cookies/localStorage) to start
+      logged in, e.g. one saved by browser_session's save_storage_state
+    - save_storage_state / storage_state_ttl: save this task's storage state under
+      a name after all its actions succeed
+
+    Scheduling options:
+    - max_concurrency: Maximum browsers running at once across all tasks
+    - max_per_host: Maximum browsers running at once against the same site
+    - max_retries: Times to retry a task that looks blocked (CAPTCHA, 429, ...)
+      after backing off from that site
+    - execution_mode: "isolated" (default) starts a fresh process and browser per
+      task. "lean" runs tasks on lean_workers long-lived worker processes that
+      each keep one browser and clear cookies and storage between tasks, which
+      uses far less memory at the cost of at most lean_workers tasks at once.
+    - adaptive_concurrency: Start with a few browsers and add more while tasks
+      stay fast and successful, halving on failures or slowdowns (max_concurrency
+      stays the upper bound)
+    - host_min_interval: Seconds between task starts on the same site (default:
+      0, so only max_per_host limits them)
 
     IMPORTANT NOTES:
     - Each task runs in its own isolated browser - they cannot interact with each other
-    - For authentication, each session needs its own user_data_dir
+    - For authentication, log in once with save_storage_state and pass the saved
+      name as storage_state to each task instead of juggling user_data_dir profiles
     - Nova Act cannot interact with elements hidden behind mouseovers
     - Data extraction works best with clear schemas
 
         Returns a list of task results, each containing:
         - starting_page: The URL where the browser started
         - final_result: The result of the last action (usually the most relevant)
+        - scheduling: Host, attempts, time spent queued and in total, and the
+          concurrency limit when the task started
     """
 
     # Create a temporary directory for result files
     temp_dir = tempfile.mkdtemp(prefix="nova_act_results_")
 
-    # Prepare processes for each task
-    processes = []
-    result_files = []
-
-    for i, task in enumerate(browser_tasks):
-        # Create a file to store the result
-        result_file = os.path.join(temp_dir, f"task_{i}_result.json")
-        result_files.append(result_file)
-
-        # Create and start a new process for this task
-        process = multiprocessing.Process(
-            target=execute_nova_act_task, args=(task, result_file)
-        )
-        processes.append(process)
-        process.start()
-
-    # Wait for all processes to complete
-    for process in processes:
-        process.join()
+    run_task, max_concurrency = select_task_runner(
+        execution_mode, lean_workers, max_concurrency
+    )
+
+    controller = None
+    if adaptive_concurrency:
+        controller = AdaptiveConcurrency(max_concurrency, name="parallel tasks")
+
+    # Run tasks through the scheduler instead of starting them all at once
+    task_results = await schedule_browser_tasks(
+        browser_tasks,
+        temp_dir,
+        max_concurrency=max_concurrency,
+        max_per_host=max(1, max_per_host),
+        max_retries=max(0, max_retries),
+        run_task=run_task,
+        controller=controller,
+        host_min_interval=max(0.0, host_min_interval),
+    )
 
     # Collect results
     all_results = []
 
-    for result_file in result_files:
+    for task_result in task_results:
         try:
-            if os.path.exists(result_file):
-                with open(result_file, "r") as f:
-                    task_result = json.load(f)
-
-                # Process the task result to add final_result and collected_data
-                if "results" in task_result and task_result["results"]:
-                    # Get the last result (final action)
-                    final_result = task_result["results"][-1]
-
-                    # Add final_result to the task_result
-                    task_result["final_result"] = final_result
-
-                    # Add collected_data extracted from the final_result
-                    if "parsed_response" in final_result:
-                        task_result["collected_data"] = final_result["parsed_response"]
-                    elif "response" in final_result:
-                        task_result["collected_data"] = final_result["response"]
-
-                all_results.append(task_result)
-
-                # Store results in the results_store
-                if "results" in task_result:
-                    with results_lock:
-                        for result in task_result["results"]:
-                            if "result_id" in result:
-                                results_store[result["result_id"]] = result
-
-            all_results.append({"error": "Result file not found"})
-
+            all_results.append(finalize_task_result(task_result))
         except Exception as e:
             all_results.append({"error": str(e)})
 
     # Clean up temporary files
     try:
-        for file in result_files:
-            if os.path.exists(file):
-                os.remove(file)
+        for file in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, file))
         os.rmdir(temp_dir)
     except Exception as e:
         raise ValueError(f"Error cleaning up temporary files: {e}")
@@ -533,6 +2386,129 @@ async def execute_parallel_browser_tasks(
 
 
 @mcp.tool()
+@track_tool
+async def run_browser_graph(
+    nodes: List[Dict[str, Any]],
+    max_concurrency: int = PARALLEL_MAX_CONCURRENCY,
+    max_per_host: int = PARALLEL_MAX_PER_HOST,
+    max_retries: int = 1,
+    execution_mode: str = "lean",
+    lean_workers: int = LEAN_WORKERS,
+) -> Dict[str, Any]:
+    """Run a multi-stage browser workflow as a task graph in one call.
+
+    USE THIS TOOL when some browser tasks depend on the output of others, e.g.
+    search three sites in parallel, then visit the top result of each, then
+    compare. Nodes run as soon as all their parents have finished, and
+    independent nodes run concurrently on pooled browsers.
+
+    Each node is a browser task (same fields as execute_parallel_browser_tasks)
+    plus:
+    - id: Unique node name
+    - depends_on: List of parent node IDs (optional)
+
+    Strings in starting_page and actions may reference parent outputs with
+    {{node_id.field}} templates, using dotted paths for nested values:
+    - {{search.final_page}}: URL the parent finished on
+    - {{search.collected_data}}: Parent's extracted data (JSON-encoded if not text)
+    - {{search.collected_data.0.url}}: A field of the first extracted item
+
+    Example:
+    [
+      {"id": "search", "starting_page": "https://www.amazon.com",
+       "actions": ["Search for backpack",
+                   {"action": "Return the URL of the first result",
+                    "schema": {"type": "object", "properties": {"url": {"type": "string"}}}}]},
+      {"id": "details", "depends_on": ["search"],
+       "starting_page": "{{search.collected_data.url}}",
+       "actions": ["Return the price and rating"]}
+    ]
+
+    Nodes are scheduled like execute_parallel_browser_tasks: max_concurrency and
+    max_per_host cap running browsers, and a node that looks blocked is retried
+    up to max_retries times after backing off from that site. If a node fails,
+    nodes that depend on it are skipped.
+
+    Returns:
+    - nodes: Result for each node ID (same shape as execute_parallel_browser_tasks)
+    - completion_order: Node IDs in the order they finished
+    - failed_nodes: Nodes that failed or were skipped
+    - critical_path_seconds / total_seconds: Longest dependency chain and wall time
+    """
+    run_task, max_concurrency = select_task_runner(
+        execution_mode, lean_workers, max_concurrency
+    )
+    temp_dir = tempfile.mkdtemp(prefix="nova_act_graph_")
+
+    try:
+        return await run_task_graph(
+            nodes,
+            temp_dir,
+            run_task,
+            max_concurrency=max_concurrency,
+            max_per_host=max(1, max_per_host),
+            max_retries=max(0, max_retries),
+        )
+    finally:
+        for file in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, file))
+        os.rmdir(temp_dir)
+
+
+@mcp.tool()
+@track_tool
+async def list_storage_states() -> List[Dict[str, Any]]:
+    """List saved browser storage states and when they expire"""
+
+    def read_states():
+        states = []
+        if not os.path.isdir(STORAGE_STATE_DIR):
+            return states
+        for file_name in sorted(os.listdir(STORAGE_STATE_DIR)):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(STORAGE_STATE_DIR, file_name), "r") as f:
+                    snapshot = json.load(f)
+                state = snapshot["state"]
+                states.append(
+                    {
+                        "name": snapshot.get("name", file_name[:-5]),
+                        "saved_at": datetime.fromtimestamp(
+                            snapshot["saved_at"]
+                        ).isoformat(),
+                        "expires_at": datetime.fromtimestamp(
+                            snapshot["expires_at"]
+                        ).isoformat(),
+                        "expired": snapshot["expires_at"] <= time.time(),
+                        "cookies": len(state.get("cookies", [])),
+                        "origins": [o["origin"] for o in state.get("origins", [])],
+                    }
+                )
+            except Exception as e:
+                # One unreadable or hand-edited snapshot shouldn't hide the rest
+                print(
+                    f"Skipping malformed storage state {file_name}: {e!r}",
+                    file=sys.stderr,
+                )
+        return states
+
+    return await asyncio.to_thread(read_states)
+
+
+@mcp.tool()
+@track_tool
+async def delete_storage_state(name: str) -> bool:
+    """Delete a saved browser storage state"""
+    path = storage_state_path(name)
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
+
+
+@mcp.tool()
+@track_tool
 async def list_results() -> List[Dict[str, Any]]:
     """List all stored results"""
     result_infos = []
@@ -549,6 +2525,7 @@ async def list_results() -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
+@track_tool
 async def get_result(result_id: str) -> Dict[str, Any]:
     """Get a specific result by ID"""
     with results_lock:
@@ -558,16 +2535,69 @@ async def get_result(result_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-async def save_results(file_path: str, result_ids: Optional[List[str]] = None) -> bool:
-    """Save results to a file"""
-    return save_results_to_file(file_path, result_ids)
+@track_tool
+async def save_results(
+    file_path: str,
+    result_ids: Optional[List[str]] = None,
+    format: str = "json",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    incremental: bool = False,
+) -> bool:
+    """Save results to a file
+
+    - format: "json" (single document), "ndjson" (one result per line) or "parquet"
+    - since / until: ISO 8601 timestamps limiting results by when they were stored
+    - result_ids: results to export; omitted or empty exports every result
+    - incremental: only export results stored since the last incremental export to
+      the same file (ndjson appends lines; parquet writes a new part file into the
+      file_path directory). After a server restart the export resumes after the
+      newest stored_at already in the file.
+    """
+    return await asyncio.to_thread(
+        save_results_to_file, file_path, result_ids, format, since, until, incremental
+    )
 
 
 @mcp.tool()
-async def take_screenshot(save_path: Optional[str] = None) -> str:
-    """Take a screenshot in the browser session"""
+@track_tool
+async def take_screenshot(
+    save_path: Optional[str] = None,
+    image_format: str = "png",
+    quality: int = 80,
+    scale: float = 1.0,
+    full_page: bool = False,
+    selector: Optional[str] = None,
+    skip_if_unchanged: bool = False,
+    hash_threshold: int = 4,
+) -> str:
+    """Take a screenshot in the browser session
+
+    Options:
+    - image_format: "png", "jpeg" or "webp" (jpeg/webp are much smaller for vision models)
+    - quality: 1-100, used for jpeg and webp
+    - scale: downscale factor between 0 and 1 (e.g. 0.5 halves width and height)
+    - full_page: capture the whole scrollable page instead of the viewport
+    - selector: CSS selector of an element to clip the screenshot to
+    - skip_if_unchanged: if the frame is near-identical to the previous screenshot
+      taken with the same format, quality and scale, skip re-encoding it: return
+      the previous file, or hard-link (or copy) it to save_path if one is given
+    - hash_threshold: max perceptual-hash distance (0-64) treated as "unchanged"
+
+    Returns the path of the saved screenshot.
+    """
     global nova_act_instance
 
+    image_format = image_format.lower()
+    if image_format not in SCREENSHOT_FORMATS:
+        raise ValueError(
+            f"Unsupported image_format '{image_format}'. Use one of: png, jpeg, webp"
+        )
+    if not 0 < scale <= 1:
+        raise ValueError("scale must be greater than 0 and at most 1")
+    if not 1 <= quality <= 100:
+        raise ValueError("quality must be between 1 and 100")
+
     with session_lock:
         if not nova_act_instance:
             raise ValueError("Browser session not started. Use browser_session first.")
@@ -575,27 +2605,29 @@ async def take_screenshot(save_path: Optional[str] = None) -> str:
 
     # Take screenshot in a separate thread
     def capture_screenshot():
-        try:
-            screenshot_bytes = act.page.screenshot()
-            if save_path:
-                os.makedirs(os.path.dirname(os.path.abspath(save_path)), exist_ok=True)
-                with open(save_path, "wb") as f:
-                    f.write(screenshot_bytes)
-                return save_path
-            else:
-                import tempfile
-
-                temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-                temp_file.write(screenshot_bytes)
-                temp_file.close()
-                return temp_file.name
-        except Exception as e:
-            raise
-
-    return await asyncio.to_thread(capture_screenshot)
+        if selector:
+            return act.page.locator(selector).first.screenshot()
+        return act.page.screenshot(full_page=full_page)
+
+    screenshot_bytes = await asyncio.to_thread(capture_screenshot)
+
+    # Encode and write the screenshot in the worker pool
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        screenshot_executor,
+        encode_and_save_screenshot,
+        screenshot_bytes,
+        save_path,
+        image_format,
+        quality,
+        scale,
+        skip_if_unchanged,
+        hash_threshold,
+    )
 
 
 @mcp.tool()
+@track_tool
 async def close_browser() -> bool:
     """Close the browser session"""
     global nova_act_instance
@@ -624,6 +2656,26 @@ async def close_browser() -> bool:
         return False
 
 
+@mcp.tool()
+@track_tool
+async def server_stats(format: str = "json") -> Union[Dict[str, Any], str]:
+    """Report server health and performance metrics
+
+    Includes active browser sessions, parallel task pool occupancy and queue
+    length, per-tool call counts and p50/p95/p99 latency, act() step counts, and
+    the RSS of the server and each child browser process.
+
+    - format: "json" for a structured report or "prometheus" for the Prometheus
+      text exposition format
+    """
+    stats = await asyncio.to_thread(collect_server_stats)
+    if format == "prometheus":
+        return format_prometheus(stats)
+    if format != "json":
+        raise ValueError("format must be 'json' or 'prometheus'")
+    return stats
+
+
 # Run the server when the script is executed directly
 if __name__ == "__main__":
     # Register multiprocessing start method
@@ -633,6 +2685,10 @@ if __name__ == "__main__":
     import atexit
 
     def cleanup():
+        # Stop lean worker processes and their browsers
+        if lean_pool is not None:
+            lean_pool.shutdown(wait=False, cancel_futures=True)
+
         # Close the browser session if it exists
         global nova_act_instance
         if nova_act_instance:
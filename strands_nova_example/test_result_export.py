@@ -0,0 +1,96 @@
+"""Tests for incremental result exports in nova_act_mcp_server.py
+
+Run with: NOVA_ACT_BACKEND=fake python -m pytest test_result_export.py
+"""
+
+import json
+import os
+
+os.environ.setdefault("NOVA_ACT_BACKEND", "fake")
+
+import pytest  # noqa: E402
+
+import nova_act_mcp_server as server  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    """Start each test with an empty results store and no export cursors"""
+    for state in (
+        server.results_store,
+        server.results_seq,
+        server.results_times,
+        server.results_order,
+        server.export_cursors,
+    ):
+        state.clear()
+    yield
+
+
+def store(*result_ids):
+    for result_id in result_ids:
+        server.store_result(result_id, {"action": f"action {result_id}"})
+
+
+def ndjson_ids(path):
+    with open(path) as f:
+        return [json.loads(line)["result_id"] for line in f]
+
+
+def parquet_ids(path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    return pq.read_table(str(path), columns=["result_id"]).column("result_id").to_pylist()
+
+
+def test_full_then_incremental_ndjson_has_no_duplicates(tmp_path):
+    path = tmp_path / "results.ndjson"
+    store("a", "b", "c")
+
+    assert server.save_results_to_file(str(path), export_format="ndjson")
+    assert server.save_results_to_file(str(path), export_format="ndjson", incremental=True)
+    assert ndjson_ids(path) == ["a", "b", "c"]
+
+    store("d")
+    assert server.save_results_to_file(str(path), export_format="ndjson", incremental=True)
+    assert ndjson_ids(path) == ["a", "b", "c", "d"]
+
+
+def test_incremental_ndjson_resumes_after_restart(tmp_path):
+    path = tmp_path / "results.ndjson"
+    store("a", "b", "c")
+    assert server.save_results_to_file(str(path), export_format="ndjson", incremental=True)
+
+    # A restarted server has neither the old results nor the cursor
+    server.results_store.clear()
+    server.results_seq.clear()
+    server.results_times.clear()
+    server.results_order.clear()
+    server.export_cursors.clear()
+    store("d", "e")
+
+    assert server.save_results_to_file(str(path), export_format="ndjson", incremental=True)
+    assert ndjson_ids(path) == ["a", "b", "c", "d", "e"]
+
+
+def test_incremental_parquet_has_no_duplicates(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "dataset"
+    store("a", "b", "c")
+
+    assert server.save_results_to_file(str(path), export_format="parquet", incremental=True)
+    server.export_cursors.clear()
+    assert server.save_results_to_file(str(path), export_format="parquet", incremental=True)
+    assert sorted(parquet_ids(path)) == ["a", "b", "c"]
+
+    store("d")
+    assert server.save_results_to_file(str(path), export_format="parquet", incremental=True)
+    assert sorted(parquet_ids(path)) == ["a", "b", "c", "d"]
+
+
+def test_empty_result_ids_exports_everything(tmp_path):
+    path = tmp_path / "results.json"
+    store("a", "b")
+
+    assert server.save_results_to_file(str(path), result_ids=[])
+    with open(path) as f:
+        assert list(json.load(f)) == ["a", "b"]
@@ -0,0 +1,63 @@
+"""
+Check the GameFAQs HTTP fast path against the fixture pages
+
+Parses the synthetic system pages in fixtures/gamefaqs with the same code
+the app uses (fetch_top_games_http with GAMEFAQS_FIXTURE_DIR set) and checks
+the titles, ratings and order of the top games list.
+
+Usage:
+    python check_gamefaqs_fixtures.py
+"""
+
+import os
+
+os.environ["GAMEFAQS_FIXTURE_DIR"] = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "gamefaqs"
+)
+
+import video_game_research_st as app  # noqa: E402
+
+EXPECTED = {
+    # ps5.html uses a list layout with new releases before the top games
+    "PlayStation 5": [
+        ("Elden Ring", 4.62),
+        ("Astro Bot", 4.58),
+        ("Baldur's Gate 3", 4.55),
+        ("Final Fantasy VII Rebirth", 4.41),
+        ("Marvel's Spider-Man 2", 4.33),
+        ("Stellar Blade", 4.21),
+        ("God of War Ragnarök", 4.49),
+        ("Returnal", 4.12),
+        ("Metaphor: ReFantazio", 4.47),
+        ("Ratchet & Clank: Rift Apart", 4.25),
+    ],
+    # switch.html uses a table layout
+    "Nintendo Switch": [
+        ("The Legend of Zelda: Tears of the Kingdom", 4.71),
+        ("Super Mario Bros. Wonder", 4.52),
+        ("The Legend of Zelda: Breath of the Wild", 4.68),
+        ("Xenoblade Chronicles 3", 4.5),
+        ("Metroid Dread", 4.44),
+        ("Super Mario Odyssey", 4.49),
+        ("Animal Crossing: New Horizons", 4.2),
+        ("Fire Emblem Engage", 4.16),
+    ],
+}
+
+
+def main():
+    for system, expected in EXPECTED.items():
+        games = app.fetch_top_games_http(system, num_games=len(expected))
+        assert games, f"no top games parsed for {system}"
+        found = [(game.title, game.rating) for game in games]
+        assert found == expected, f"{system}: expected {expected}, got {found}"
+        assert all(game.system == system for game in games)
+
+        # Only the requested number of games is returned
+        first = app.fetch_top_games_http(system, num_games=3)
+        assert [game.title for game in first] == [title for title, _ in expected[:3]]
+        print(f"OK: {system} ({len(games)} games)")
+
+
+if __name__ == "__main__":
+    main()
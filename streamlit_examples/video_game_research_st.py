@@ -1,12 +1,25 @@
+import collections
 import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import io
 import json
 import os
+import queue
+import re
+import shutil
+import sqlite3
+import threading
 import time
 import uuid
 from datetime import datetime
+from html.parser import HTMLParser
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 
 import pandas as pd
+import requests
 import streamlit as st
 from nova_act import NovaAct
 from pydantic import BaseModel
@@ -35,17 +48,266 @@ class GameSearchResults(BaseModel):
 # Create searches directory if it doesn't exist
 os.makedirs("game_searches", exist_ok=True)
 
+# GameFAQs system pages with a server-rendered top games list, read over
+# HTTP before falling back to the browser
+GAMEFAQS_URL = "https://gamefaqs.gamespot.com"
+GAMEFAQS_SYSTEM_SLUGS = {
+    "PlayStation 5": "ps5",
+    "PlayStation 4": "ps4",
+    "Xbox Series X": "xbox-series-x",
+    "Nintendo Switch": "switch",
+    "PC": "pc",
+}
+GAMEFAQS_TIMEOUT = 10
+
+# Directory of saved system pages (<slug>.html) to read instead of GameFAQs
+GAMEFAQS_FIXTURE_DIR = os.getenv("GAMEFAQS_FIXTURE_DIR")
+
+# Ranks extracted per GameFAQs act() call in pipelined mode
+PIPELINE_BATCH_SIZE = 2
+
+# Index of all runs, so browsing doesn't parse every run's metadata.json
+MANIFEST_PATH = os.path.join("game_searches", "manifest.sqlite")
+
+# Parquet dataset of prices from every run, partitioned by system and month
+PRICE_HISTORY_DIR = os.path.join("game_searches", "price_history")
+PRICE_HISTORY_MARKER = os.path.join(PRICE_HISTORY_DIR, "_updated")
+
+# How long Amazon results from previous runs are reused, in hours
+AMAZON_CACHE_TTL_HOURS = 24
+
+# GameInfo fields that come from the Amazon lookup
+AMAZON_FIELDS = ("amazon_url", "amazon_price", "description")
+
+# Screenshot artifacts: WebP quality, thumbnail width and disk budgets
+ARTIFACT_WEBP_QUALITY = 80
+ARTIFACT_THUMBNAIL_WIDTH = 320
+ARTIFACT_RUN_BUDGET_MB = 50
+ARTIFACT_TOTAL_BUDGET_MB = 1000
+
+# Amazon browsers are reused by a worker for this many games, then restarted
+AMAZON_URL = "https://www.amazon.com"
+AMAZON_BROWSER_MAX_USES = 10
+
+# Adaptive Amazon concurrency: start here, add one browser per healthy window
+# and halve on failures or lookups this many times slower than usual
+ADAPTIVE_INITIAL_CONCURRENCY = 2
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+
+
+# Links to game pages look like /ps5/257853-elden-ring
+GAME_LINK_PATTERN = re.compile(
+    r"^(?:https?://gamefaqs\.gamespot\.com)?/[a-z0-9-]+/\d+-[^/?#]+/?$"
+)
+TOP_LIST_PATTERN = re.compile(r"(?<![a-z])top(?![a-z])", re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+
+class TopGamesParser(HTMLParser):
+    """
+    Streaming parser for the ranked top games list on a GameFAQs system page
+
+    Collects rows (tr/li) that link to a game page, grouped by their
+    enclosing table or list. The first group marked as a top list, by its
+    class/id or the heading before it, becomes the result and parsing stops.
+    """
+
+    CONTAINERS = ("table", "ol", "ul")
+    ROWS = ("tr", "li")
+    HEADINGS = ("h1", "h2", "h3", "h4")
+
+    def __init__(self, num_games):
+        super().__init__(convert_charrefs=True)
+        self.num_games = num_games
+        self.containers = []
+        self.row = None
+        self.field = None
+        self.in_link = False
+        self.heading = None
+        self.last_heading = ""
+        self.games = None
+
+    @property
+    def done(self):
+        return self.games is not None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = dict(attrs)
+        marker = f"{attrs.get('class', '')} {attrs.get('id', '')}"
+
+        if tag in self.HEADINGS:
+            self.heading = []
+        elif tag in self.CONTAINERS:
+            self.containers.append(
+                {
+                    "tag": tag,
+                    "top": bool(TOP_LIST_PATTERN.search(marker))
+                    or bool(TOP_LIST_PATTERN.search(self.last_heading)),
+                    "rows": [],
+                }
+            )
+            self.last_heading = ""
+        elif tag in self.ROWS and self.containers:
+            self.row = {"title": None, "fields": []}
+        elif self.row is not None:
+            if tag == "a" and GAME_LINK_PATTERN.match(attrs.get("href", "")):
+                if self.row["title"] is None:
+                    self.in_link = True
+                    self.row["title"] = ""
+            elif attrs.get("class"):
+                self.field = [attrs["class"].lower(), ""]
+                self.row["fields"].append(self.field)
+
+    def handle_data(self, data):
+        if self.heading is not None:
+            self.heading.append(data)
+        if self.row is None:
+            return
+        if self.in_link:
+            self.row["title"] += data
+        elif self.field is not None:
+            self.field[1] += data
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag in self.HEADINGS and self.heading is not None:
+            self.last_heading = "".join(self.heading)
+            self.heading = None
+        elif tag == "a":
+            self.in_link = False
+        elif tag in self.ROWS and self.row is not None:
+            if self.row["title"] and self.row["title"].strip():
+                self.containers[-1]["rows"].append(self.row)
+            self.row = None
+            self.field = None
+        elif tag in self.CONTAINERS and self.containers:
+            container = self.containers.pop()
+            if container["top"] and container["rows"]:
+                self.games = container["rows"][: self.num_games]
+        elif self.row is not None:
+            self.field = None
+
+
+# Turn parsed rows into GameInfo using the class names of their cells
+def top_games_from_rows(rows, system):
+    games = []
+    for row in rows:
+        info = {"title": " ".join(row["title"].split()), "system": system}
+        for css_class, text in row["fields"]:
+            text = " ".join(text.split())
+            if not text:
+                continue
+            if "rating" in css_class or "score" in css_class:
+                number = NUMBER_PATTERN.search(text)
+                if number and "rating" not in info:
+                    info["rating"] = float(number.group())
+            elif "date" in css_class or "release" in css_class:
+                info.setdefault("release_date", text)
+            elif "genre" in css_class:
+                info.setdefault("genre", text)
+            elif "developer" in css_class or "publisher" in css_class:
+                info.setdefault("developer", text)
+        games.append(GameInfo.model_validate(info))
+    return games
+
+
+# Pooled HTTP connections for GameFAQs, shared by every research thread
+gamefaqs_session = requests.Session()
+gamefaqs_session.headers["User-Agent"] = "Mozilla/5.0 (video game research tool)"
+gamefaqs_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10)
+)
+
+
+def read_system_page(slug):
+    """Yield the HTML of a GameFAQs system page in chunks as it downloads"""
+    if GAMEFAQS_FIXTURE_DIR:
+        with open(os.path.join(GAMEFAQS_FIXTURE_DIR, f"{slug}.html"), "r") as f:
+            while True:
+                chunk = f.read(16384)
+                if not chunk:
+                    return
+                yield chunk
+
+    with gamefaqs_session.get(
+        f"{GAMEFAQS_URL}/{slug}", stream=True, timeout=GAMEFAQS_TIMEOUT
+    ) as response:
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        yield from response.iter_content(16384, decode_unicode=True)
+
+
+# Read the top games list over HTTP without starting a browser
+def fetch_top_games_http(system, num_games=5):
+    """
+    Returns the top games parsed from the system page, or None if the page
+    can't be fetched or has no recognizable top games list
+    """
+    slug = GAMEFAQS_SYSTEM_SLUGS.get(system)
+    if not slug:
+        return None
+
+    parser = TopGamesParser(num_games)
+    try:
+        # Stop downloading as soon as the list has been parsed
+        for chunk in read_system_page(slug):
+            parser.feed(chunk)
+            if parser.done:
+                break
+        parser.close()
+    except Exception as exc:
+        print(f"GameFAQs HTTP fetch for {system} failed: {exc}")
+        return None
+
+    if not parser.done:
+        return None
+
+    try:
+        return top_games_from_rows(parser.games, system)
+    except Exception as exc:
+        print(f"Could not parse GameFAQs top games for {system}: {exc}")
+        return None
+
 
 # Function to find top games for a system from GameFAQs
-def find_top_games(system, num_games=5, headless=False, status_update_callback=None):
+def find_top_games(
+    system,
+    num_games=5,
+    headless=False,
+    status_update_callback=None,
+    on_game=None,
+    batch_size=None,
+    fast_path=True,
+):
     """
     Find the top N games for a specified system on GameFAQs
+
+    With fast_path, the list is first read from the system page over HTTP
+    and the browser is only used if that fails. In the browser flow, if
+    batch_size is set, games are extracted a few ranks at a time and each
+    game is passed to on_game as soon as its batch is parsed, so later stages
+    can start before the whole list is known.
     """
     if status_update_callback:
         status_update_callback(
             f"Searching for top {num_games} games for {system} on GameFAQs..."
         )
 
+    if fast_path:
+        games = fetch_top_games_http(system, num_games)
+        if games:
+            for game in games:
+                if on_game:
+                    on_game(game)
+            if status_update_callback:
+                status_update_callback(
+                    f"Found {len(games)} games for {system} (read over HTTP)"
+                )
+            return games
+
     with NovaAct(
         starting_page="https://gamefaqs.gamespot.com/games/systems", headless=headless
     ) as n:
@@ -56,25 +318,40 @@ def find_top_games(system, num_games=5, headless=False, status_update_callback=N
 
         n.act("Scroll down to view the list of top games")
 
-        # Extract the top N games
-        result = n.act(
-            f"Extract information for the top {num_games} games from this list. For each game, include the title, release date, genre, and rating if available.",
-            schema={"type": "array", "items": GameInfo.model_json_schema()},
-        )
+        # Extract the top N games, in rank batches when pipelining
+        batch_size = batch_size or num_games
+        games = []
+        for first_rank in range(1, num_games + 1, batch_size):
+            last_rank = min(num_games, first_rank + batch_size - 1)
+            if first_rank == 1 and last_rank == num_games:
+                prompt = f"Extract information for the top {num_games} games from this list."
+            else:
+                prompt = f"Extract information for the games ranked {first_rank} to {last_rank} in this list."
+
+            result = n.act(
+                f"{prompt} For each game, include the title, release date, genre, and rating if available.",
+                schema={"type": "array", "items": GameInfo.model_json_schema()},
+            )
 
-        if not result.matches_schema:
-            if status_update_callback:
-                status_update_callback(
-                    f"Failed to extract game information for {system}"
-                )
-            return []
+            if not result.matches_schema:
+                if status_update_callback:
+                    status_update_callback(
+                        f"Failed to extract game information for {system}"
+                    )
+                break
+
+            # Parse the results
+            batch = [GameInfo.model_validate(g) for g in result.parsed_response]
 
-        # Parse the results
-        games = [GameInfo.model_validate(g) for g in result.parsed_response]
+            # Make sure each game has the system field populated
+            for game in batch[: last_rank - first_rank + 1]:
+                game.system = system
+                games.append(game)
+                if on_game:
+                    on_game(game)
 
-        # Make sure each game has the system field populated
-        for game in games:
-            game.system = system
+            if len(batch) < last_rank - first_rank + 1:
+                break
 
         if status_update_callback:
             status_update_callback(f"Found {len(games)} games for {system}")
@@ -82,25 +359,178 @@ def find_top_games(system, num_games=5, headless=False, status_update_callback=N
         return games
 
 
+# Writes screenshots on a background thread so browser workers never wait on disk
+class ArtifactWriter:
+    """
+    Encodes screenshots to WebP with a thumbnail, hard-links identical
+    screenshots instead of storing them twice, and keeps each run and the
+    whole game_searches/ directory within a disk budget by deleting the
+    least recently used screenshots
+    """
+
+    def __init__(
+        self,
+        run_budget_mb=ARTIFACT_RUN_BUDGET_MB,
+        total_budget_mb=ARTIFACT_TOTAL_BUDGET_MB,
+    ):
+        self.run_budget = run_budget_mb * 1024 * 1024
+        self.total_budget = total_budget_mb * 1024 * 1024
+        self.queue = queue.Queue()
+        # Screenshot hash -> (image path, thumbnail path)
+        self.written = {}
+        # Image path -> (last used, size, inode); loaded on first use
+        self.files = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, game_dir, name, png_bytes):
+        """Queue a PNG screenshot to be saved as <name>.webp in game_dir"""
+        self.queue.put((game_dir, name, png_bytes))
+
+    def flush(self):
+        """Wait until every queued screenshot has been written"""
+        self.queue.join()
+
+    def run(self):
+        while True:
+            game_dir, name, png_bytes = self.queue.get()
+            try:
+                self.write(game_dir, name, png_bytes)
+            except Exception as exc:
+                print(f"Could not save screenshot {name} in {game_dir}: {exc}")
+            finally:
+                self.queue.task_done()
+
+    def write(self, game_dir, name, png_bytes):
+        if self.files is None:
+            self.files = {}
+            for path in glob.glob(os.path.join("game_searches", "*", "*", "*.webp")):
+                self.track(path)
+
+        os.makedirs(game_dir, exist_ok=True)
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        sources = self.written.get(digest)
+
+        if sources and all(os.path.exists(path) for path in sources):
+            image_path, thumb_path = self.link(sources, game_dir, name)
+        else:
+            image_path, thumb_path = self.encode(png_bytes, game_dir, name)
+            self.written[digest] = (image_path, thumb_path)
+
+        for path in (image_path, thumb_path):
+            if path:
+                self.track(path)
+
+        self.prune(os.path.dirname(game_dir), self.run_budget)
+        self.prune("game_searches", self.total_budget)
+
+    def encode(self, png_bytes, game_dir, name):
+        try:
+            from PIL import Image
+        except ImportError:
+            # Without Pillow, keep the screenshot as it came from the browser
+            image_path = os.path.join(game_dir, f"{name}.png")
+            with open(image_path, "wb") as f:
+                f.write(png_bytes)
+            return image_path, None
+
+        image = Image.open(io.BytesIO(png_bytes))
+        image_path = os.path.join(game_dir, f"{name}.webp")
+        image.save(image_path, "WEBP", quality=ARTIFACT_WEBP_QUALITY)
+
+        thumb_path = os.path.join(game_dir, f"{name}_thumb.webp")
+        image.thumbnail((ARTIFACT_THUMBNAIL_WIDTH, image.height))
+        image.save(thumb_path, "WEBP", quality=ARTIFACT_WEBP_QUALITY)
+        return image_path, thumb_path
+
+    # Reuse an identical screenshot's files; hard links cost no extra space
+    def link(self, sources, game_dir, name):
+        targets = []
+        for source in sources:
+            if not source:
+                targets.append(None)
+                continue
+            suffix = os.path.basename(source).split(".")[-1]
+            thumb = "_thumb" if source.endswith(f"_thumb.{suffix}") else ""
+            target = os.path.join(game_dir, f"{name}{thumb}.{suffix}")
+            if os.path.abspath(target) != os.path.abspath(source):
+                if os.path.exists(target):
+                    os.remove(target)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+            # Mark the shared file as recently used
+            os.utime(source)
+            targets.append(target)
+        return targets[0], targets[1]
+
+    def track(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.files.pop(path, None)
+            return
+        self.files[path] = (stat.st_mtime, stat.st_size, stat.st_ino)
+
+    # Delete least recently used screenshots under root until within budget
+    def prune(self, root, budget):
+        root = os.path.join(root, "")
+        inodes = {}
+        for path, (used, size, inode) in self.files.items():
+            if path.startswith(root):
+                paths, last_used, _ = inodes.get(inode, ([], 0, size))
+                inodes[inode] = (paths + [path], max(last_used, used), size)
+
+        # Hard-linked copies share one inode and are freed together
+        total = sum(size for _, _, size in inodes.values())
+        for paths, _, size in sorted(inodes.values(), key=lambda entry: entry[1]):
+            if total <= budget:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                self.files.pop(path, None)
+            total -= size
+
+
+def save_screenshot(screenshot, game_dir, name, artifact_writer=None):
+    if artifact_writer:
+        artifact_writer.submit(game_dir, name, screenshot)
+        return
+    with open(os.path.join(game_dir, f"{name}.png"), "wb") as f:
+        f.write(screenshot)
+
+
 # Function to search for a game on Amazon and get details
-def search_amazon_for_game(game, run_id, headless=False):
+def search_amazon_for_game(
+    game, run_id, headless=False, artifact_writer=None, browser=None
+):
     """
     Search for a game on Amazon and extract product information
+
+    Screenshots are handed to artifact_writer if given, otherwise written
+    as PNG files before continuing. A started NovaAct browser already on
+    Amazon can be passed in to skip starting a new one.
     """
     search_dir = os.path.join("game_searches", run_id)
-    game_dir = os.path.join(
-        search_dir, game.title.replace(" ", "_").replace("/", "_").replace(":", "")
-    )
+    game_dir = os.path.join(search_dir, game_dir_name(game))
     os.makedirs(game_dir, exist_ok=True)
 
-    with NovaAct(starting_page="https://www.amazon.com", headless=headless) as n:
+    # Reuse the caller's browser if given; otherwise open one for this game
+    session = (
+        contextlib.nullcontext(browser)
+        if browser is not None
+        else NovaAct(starting_page=AMAZON_URL, headless=headless)
+    )
+    with session as n:
         # Search for the game with system name for better results
         n.act(f"Search for '{game.title} {game.system}'")
 
         # Take screenshot of search results
-        screenshot = n.page.screenshot()
-        with open(os.path.join(game_dir, "amazon_search.png"), "wb") as f:
-            f.write(screenshot)
+        save_screenshot(n.page.screenshot(), game_dir, "amazon_search", artifact_writer)
 
         # Click on the most relevant result
         n.act(
@@ -108,9 +538,7 @@ def search_amazon_for_game(game, run_id, headless=False):
         )
 
         # Take screenshot of the product page
-        screenshot = n.page.screenshot()
-        with open(os.path.join(game_dir, "amazon_product.png"), "wb") as f:
-            f.write(screenshot)
+        save_screenshot(n.page.screenshot(), game_dir, "amazon_product", artifact_writer)
 
         # Extract product information
         result = n.act(
@@ -140,53 +568,323 @@ def search_amazon_for_game(game, run_id, headless=False):
         return game
 
 
-# Function to run game search
-def run_game_search(system, headless=False, max_threads=5, num_games=5):
-    # Generate a unique run ID
-    run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+# One Amazon browser per worker thread, reused across that worker's games
+class AmazonBrowsers:
+    """
+    Each worker thread keeps its own NovaAct browser (Playwright objects
+    can't be shared between threads) and searches from the page it is on.
+    Browsers are restarted after max_uses games or any error, and workers
+    call release() when they finish.
+    """
+
+    def __init__(self, headless=False, max_uses=AMAZON_BROWSER_MAX_USES):
+        self.headless = headless
+        self.max_uses = max_uses
+        self.local = threading.local()
+
+    def search(self, game, run_id, artifact_writer=None):
+        browser = self.acquire()
+        try:
+            game = search_amazon_for_game(
+                game, run_id, self.headless, artifact_writer, browser=browser
+            )
+        except Exception:
+            self.release()
+            raise
+
+        self.local.uses += 1
+        if self.local.uses >= self.max_uses:
+            self.release()
+        return game
+
+    def acquire(self):
+        browser = getattr(self.local, "browser", None)
+        if browser is None:
+            browser = NovaAct(starting_page=AMAZON_URL, headless=self.headless)
+            browser.start()
+            self.local.browser = browser
+            self.local.uses = 0
+        elif urlparse(browser.page.url).netloc.split(".")[-2:] != ["amazon", "com"]:
+            # Every Amazon page has the search box; only leave other sites
+            browser.page.goto(AMAZON_URL)
+        return browser
+
+    def release(self):
+        """Stop the calling thread's browser, if it has one"""
+        browser = getattr(self.local, "browser", None)
+        self.local.browser = None
+        if browser is not None:
+            try:
+                browser.stop()
+            except Exception as exc:
+                print(f"Could not stop Amazon browser: {exc}")
+
+
+# Directory holding a game's screenshots and checkpoint within a run; the
+# system is part of the name so multi-system runs don't share directories
+def game_dir_name(game):
+    name = f"{game.title} {game.system}"
+    return name.replace(" ", "_").replace("/", "_").replace(":", "")
+
+
+def amazon_cache_key(game):
+    return (game.title.strip().lower(), game.system.strip().lower())
+
+
+# Build the Amazon lookup cache from the game_data.json files of previous runs
+def load_amazon_cache(ttl_hours=AMAZON_CACHE_TTL_HOURS):
+    """
+    Map (title, system) to (checked_at, GameInfo) for the freshest Amazon
+    lookup made within ttl_hours. A checkpoint's mtime is when its Amazon
+    data was looked up; cache hits copy it onto the checkpoints they write.
+    """
+    newest = {}
+    if ttl_hours <= 0:
+        return newest
+
+    cutoff = time.time() - ttl_hours * 3600
+    for path in glob.glob(os.path.join("game_searches", "*", "*", "game_data.json")):
+        try:
+            modified = os.path.getmtime(path)
+            if modified < cutoff:
+                continue
+            with open(path, "r") as f:
+                game = GameInfo.model_validate_json(f.read())
+        except Exception:
+            continue
+
+        key = amazon_cache_key(game)
+        if key not in newest or newest[key][0] < modified:
+            newest[key] = (modified, game)
+
+    return newest
+
+
+# AIMD limit on concurrent Amazon browsers, shared by the lookup threads
+class AdaptiveConcurrency:
+    """
+    Grows the number of concurrent lookups by one after a window of healthy
+    ones and halves it when a lookup fails or is much slower than usual
+    """
+
+    def __init__(self, maximum, initial=ADAPTIVE_INITIAL_CONCURRENCY):
+        self.maximum = max(1, maximum)
+        self.limit = float(max(1, min(initial, self.maximum)))
+        self.baseline = None
+        self.healthy = 0
+        self.in_flight = 0
+        # Lookups started before a decrease can't cause another one
+        self.last_decrease = float("-inf")
+        self.started = time.monotonic()
+        self.history = []
+        self.reported = 0
+        self.condition = threading.Condition()
+        self.log_change("start")
+
+    # Only records the change; lookup threads call this with the condition held
+    def log_change(self, reason):
+        elapsed = round(time.monotonic() - self.started, 1)
+        self.history.append(
+            {"elapsed_seconds": elapsed, "concurrency": int(self.limit), "reason": reason}
+        )
+        print(f"Amazon concurrency {int(self.limit)} ({reason}) at {elapsed}s")
+
+    def pop_changes(self):
+        """Changes since the last call, for the coordinating thread to report"""
+        with self.condition:
+            changes = self.history[self.reported :]
+            self.reported = len(self.history)
+            return changes
+
+    # Wait for a free slot; returns the start time to pass to release()
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started_at, failed):
+        latency = time.monotonic() - started_at
+        with self.condition:
+            self.in_flight -= 1
+            slow = (
+                self.baseline is not None
+                and latency > self.baseline * ADAPTIVE_LATENCY_TOLERANCE
+            )
+            if failed or slow:
+                if started_at >= self.last_decrease:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.healthy = 0
+                    self.last_decrease = time.monotonic()
+                    self.log_change("failure" if failed else "slow")
+            else:
+                self.baseline = (
+                    latency
+                    if self.baseline is None
+                    else 0.8 * self.baseline + 0.2 * latency
+                )
+                self.healthy += 1
+                if self.healthy >= int(self.limit) and self.limit < self.maximum:
+                    self.limit += 1
+                    self.healthy = 0
+                    self.log_change("healthy")
+            self.condition.notify_all()
+
+
+# Amazon lookup that reuses this run's checkpoints and the cross-run cache
+def make_game_lookup(
+    run_id,
+    headless=False,
+    cache=None,
+    concurrency=None,
+    artifact_writer=None,
+    browsers=None,
+):
+    """
+    Returns lookup(game) -> (game, source), where source is "checkpoint",
+    "cache" or "amazon". Live Amazon lookups wait for a slot from the
+    concurrency controller if one is given, and use the worker's browser
+    from browsers (AmazonBrowsers) instead of starting one per game.
+    """
+
+    def search_amazon(game):
+        if browsers:
+            return browsers.search(game, run_id, artifact_writer)
+        return search_amazon_for_game(game, run_id, headless, artifact_writer)
 
-    # Create run directory
     search_dir = os.path.join("game_searches", run_id)
-    os.makedirs(search_dir, exist_ok=True)
+    cache = cache or {}
 
-    # Save search parameters
-    search_params = {
-        "system": system,
-        "num_games": num_games,
-        "max_threads": max_threads,
-    }
+    def lookup(game):
+        checkpoint = os.path.join(search_dir, game_dir_name(game), "game_data.json")
 
-    metadata = {
-        "run_id": run_id,
-        "timestamp": datetime.now().isoformat(),
-        "search_params": search_params,
-    }
+        # Games already completed in this run (resumed runs)
+        if os.path.exists(checkpoint):
+            try:
+                with open(checkpoint, "r") as f:
+                    return GameInfo.model_validate_json(f.read()), "checkpoint"
+            except Exception:
+                pass
+
+        # Fresh results from a previous run; keep this run's GameFAQs data
+        if amazon_cache_key(game) in cache:
+            checked_at, cached = cache[amazon_cache_key(game)]
+            game = game.model_copy(
+                update={field: getattr(cached, field) for field in AMAZON_FIELDS}
+            )
+            os.makedirs(os.path.dirname(checkpoint), exist_ok=True)
+            with open(checkpoint, "w") as f:
+                f.write(game.model_dump_json(indent=2))
+            # Keep the original lookup time so reuse doesn't extend the TTL
+            os.utime(checkpoint, (checked_at, checked_at))
+            return game, "cache"
+
+        if concurrency is None:
+            return search_amazon(game), "amazon"
+
+        # Lookups that come back without a price count as failures too
+        started_at = concurrency.acquire()
+        failed = True
+        try:
+            game = search_amazon(game)
+            failed = game.amazon_price is None
+            return game, "amazon"
+        finally:
+            concurrency.release(started_at, failed)
+
+    return lookup
+
+
+# GameFAQs listing that saves each system's games so resumed runs skip it
+def make_game_lister(run_id, headless=False, num_games=5):
+    checkpoint = os.path.join("game_searches", run_id, "top_games.json")
+    lock = threading.Lock()
+
+    def read_checkpoint():
+        try:
+            with open(checkpoint, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def list_games(system, status_update_callback=None, on_game=None, batch_size=None):
+        with lock:
+            saved = read_checkpoint().get(system)
+
+        if saved:
+            games = [GameInfo.model_validate(g) for g in saved]
+            if status_update_callback:
+                status_update_callback(
+                    f"Resuming with {len(games)} saved games for {system}"
+                )
+            for game in games:
+                if on_game:
+                    on_game(game)
+            return games
+
+        games = find_top_games(
+            system=system,
+            num_games=num_games,
+            headless=headless,
+            status_update_callback=status_update_callback,
+            on_game=on_game,
+            batch_size=batch_size,
+        )
 
-    with open(os.path.join(search_dir, "metadata.json"), "w") as f:
-        json.dump(metadata, f, indent=2)
+        if games:
+            with lock:
+                saved_games = read_checkpoint()
+                saved_games[system] = [g.model_dump() for g in games]
+                with open(checkpoint, "w") as f:
+                    json.dump(saved_games, f, indent=2)
 
-    results = {"run_id": run_id, "search_params": search_params, "games": []}
+        return games
 
-    # Status update function
-    def update_status(message):
-        status_container.info(message)
+    return list_games
 
-    # Step 1: Find top games on GameFAQs
-    update_status(f"Finding top {num_games} games for {system} on GameFAQs...")
-    progress_bar.progress(0.1)
 
-    top_games = find_top_games(
-        system=system,
-        num_games=num_games,
-        headless=headless,
-        status_update_callback=update_status,
-    )
+# Progress message for a finished lookup
+def lookup_message(game, source, done, total):
+    if source == "cache":
+        return f"Cache hit for {game.title} ({done}/{total})"
+    if source == "checkpoint":
+        return f"Resumed {game.title} from checkpoint ({done}/{total})"
+    return f"Completed Amazon research for {game.title} ({done}/{total})"
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search when its job has been cancelled"""
+
+
+def new_run_id():
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+# Research the games of each system in two stages: all GameFAQs lists first,
+# then Amazon lookups in parallel once every list is complete
+def research_games_staged(
+    systems,
+    list_games,
+    lookup,
+    max_threads,
+    num_games,
+    update_status,
+    update_progress,
+    release_worker=None,
+):
+    sources = collections.Counter()
+
+    # Step 1: Find top games on GameFAQs
+    top_games = []
+    for system in systems:
+        update_status(f"Finding top {num_games} games for {system} on GameFAQs...")
+        top_games.extend(list_games(system, status_update_callback=update_status))
 
     if not top_games:
-        update_status(f"No games found for {system}")
-        return results
+        return [], sources
 
-    progress_bar.progress(0.4)
+    update_progress(0.4)
 
     # Step 2: Search Amazon for each game in parallel
     update_status("Searching Amazon for game information in parallel...")
@@ -197,31 +895,301 @@ def run_game_search(system, headless=False, max_threads=5, num_games=5):
 
     detailed_games = []
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all Amazon search tasks
-        future_to_game = {
-            executor.submit(search_amazon_for_game, game, run_id, headless): game
-            for game in top_games
+    # Workers are plain threads so each can release its browser when done
+    game_queue = queue.Queue()
+    for game in top_games:
+        game_queue.put(game)
+    finished = queue.Queue()
+
+    def work():
+        try:
+            while True:
+                try:
+                    game = game_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    finished.put((game, lookup(game)))
+                except Exception as exc:
+                    print(f"Game {game.title} research failed: {exc}")
+                    # Fall back to original game data
+                    finished.put((game, (game, "failed")))
+        finally:
+            if release_worker:
+                release_worker()
+
+    workers = [threading.Thread(target=work, daemon=True) for _ in range(max_workers)]
+    for worker in workers:
+        worker.start()
+
+    # Collect results as they complete
+    for i in range(total_games):
+        game, (detailed_game, source) = finished.get()
+        detailed_games.append(detailed_game)
+        sources[source] += 1
+
+        # Update progress
+        update_status(lookup_message(game, source, i + 1, total_games))
+        update_progress(0.4 + (0.5 * (i + 1) / total_games))
+
+    for worker in workers:
+        worker.join()
+
+    return detailed_games, sources
+
+
+# Research games as a pipeline: GameFAQs producers push each game into a
+# bounded queue as soon as it is extracted, and a shared pool of Amazon
+# workers picks games up immediately
+def research_games_pipelined(
+    systems,
+    list_games,
+    lookup,
+    max_threads,
+    num_games,
+    update_status,
+    update_progress,
+    release_worker=None,
+):
+    max_workers = max(1, max_threads)
+    game_queue = queue.Queue(maxsize=max_workers * 2)
+
+    # Worker threads report back through events; only this thread touches the UI
+    events = queue.Queue()
+
+    def on_game(game):
+        events.put(("found", game, None))
+        game_queue.put(game)
+
+    def produce(system):
+        try:
+            list_games(
+                system,
+                status_update_callback=lambda message: events.put(
+                    ("status", message, None)
+                ),
+                on_game=on_game,
+                batch_size=PIPELINE_BATCH_SIZE,
+            )
+        except Exception as exc:
+            events.put(("status", f"GameFAQs search for {system} failed: {exc}", None))
+        finally:
+            events.put(("producer_done", system, None))
+
+    def consume():
+        try:
+            while True:
+                game = game_queue.get()
+                if game is None:
+                    return
+                try:
+                    events.put(("done", game, lookup(game)))
+                except Exception as exc:
+                    print(f"Game {game.title} research failed: {exc}")
+                    # Fall back to original game data
+                    events.put(("done", game, (game, "failed")))
+        finally:
+            if release_worker:
+                release_worker()
+
+    producers = [
+        threading.Thread(target=produce, args=(system,), daemon=True)
+        for system in systems
+    ]
+    consumers = [
+        threading.Thread(target=consume, daemon=True) for _ in range(max_workers)
+    ]
+    for thread in producers + consumers:
+        thread.start()
+
+    expected_games = num_games * len(systems)
+    producers_running = len(systems)
+    found = 0
+    detailed_games = []
+    sources = collections.Counter()
+
+    while producers_running or len(detailed_games) < found:
+        kind, item, detailed_game = events.get()
+        if kind == "status":
+            update_status(item)
+        elif kind == "found":
+            found += 1
+        elif kind == "producer_done":
+            producers_running -= 1
+            if not producers_running:
+                expected_games = found
+                # Every game is queued; let the workers exit once the queue drains
+                for _ in consumers:
+                    game_queue.put(None)
+        elif kind == "done":
+            detailed_game, source = detailed_game
+            detailed_games.append(detailed_game)
+            sources[source] += 1
+            update_status(
+                lookup_message(item, source, len(detailed_games), max(found, 1))
+            )
+            update_progress(0.1 + 0.85 * len(detailed_games) / max(expected_games, 1))
+
+    for thread in consumers:
+        thread.join()
+
+    return detailed_games, sources
+
+
+# Function to run game search
+def run_game_search(
+    systems,
+    headless=False,
+    max_threads=5,
+    num_games=5,
+    pipelined=True,
+    cache_ttl_hours=AMAZON_CACHE_TTL_HOURS,
+    adaptive=True,
+    reuse_browsers=True,
+    resume_run_id=None,
+    run_id=None,
+    update_status=None,
+    update_progress=None,
+    cancel_event=None,
+    artifact_writer=None,
+):
+    """
+    Research the top games of each system and save them under game_searches/
+
+    Progress is reported through update_status(message) and
+    update_progress(fraction). Setting cancel_event stops the search at the
+    next game and raises SearchCancelled, leaving the run resumable. With
+    adaptive, max_threads is the upper bound for an AIMD concurrency limit.
+    Screenshots go through artifact_writer when one is given. With
+    reuse_browsers, each Amazon worker keeps one browser for the whole run.
+    """
+    if isinstance(systems, str):
+        systems = [systems]
+
+    update_status = update_status or print
+    update_progress = update_progress or (lambda fraction: None)
+
+    def check_cancelled():
+        if cancel_event is not None and cancel_event.is_set():
+            raise SearchCancelled(run_id)
+
+    if resume_run_id:
+        # Continue an interrupted run with its original parameters
+        run_id = resume_run_id
+        search_dir = os.path.join("game_searches", run_id)
+        try:
+            with open(os.path.join(search_dir, "metadata.json"), "r") as f:
+                metadata = json.load(f)
+            search_params = metadata["search_params"]
+        except (OSError, ValueError, KeyError):
+            update_status(f"Cannot resume {run_id}: metadata.json is missing")
+            return {"run_id": run_id, "search_params": {}, "games": []}
+
+        systems = search_params.get("systems") or [search_params["system"]]
+        num_games = search_params.get("num_games", num_games)
+    else:
+        # Generate a unique run ID
+        run_id = run_id or new_run_id()
+
+        # Create run directory
+        search_dir = os.path.join("game_searches", run_id)
+        os.makedirs(search_dir, exist_ok=True)
+
+        # Save search parameters
+        search_params = {
+            "system": ", ".join(systems),
+            "systems": systems,
+            "num_games": num_games,
+            "max_threads": max_threads,
+            "pipelined": pipelined,
+            "adaptive": adaptive,
+            "reuse_browsers": reuse_browsers,
+        }
+
+        metadata = {
+            "run_id": run_id,
+            "timestamp": datetime.now().isoformat(),
+            "search_params": search_params,
         }
 
-        # Collect results as they complete
-        for i, future in enumerate(
-            concurrent.futures.as_completed(future_to_game.keys())
-        ):
-            game = future_to_game[future]
-            try:
-                detailed_game = future.result()
-                detailed_games.append(detailed_game)
+        with open(os.path.join(search_dir, "metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+        record_run(run_id, metadata)
 
-                # Update progress
+    results = {
+        "run_id": run_id,
+        "search_params": search_params,
+        "games": [],
+        "lookup_sources": {},
+    }
+
+    update_status(f"Finding top {num_games} games for {search_params['system']} on GameFAQs...")
+    update_progress(0.1)
+
+    game_lister = make_game_lister(run_id, headless=headless, num_games=num_games)
+    browsers = AmazonBrowsers(headless=headless) if reuse_browsers else None
+
+    concurrency = None
+    if adaptive:
+        concurrency = AdaptiveConcurrency(max_threads)
+
+    game_lookup = make_game_lookup(
+        run_id,
+        headless=headless,
+        cache=load_amazon_cache(cache_ttl_hours),
+        concurrency=concurrency,
+        artifact_writer=artifact_writer,
+        browsers=browsers,
+    )
+
+    # Both stages check for cancellation before starting more browser work
+    def list_games(system, on_game=None, **kwargs):
+        def checked_on_game(game):
+            check_cancelled()
+            if on_game:
+                on_game(game)
+
+        check_cancelled()
+        return game_lister(system, on_game=checked_on_game, **kwargs)
+
+    def lookup(game):
+        check_cancelled()
+        return game_lookup(game)
+
+    # Status is only written from this (the coordinating) thread; concurrency
+    # changes made on lookup threads are reported with the next update
+    def report_status(message):
+        if concurrency:
+            for change in concurrency.pop_changes():
                 update_status(
-                    f"Completed Amazon research for {game.title} ({i+1}/{total_games})"
+                    f"Amazon concurrency set to {change['concurrency']} "
+                    f"({change['reason']})"
                 )
-                progress_bar.progress(0.4 + (0.5 * (i + 1) / total_games))
-            except Exception as exc:
-                print(f"Game {game.title} research failed: {exc}")
-                # Fall back to original game data
-                detailed_games.append(game)
+        update_status(message)
+
+    research = research_games_pipelined if pipelined else research_games_staged
+    detailed_games, sources = research(
+        systems,
+        list_games,
+        lookup,
+        max_threads,
+        num_games,
+        report_status,
+        update_progress,
+        release_worker=browsers.release if browsers else None,
+    )
+    results["lookup_sources"] = dict(sources)
+
+    # Games skipped after a cancel must not be saved as a finished run
+    check_cancelled()
+
+    if artifact_writer:
+        update_status("Saving screenshots...")
+        artifact_writer.flush()
+
+    if not detailed_games:
+        update_status(f"No games found for {search_params['system']}")
+        return results
 
     # Save the results
     results["games"] = detailed_games
@@ -232,16 +1200,159 @@ def run_game_search(system, headless=False, max_threads=5, num_games=5):
             "search_params": search_params,
             "games": [g.model_dump() for g in detailed_games],
         }
+        if concurrency:
+            results_json["concurrency_history"] = concurrency.history
         json.dump(results_json, f, indent=2)
+    mark_run_complete(run_id)
+
+    try:
+        # Use the run's start time, as backfill does, so a resumed run lands in
+        # the same month partition and replaces its earlier rows
+        append_price_history(run_id, detailed_games, metadata.get("timestamp"))
+    except Exception as exc:
+        print(f"Could not update price history for {run_id}: {exc}")
 
     update_status("Game search complete!")
-    progress_bar.progress(1.0)
+    update_progress(1.0)
 
     return results
 
 
-# Function to load previous search data
-def load_search_data(run_id):
+# Open the run manifest, creating its schema on first use
+def manifest_connection():
+    conn = sqlite3.connect(MANIFEST_PATH, timeout=30)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            display TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            complete INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_by_timestamp ON runs (timestamp)")
+    return conn
+
+
+# Create a display name with timestamp and system
+def search_display_name(run_id, metadata):
+    if not metadata:
+        return run_id
+    timestamp = metadata.get("timestamp", "").split("T")[0]
+    search_params = metadata.get("search_params", {})
+    system = search_params.get("system", "Unknown")
+    num_games = search_params.get("num_games", 5)
+    return f"{timestamp} - {system} (Top {num_games}) ({run_id})"
+
+
+# Add or replace a run in the manifest
+def record_run(run_id, metadata, complete=False, conn=None):
+    owned = conn is None
+    conn = conn or manifest_connection()
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    metadata.get("timestamp", ""),
+                    search_display_name(run_id, metadata),
+                    json.dumps(metadata),
+                    int(complete),
+                ),
+            )
+    finally:
+        if owned:
+            conn.close()
+
+
+# Flag a run as complete once its results.json is written
+def mark_run_complete(run_id):
+    conn = manifest_connection()
+    try:
+        with conn:
+            conn.execute("UPDATE runs SET complete = 1 WHERE run_id = ?", (run_id,))
+    finally:
+        conn.close()
+
+
+# Bring the manifest in line with game_searches/: index runs it doesn't know
+# (e.g. written before the manifest existed) and drop deleted ones
+def sync_manifest():
+    on_disk = {
+        run_id
+        for run_id in os.listdir("game_searches")
+        if os.path.isdir(os.path.join("game_searches", run_id))
+        and os.path.exists(os.path.join("game_searches", run_id, "metadata.json"))
+    }
+
+    conn = manifest_connection()
+    try:
+        known = dict(conn.execute("SELECT run_id, complete FROM runs"))
+
+        for run_id in on_disk - known.keys():
+            try:
+                with open(os.path.join("game_searches", run_id, "metadata.json")) as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                metadata = {}
+            complete = os.path.exists(
+                os.path.join("game_searches", run_id, "results.json")
+            )
+            record_run(run_id, metadata, complete=complete, conn=conn)
+
+        with conn:
+            for run_id in known.keys() - on_disk:
+                conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+            # Runs that finished writing results.json but weren't flagged
+            for run_id, complete in known.items():
+                if not complete and os.path.exists(
+                    os.path.join("game_searches", run_id, "results.json")
+                ):
+                    conn.execute(
+                        "UPDATE runs SET complete = 1 WHERE run_id = ?", (run_id,)
+                    )
+    finally:
+        conn.close()
+
+
+def file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+# Cached on the directory and manifest mtimes, so reruns skip the manifest
+@st.cache_data(show_spinner=False)
+def list_searches(searches_mtime, manifest_mtime):
+    sync_manifest()
+    conn = manifest_connection()
+    try:
+        rows = conn.execute(
+            "SELECT run_id, display, metadata, complete FROM runs "
+            "ORDER BY timestamp DESC"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "id": run_id,
+            "display": display,
+            "metadata": json.loads(metadata),
+            "complete": bool(complete),
+        }
+        for run_id, display, metadata, complete in rows
+    ]
+
+
+# Cached on the results.json mtime; returns raw JSON so no models are pickled
+@st.cache_data(show_spinner=False)
+def read_search_data(run_id, results_mtime):
     search_dir = os.path.join("game_searches", run_id)
 
     # Load metadata
@@ -255,49 +1366,391 @@ def load_search_data(run_id):
     try:
         with open(os.path.join(search_dir, "results.json"), "r") as f:
             results_json = json.load(f)
-            results = {"run_id": run_id}
-            results["games"] = [
-                GameInfo.model_validate(g) for g in results_json["games"]
+            # Validate once here; cache hits only rebuild the models
+            games = [
+                GameInfo.model_validate(g).model_dump() for g in results_json["games"]
             ]
-            results["search_params"] = results_json["search_params"]
+            results = {
+                "run_id": run_id,
+                "games": games,
+                "search_params": results_json["search_params"],
+            }
     except:
         return None, metadata
 
     return results, metadata
 
 
+# Function to load previous search data
+def load_search_data(run_id):
+    results_mtime = file_mtime(os.path.join("game_searches", run_id, "results.json"))
+    results, metadata = read_search_data(run_id, results_mtime)
+    if results:
+        results = dict(results)
+        results["games"] = [GameInfo.model_construct(**g) for g in results["games"]]
+    return results, metadata
+
+
 # Function to get available search IDs
 def get_available_searches():
-    searches = []
-    if os.path.exists("game_searches"):
-        for run_id in os.listdir("game_searches"):
-            search_dir = os.path.join("game_searches", run_id)
-            if os.path.isdir(search_dir) and os.path.exists(
-                os.path.join(search_dir, "metadata.json")
-            ):
-                try:
-                    with open(os.path.join(search_dir, "metadata.json"), "r") as f:
-                        metadata = json.load(f)
+    return list_searches(file_mtime("game_searches"), file_mtime(MANIFEST_PATH))
+
+
+# Function to get runs that never wrote results.json (e.g. after a crash)
+def get_incomplete_searches():
+    runner = get_job_runner()
+    return [
+        search
+        for search in get_available_searches()
+        if not search["complete"] and not runner.is_active(search["id"])
+    ]
+
+
+# Normalized price rows for a run's games
+def price_history_rows(run_id, games, timestamp=None):
+    run_time = pd.Timestamp(timestamp or datetime.now())
+    df = pd.DataFrame(
+        [
+            {
+                "title": game.title,
+                "system": game.system,
+                "price_text": game.amazon_price,
+                "rating": game.rating,
+            }
+            for game in games
+        ],
+        columns=["title", "system", "price_text", "rating"],
+    )
 
-                    # Create a display name with timestamp and system
-                    timestamp = metadata.get("timestamp", "").split("T")[0]
-                    search_params = metadata.get("search_params", {})
-                    system = search_params.get("system", "Unknown")
-                    num_games = search_params.get("num_games", 5)
+    # "$1,299.99", "59.99 USD", "$49.99 - $59.99" -> first number
+    df["price"] = pd.to_numeric(
+        df["price_text"]
+        .astype("string")
+        .str.extract(r"(\d[\d,]*(?:\.\d+)?)", expand=False)
+        .str.replace(",", "", regex=False),
+        errors="coerce",
+    )
+    df["rating"] = pd.to_numeric(df["rating"], errors="coerce")
+    df["run_id"] = run_id
+    df["run_timestamp"] = run_time
+    df["month"] = run_time.strftime("%Y-%m")
+    return df
+
+
+# Append a run to the price history dataset; rewriting a run replaces its files
+def append_price_history(run_id, games, timestamp=None):
+    df = price_history_rows(run_id, games, timestamp)
+    if df.empty:
+        return
+
+    df.to_parquet(
+        PRICE_HISTORY_DIR,
+        engine="pyarrow",
+        partition_cols=["system", "month"],
+        index=False,
+        basename_template=f"{run_id}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
 
-                    display_name = (
-                        f"{timestamp} - {system} (Top {num_games}) ({run_id})"
-                    )
+    # Files starting with "_" are ignored by readers; the mtime keys the cache
+    with open(PRICE_HISTORY_MARKER, "w") as f:
+        f.write(run_id)
+
+
+# Add every complete run that predates the price history dataset
+def backfill_price_history():
+    count = 0
+    for search in get_available_searches():
+        if not search["complete"]:
+            continue
+        results, metadata = load_search_data(search["id"])
+        if results and results["games"]:
+            append_price_history(
+                search["id"], results["games"], metadata.get("timestamp")
+            )
+            count += 1
+    return count
 
-                    searches.append(
-                        {"id": run_id, "display": display_name, "metadata": metadata}
-                    )
-                except:
-                    searches.append({"id": run_id, "display": run_id, "metadata": {}})
 
-    # Sort by timestamp (newest first)
-    searches.sort(key=lambda x: x["metadata"].get("timestamp", ""), reverse=True)
-    return searches
+@st.cache_data(show_spinner=False)
+def load_price_history(marker_mtime):
+    if marker_mtime is None:
+        return pd.DataFrame()
+    df = pd.read_parquet(PRICE_HISTORY_DIR, engine="pyarrow")
+    # Partition columns come back as categoricals
+    df["system"] = df["system"].astype(str)
+    df["month"] = df["month"].astype(str)
+    return df.sort_values("run_timestamp")
+
+
+# Maximum number of game searches running at once in this server process
+MAX_CONCURRENT_SEARCHES = 2
+
+# How often the search jobs panel polls for progress, in seconds
+JOB_POLL_INTERVAL = 2
+
+# Most runs listed in the search jobs panel
+JOB_PANEL_RUNS = 10
+
+
+# Progress of a run, persisted so it survives page reloads and restarts
+def progress_path(run_id):
+    return os.path.join("game_searches", run_id, "progress.json")
+
+
+def read_progress(run_id):
+    try:
+        with open(progress_path(run_id), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Job threads and the UI thread (cancel) both update progress files
+progress_lock = threading.Lock()
+
+
+def write_progress(run_id, **fields):
+    with progress_lock:
+        progress = read_progress(run_id)
+        progress.update(fields, run_id=run_id, updated_at=datetime.now().isoformat())
+
+        # Write then rename so pollers never see a partial file
+        path = progress_path(run_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            json.dump(progress, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+
+class SearchJobRunner:
+    """Runs game searches on a bounded pool of background threads"""
+
+    def __init__(self, max_workers=MAX_CONCURRENT_SEARCHES):
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="game-search"
+        )
+        self.cancel_events = {}
+        self.submitted = []
+        self.lock = threading.Lock()
+        self.artifact_writer = ArtifactWriter()
+
+    def submit(self, systems, resume_run_id=None, **options):
+        """Queue a search and return its run ID"""
+        run_id = resume_run_id or new_run_id()
+        cancel_event = threading.Event()
+
+        with self.lock:
+            if run_id in self.cancel_events:
+                return run_id
+            self.cancel_events[run_id] = cancel_event
+            self.submitted.append(run_id)
+
+        # Resumed runs keep the label of their original search
+        label = ", ".join(systems) if isinstance(systems, list) else systems
+        label = read_progress(run_id).get("system", label) if resume_run_id else label
+        write_progress(
+            run_id,
+            status="queued",
+            system=label,
+            progress=0.0,
+            message="Waiting for a free worker...",
+            submitted_at=datetime.now().isoformat(),
+        )
+        self.executor.submit(
+            self.run, run_id, systems, resume_run_id, options, cancel_event
+        )
+        return run_id
+
+    def run(self, run_id, systems, resume_run_id, options, cancel_event):
+        if cancel_event.is_set():
+            write_progress(
+                run_id, status="cancelled", message="Cancelled before it started"
+            )
+            self.finish(run_id)
+            return
+
+        start_time = time.time()
+        write_progress(run_id, status="running", message="Starting search...")
+        try:
+            results = run_game_search(
+                systems,
+                resume_run_id=resume_run_id,
+                run_id=run_id,
+                update_status=lambda message: write_progress(run_id, message=message),
+                update_progress=lambda fraction: write_progress(
+                    run_id, progress=fraction
+                ),
+                cancel_event=cancel_event,
+                artifact_writer=self.artifact_writer,
+                **options,
+            )
+            write_progress(
+                run_id,
+                status="complete" if results["games"] else "failed",
+                progress=1.0,
+                system=results["search_params"].get("system", ""),
+                num_games=len(results["games"]),
+                lookup_sources=results.get("lookup_sources", {}),
+                elapsed=round(time.time() - start_time, 1),
+            )
+        except SearchCancelled:
+            write_progress(
+                run_id,
+                status="cancelled",
+                message="Cancelled; completed games are kept and the run can be resumed",
+            )
+        except Exception as exc:
+            print(f"Game search {run_id} failed: {exc}")
+            write_progress(run_id, status="failed", message=f"Search failed: {exc}")
+        finally:
+            self.finish(run_id)
+
+    def finish(self, run_id):
+        with self.lock:
+            self.cancel_events.pop(run_id, None)
+
+    def cancel(self, run_id):
+        with self.lock:
+            cancel_event = self.cancel_events.get(run_id)
+        if cancel_event:
+            cancel_event.set()
+            write_progress(run_id, message="Cancelling after the current step...")
+
+    def is_active(self, run_id):
+        with self.lock:
+            return run_id in self.cancel_events
+
+    def recent_runs(self, limit=JOB_PANEL_RUNS):
+        with self.lock:
+            return list(reversed(self.submitted[-limit:]))
+
+
+# One runner per server process, shared by every browser session and rerun
+@st.cache_resource
+def get_job_runner():
+    return SearchJobRunner(MAX_CONCURRENT_SEARCHES)
+
+
+# Show a table of games followed by per-game details
+def display_games(games):
+    st.subheader("Top Games")
+
+    # Convert to DataFrame for display
+    df = pd.DataFrame(
+        [
+            {
+                "Title": game.title,
+                "Genre": game.genre or "Unknown",
+                "Release Date": game.release_date or "Unknown",
+                "Rating": game.rating or "N/A",
+                "Price": game.amazon_price or "N/A",
+                "Amazon Link": game.amazon_url or "Not Found",
+            }
+            for game in games
+        ]
+    )
+
+    # Display the table
+    st.dataframe(df, use_container_width=True)
+
+    # Display detailed game information
+    st.subheader("Game Details")
+    for game in games:
+        with st.expander(f"{game.title} - Details"):
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                st.markdown(f"**Title:** {game.title}")
+                st.markdown(f"**System:** {game.system}")
+                if game.release_date:
+                    st.markdown(f"**Release Date:** {game.release_date}")
+                if game.genre:
+                    st.markdown(f"**Genre:** {game.genre}")
+                if game.developer:
+                    st.markdown(f"**Developer:** {game.developer}")
+                if game.rating:
+                    st.markdown(f"**Rating:** {game.rating}")
+
+                st.markdown("### Description")
+                if game.description:
+                    st.markdown(game.description)
+                else:
+                    st.markdown("_No description available_")
+
+            with col2:
+                if game.amazon_price:
+                    st.markdown(f"**Price:** {game.amazon_price}")
+                if game.amazon_url:
+                    st.markdown(f"[View on Amazon]({game.amazon_url})")
+
+
+# Polls the persisted progress of recent searches
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def show_search_jobs():
+    runner = get_job_runner()
+
+    # Unfinished runs come from the manifest, so runs interrupted by a server
+    # restart stay listed alongside this process's jobs
+    unfinished = {
+        search["id"]: search
+        for search in get_available_searches()
+        if not search["complete"]
+    }
+    run_ids = list(dict.fromkeys(runner.recent_runs() + list(unfinished)))
+    run_ids = run_ids[:JOB_PANEL_RUNS]
+
+    if not run_ids:
+        st.info(
+            "No searches yet. Configure a search in the sidebar and press Search Games."
+        )
+        return
+
+    for run_id in run_ids:
+        progress = read_progress(run_id)
+        status = progress.get("status", "queued")
+
+        # Runs left "running" by a previous server process were interrupted
+        if status in ("queued", "running") and not runner.is_active(run_id):
+            status = "interrupted"
+
+        label = progress.get("system") or (
+            unfinished[run_id]["metadata"].get("search_params", {}).get("system", "")
+            if run_id in unfinished
+            else ""
+        )
+
+        with st.container(border=True):
+            st.markdown(f"**{label}** `{run_id}` ({status})")
+            st.progress(
+                min(max(progress.get("progress", 0.0), 0.0), 1.0),
+                text=progress.get("message", ""),
+            )
+
+            if runner.is_active(run_id):
+                if st.button("Cancel", key=f"cancel_{run_id}"):
+                    runner.cancel(run_id)
+            elif status == "interrupted":
+                st.caption(
+                    "This run stopped before it finished. Pick it under "
+                    "Resume Run in the sidebar to continue it."
+                )
+            elif status == "complete":
+                sources = progress.get("lookup_sources", {})
+                st.success(
+                    f"Search completed in {progress.get('elapsed', 0):.1f} seconds "
+                    "(would take ~15-30 minutes manually)"
+                )
+                st.caption(
+                    f"Amazon lookups: {sources.get('amazon', 0)} live, "
+                    f"{sources.get('cache', 0)} from cache, "
+                    f"{sources.get('checkpoint', 0)} resumed from checkpoints. "
+                    f"Data saved to game_searches/{run_id}/"
+                )
+                search_data, _ = load_search_data(run_id)
+                if search_data and search_data["games"]:
+                    if st.toggle("Show results", key=f"results_{run_id}"):
+                        display_games(search_data["games"])
 
 
 # App layout
@@ -306,15 +1759,15 @@ st.title("Video Game Research Tool")
 st.subheader("Find Top Games and Amazon Information")
 
 # Create two main tabs - one for new search and one for browsing past searches
-main_tabs = st.tabs(["New Search", "Browse Previous Searches"])
+main_tabs = st.tabs(["New Search", "Browse Previous Searches", "Price History"])
 
 with main_tabs[0]:  # New Search tab
     # Sidebar for inputs
     with st.sidebar:
         st.header("Search Parameters")
 
-        system = st.selectbox(
-            "Gaming System",
+        systems = st.multiselect(
+            "Gaming Systems",
             [
                 "PlayStation 5",
                 "PlayStation 4",
@@ -322,7 +1775,8 @@ with main_tabs[0]:  # New Search tab
                 "Nintendo Switch",
                 "PC",
             ],
-            key="new_system",
+            default=["PlayStation 5"],
+            key="new_systems",
         )
 
         num_games = st.slider(
@@ -339,22 +1793,70 @@ with main_tabs[0]:  # New Search tab
             key="max_threads",
         )
 
-        search_button = st.button(
-            "Search Games", type="primary", key="new_search_button"
+        adaptive = st.checkbox(
+            "Adaptive Concurrency",
+            value=True,
+            help="Start with fewer Amazon browsers and add more while lookups stay fast and successful, up to Max Parallel Searches",
+            key="adaptive",
+        )
+
+        reuse_browsers = st.checkbox(
+            "Reuse Amazon Browsers",
+            value=True,
+            help=f"Each parallel search keeps one browser for up to {AMAZON_BROWSER_MAX_USES} games instead of starting a new one per game",
+            key="reuse_browsers",
+        )
+
+        cache_ttl_hours = st.number_input(
+            "Amazon Cache TTL (hours)",
+            min_value=0,
+            value=AMAZON_CACHE_TTL_HOURS,
+            help="Reuse Amazon results from previous runs this recent; 0 disables the cache",
+            key="cache_ttl_hours",
+        )
+
+        incomplete_searches = {
+            search["display"]: search["id"] for search in get_incomplete_searches()
+        }
+        resume_display = st.selectbox(
+            "Resume Run",
+            ["Start a new run"] + list(incomplete_searches),
+            help="Continue an interrupted run, skipping games that already have checkpoints",
+            key="resume_run",
+        )
+        resume_run_id = incomplete_searches.get(resume_display)
+
+        pipelined = st.checkbox(
+            "Pipelined Research",
+            value=True,
+            help="Start Amazon lookups as soon as each game is found instead of waiting for the full list",
+            key="pipelined",
         )
 
-    # Search workflow row
-    st.header("Search Workflow")
-    workflow_container = st.container()
-    with workflow_container:
-        status_container = st.empty()
-        progress_bar = st.progress(0)
+        search_button = st.button(
+            "Search Games",
+            type="primary",
+            key="new_search_button",
+            disabled=not (systems or resume_run_id),
+        )
 
-    # Create a separator
-    st.divider()
+    # Queue the search; it runs in the background while the page polls
+    if search_button:
+        get_job_runner().submit(
+            systems,
+            resume_run_id=resume_run_id,
+            headless=headless,
+            max_threads=max_threads,
+            num_games=num_games,
+            pipelined=pipelined,
+            adaptive=adaptive,
+            reuse_browsers=reuse_browsers,
+            cache_ttl_hours=cache_ttl_hours,
+        )
 
-    # Results container
-    results_container = st.container()
+    # Background searches and their progress
+    st.header("Search Jobs")
+    show_search_jobs()
 
 with main_tabs[1]:  # Browse Previous Searches tab
     # Get and display available searches
@@ -394,138 +1896,75 @@ with main_tabs[1]:  # Browse Previous Searches tab
 
             # Display the games table
             if "games" in search_data and search_data["games"]:
-                st.subheader("Top Games")
-
-                # Convert to DataFrame for display
-                df = pd.DataFrame(
-                    [
-                        {
-                            "Title": game.title,
-                            "Genre": game.genre or "Unknown",
-                            "Release Date": game.release_date or "Unknown",
-                            "Rating": game.rating or "N/A",
-                            "Price": game.amazon_price or "N/A",
-                            "Amazon Link": game.amazon_url or "Not Found",
-                        }
-                        for game in search_data["games"]
-                    ]
-                )
-
-                # Display the table
-                st.dataframe(df, use_container_width=True)
-
-                # Display detailed game information
-                st.subheader("Game Details")
-                for game in search_data["games"]:
-                    with st.expander(f"{game.title} - Details"):
-                        col1, col2 = st.columns([2, 1])
-
-                        with col1:
-                            st.markdown(f"**Title:** {game.title}")
-                            st.markdown(f"**System:** {game.system}")
-                            if game.release_date:
-                                st.markdown(f"**Release Date:** {game.release_date}")
-                            if game.genre:
-                                st.markdown(f"**Genre:** {game.genre}")
-                            if game.developer:
-                                st.markdown(f"**Developer:** {game.developer}")
-                            if game.rating:
-                                st.markdown(f"**Rating:** {game.rating}")
-
-                            st.markdown("### Description")
-                            if game.description:
-                                st.markdown(game.description)
-                            else:
-                                st.markdown("_No description available_")
-
-                        with col2:
-                            if game.amazon_price:
-                                st.markdown(f"**Price:** {game.amazon_price}")
-                            if game.amazon_url:
-                                st.markdown(f"[View on Amazon]({game.amazon_url})")
+                display_games(search_data["games"])
 
         else:
             st.error(
                 "Could not load search data. The search directory may be corrupted or incomplete."
             )
 
-# Run the search when button is clicked
-if search_button:
-    start_time = time.time()
+with main_tabs[2]:  # Price History tab
+    history = load_price_history(file_mtime(PRICE_HISTORY_MARKER))
 
-    with st.spinner(f"Searching for top games for {system}..."):
-        results = run_game_search(
-            system, headless=headless, max_threads=max_threads, num_games=num_games
-        )
+    if st.button("Import Previous Searches", key="backfill_price_history"):
+        with st.spinner("Importing previous searches..."):
+            imported = backfill_price_history()
+        st.success(f"Imported {imported} searches into the price history")
+        history = load_price_history(file_mtime(PRICE_HISTORY_MARKER))
 
-    end_time = time.time()
-
-    # Display results
-    with results_container:
-        st.header("Search Results")
-
-        if "games" in results and results["games"]:
-            games = results["games"]
-
-            # Convert to DataFrame for display
-            df = pd.DataFrame(
-                [
-                    {
-                        "Title": game.title,
-                        "Genre": game.genre or "Unknown",
-                        "Release Date": game.release_date or "Unknown",
-                        "Rating": game.rating or "N/A",
-                        "Price": game.amazon_price or "N/A",
-                        "Amazon Link": game.amazon_url or "Not Found",
-                    }
-                    for game in games
-                ]
+    if history.empty:
+        st.info("No price history yet. Run a search or import previous searches.")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            history_systems = st.multiselect(
+                "Systems",
+                sorted(history["system"].unique()),
+                default=sorted(history["system"].unique()),
+                key="history_systems",
+            )
+        history = history[history["system"].isin(history_systems)]
+        with col2:
+            history_titles = st.multiselect(
+                "Games",
+                sorted(history["title"].unique()),
+                key="history_titles",
+                help="Leave empty to show every game",
             )
+        if history_titles:
+            history = history[history["title"].isin(history_titles)]
 
-            # Display the table
-            st.dataframe(df, use_container_width=True)
+        priced = history.dropna(subset=["price"])
 
-            # Display detailed game information
-            st.subheader("Game Details")
-            for game in games:
-                with st.expander(f"{game.title} - Details"):
-                    col1, col2 = st.columns([2, 1])
-
-                    with col1:
-                        st.markdown(f"**Title:** {game.title}")
-                        st.markdown(f"**System:** {game.system}")
-                        if game.release_date:
-                            st.markdown(f"**Release Date:** {game.release_date}")
-                        if game.genre:
-                            st.markdown(f"**Genre:** {game.genre}")
-                        if game.developer:
-                            st.markdown(f"**Developer:** {game.developer}")
-                        if game.rating:
-                            st.markdown(f"**Rating:** {game.rating}")
-
-                        st.markdown("### Description")
-                        if game.description:
-                            st.markdown(game.description)
-                        else:
-                            st.markdown("_No description available_")
-
-                    with col2:
-                        if game.amazon_price:
-                            st.markdown(f"**Price:** {game.amazon_price}")
-                        if game.amazon_url:
-                            st.markdown(f"[View on Amazon]({game.amazon_url})")
+        st.subheader("Price History")
+        if priced.empty:
+            st.info("No numeric prices for this selection.")
         else:
-            st.warning(f"No games found for {system}. Try another system.")
+            st.line_chart(
+                priced.pivot_table(
+                    index="run_timestamp",
+                    columns="title",
+                    values="price",
+                    aggfunc="mean",
+                )
+            )
 
-        # Display time saved and run ID
-        st.success(
-            f"Search completed in {end_time - start_time:.1f} seconds (would take ~15-30 minutes manually)"
-        )
-        st.info(f"Search Run ID: {results['run_id']}")
-
-        # Create a summary section at the bottom
-        st.divider()
-        st.subheader("Search Summary")
-        st.write(f"Completed game search for {system}")
-        st.write(f"Number of games: {num_games}")
-        st.write(f"Data saved to game_searches/{results['run_id']}/")
+            st.subheader("Average Price by Month")
+            st.bar_chart(
+                priced.pivot_table(
+                    index="month", columns="system", values="price", aggfunc="mean"
+                )
+            )
+
+            # First and latest observed price per game
+            by_game = priced.groupby(["title", "system"])["price"]
+            summary = pd.DataFrame(
+                {
+                    "First Price": by_game.first(),
+                    "Latest Price": by_game.last(),
+                    "Lowest Price": by_game.min(),
+                    "Observations": by_game.count(),
+                }
+            )
+            summary["Change"] = summary["Latest Price"] - summary["First Price"]
+            st.dataframe(summary.reset_index(), use_container_width=True)